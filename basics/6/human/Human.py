@@ -8,6 +8,10 @@ class Human:
     # A class attribute. It is shared by all instances of this class
     species = "H. sapiens"
 
+    # Where say() sends its output: None means print(), otherwise any sink
+    # from human/sinks.py, or any object with a write(line) method.
+    sink = None
+
     # Basic initializer, this is called when this class is instantiated.
     # Note that the double leading and trailing underscores denote objects
     # or attributes that are used by Python but that live in user-controlled
@@ -25,7 +29,11 @@ class Human:
 
     # An instance method. All methods take "self" as the first argument
     def say(self, msg):
-        print("{name}: {message}".format(name=self.name, message=msg))
+        line = "{name}: {message}".format(name=self.name, message=msg)
+        if self.sink is None:
+            print(line)
+        else:
+            self.sink.write(line)
 
     # Another instance method
     def sing(self):
@@ -0,0 +1,170 @@
+####################################################
+## 6.6 Output sinks
+####################################################
+
+# Human.say and Superhero.boast print one line per call. print() on a
+# terminal (or any line-buffered stream) means one write system call per
+# line, plus taking the stream's lock each time, which dominates batch jobs
+# that say millions of things.
+#
+# A sink is any object with a write(line) method. It may also have
+# write_many(lines), which boast uses to hand over all its lines at once;
+# without it, boast calls write() once per line. The sinks below also have
+# flush() and close().
+#
+# Setting Human.sink (for every human) or some_human.sink (for one) sends
+# say/boast output to the sink instead of print(). The slotted classes in
+# slotted.py have no "sink" slot, so for them only the class-level
+# SlottedHuman.sink can be set.
+#
+#   Human.sink = BufferedSink()        # stdout, written in 64 Ki-character batches
+#   ...
+#   Human.sink.flush()
+#
+# Lines still buffered when the program exits are flushed by an atexit
+# handler. It keeps every BufferedSink alive until close(), so even a sink
+# that was dropped without a flush (Human.sink = None) gets its lines out;
+# close() sinks you are done with. The handler does not run if the process
+# is killed or calls os._exit(), so call flush() (or use a with block)
+# wherever the output must be out.
+
+import atexit
+import sys
+import threading
+
+# Every BufferedSink that has not been closed, for the atexit flush.
+_open_sinks = set()
+
+
+def write_lines(sink, lines):
+    """Sends lines to sink: print() them when sink is None, else one
+    write_many() call if the sink has it, or one write() per line."""
+    if sink is None:
+        for line in lines:
+            print(line)
+    elif hasattr(sink, "write_many"):
+        sink.write_many(lines)
+    else:
+        for line in lines:
+            sink.write(line)
+
+
+@atexit.register
+def _flush_open_sinks():
+    for sink in list(_open_sinks):
+        try:
+            sink.flush()
+        except (OSError, ValueError):
+            pass  # the stream was closed (or broken) before us
+
+
+class BufferedSink:
+    """Collects lines and writes them to a stream in large batches.
+
+    A batch is written (with a single write() and flush()) once max_chars
+    characters (newlines included) have been collected, when flush() is
+    called, when the sink is closed, e.g. at the end of a with block, or at
+    program exit.
+    """
+
+    def __init__(self, stream=None, max_chars=1 << 16):
+        self.stream = stream if stream is not None else sys.stdout
+        self.max_chars = max_chars
+        self._lines = []
+        self._size = 0
+        self._lock = threading.Lock()
+        _open_sinks.add(self)
+
+    def write(self, line):
+        with self._lock:
+            self._lines.append(line)
+            self._size += len(line) + 1
+            if self._size >= self.max_chars:
+                self._write_out()
+
+    def write_many(self, lines):
+        with self._lock:
+            for line in lines:
+                self._lines.append(line)
+                self._size += len(line) + 1
+            if self._size >= self.max_chars:
+                self._write_out()
+
+    def _write_out(self):
+        if self._lines:
+            self._lines.append("")  # so the batch ends with a newline
+            self.stream.write("\n".join(self._lines))
+            self.stream.flush()
+            self._lines.clear()
+            self._size = 0
+
+    def flush(self):
+        with self._lock:
+            self._write_out()
+
+    def close(self):
+        self.flush()
+        _open_sinks.discard(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ListSink:
+    """Keeps every line in a list; handy for tests and for post-processing."""
+
+    def __init__(self):
+        self.lines = []
+
+    def write(self, line):
+        self.lines.append(line)
+
+    def write_many(self, lines):
+        self.lines.extend(lines)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class NullSink:
+    """Throws every line away, for runs where the output is not wanted."""
+
+    def write(self, line):
+        pass
+
+    def write_many(self, lines):
+        for _ in lines:
+            pass
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+if __name__ == "__main__":
+    # Run from basics/6 as: python -m human.sinks
+    from human.Human import Human
+    from human.superhero.Superhero import Superhero
+
+    tick = Superhero(name="Tick")
+    tick.sink = ListSink()           # only Tick's output is captured
+    tick.say("Spoon!")
+    tick.boast()
+    print(tick.sink.lines)
+    # => ['Tick: Spoon!', 'I wield the power of super strength!', 'I wield the power of bulletproofing!']
+
+    with BufferedSink() as Human.sink:
+        for i in range(3):
+            Human("Ian").say(i)      # nothing is printed yet...
+    # => Ian: 0
+    # => Ian: 1
+    # => Ian: 2                      ...all three lines come out in one write
+    Human.sink = None
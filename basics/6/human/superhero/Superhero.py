@@ -17,7 +17,8 @@
 # To import functions from other files use the following format
 # from "filename-without-extension" import "function-or-class"
 
-from human import Human
+from human.Human import Human
+from human.sinks import write_lines
 
 
 # Specify the parent class(es) as parameters to the class definition
@@ -56,8 +57,9 @@ class Superhero(Human):
 
     # add an additional instance method
     def boast(self):
-        for power in self.superpowers:
-            print("I wield the power of {pow}!".format(pow=power))
+        lines = ["I wield the power of {pow}!".format(pow=power) for power in self.superpowers]
+        # Human.sink, if set, takes all the lines in one call when it can.
+        write_lines(self.sink, lines)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,327 @@
+####################################################
+## 6.3 Columnar populations
+####################################################
+
+# Every Human object carries its own __dict__ holding "name" and "_age" (and
+# a Superhero adds "fictional", "movie" and "superpowers"). For a handful of
+# objects that is fine, but for millions of them most of the memory goes on
+# the dicts. A "struct of arrays" turns this around: one NumPy array per
+# attribute (a column), with row i of every column describing person i.
+#
+# Names repeat a lot in a big population, so they are stored once in an
+# intern pool and each row keeps a small integer id into it.
+#
+# Rows can still be used as ordinary objects: table[i] returns a small view
+# whose attributes read and write the table's columns, and which borrows
+# Human's (or Superhero's) age property, say(), sing() and boast() as they
+# are. The views are not Human subclasses: Human has no __slots__, so every
+# instance of a subclass would carry a __dict__ again.
+
+import sys
+
+import numpy as np
+
+from human.Human import Human
+from human.superhero.Superhero import Superhero
+
+
+class InternPool:
+    """Stores each distinct value (a name, a tuple of powers) once and hands
+    out small integer ids for it."""
+
+    def __init__(self):
+        self._values = []
+        self._ids = {}
+
+    def __len__(self):
+        return len(self._values)
+
+    def intern(self, value):
+        value_id = self._ids.get(value)
+        if value_id is None:
+            value_id = self._ids[value] = len(self._values)
+            self._values.append(sys.intern(value) if isinstance(value, str) else value)
+        return value_id
+
+    def __getitem__(self, value_id):
+        return self._values[value_id]
+
+
+class HumanRow:
+    """Row i of a HumanTable, with the attributes and methods of a Human."""
+
+    __slots__ = ("_table", "_row")
+
+    species = Human.species
+    age = Human.age
+    say = Human.say
+    sing = Human.sing
+    get_species = Human.__dict__["get_species"]
+    grunt = Human.__dict__["grunt"]
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    @property
+    def sink(self):
+        # Follows Human.sink, so output goes wherever Human's goes.
+        return Human.sink
+
+    # Human.__init__ stores "name" and "_age" as instance attributes; the row
+    # view has properties over the table's columns instead, so the borrowed
+    # age property and methods work as they are.
+    @property
+    def name(self):
+        table = self._table
+        return table.names[table.name_ids[self._row]]
+
+    @name.setter
+    def name(self, name):
+        table = self._table
+        table.name_ids[self._row] = table.names.intern(name)
+
+    @property
+    def _age(self):
+        return int(self._table.ages[self._row])
+
+    @_age.setter
+    def _age(self, age):
+        self._table.ages[self._row] = age
+
+    @_age.deleter
+    def _age(self):
+        raise AttributeError("the age of a table row cannot be deleted")
+
+    def __repr__(self):
+        return "{}({!r}, age={})".format(type(self).__name__, self.name, self.age)
+
+
+class HumanTable:
+    """A population of humans stored column by column.
+
+    Columns (NumPy arrays, one entry per row):
+        name_ids  int32 ids into the shared intern pool `names`
+        ages      int32 ages
+
+    Columns grow by doubling, so append() is amortised O(1). Vectorized
+    updates such as `table.ages[table.ages >= 18] += 1` work directly on the
+    column arrays.
+    """
+
+    row_class = HumanRow
+    age_dtype = np.int32
+
+    def __init__(self, capacity=16, names=None):
+        self.names = names if names is not None else InternPool()
+        self._size = 0
+        self._columns = {}
+        for column, dtype in self._column_dtypes().items():
+            self._columns[column] = np.zeros(capacity, dtype=dtype)
+
+    def _column_dtypes(self):
+        return {"name_ids": np.int32, "ages": self.age_dtype}
+
+    def __len__(self):
+        return self._size
+
+    def __getattr__(self, column):
+        # Columns are exposed as attributes, trimmed to the rows in use.
+        columns = self.__dict__.get("_columns")
+        if columns is None or column not in columns:
+            raise AttributeError(column)
+        return columns[column][:self._size]
+
+    def _reserve(self, extra):
+        needed = self._size + extra
+        capacity = len(self._columns["ages"])
+        if needed <= capacity:
+            return
+        capacity = max(needed, capacity * 2, 16)
+        for column, data in self._columns.items():
+            grown = np.zeros(capacity, dtype=data.dtype)
+            grown[:self._size] = data[:self._size]
+            self._columns[column] = grown
+
+    def _append_row(self, values):
+        self._reserve(1)
+        row = self._size
+        for column, value in values.items():
+            self._columns[column][row] = value
+        self._size += 1
+        return self.row_class(self, row)
+
+    def append(self, name, age=0):
+        """Adds one person and returns the row view for it."""
+        return self._append_row({"name_ids": self.names.intern(name), "ages": age})
+
+    def extend(self, names, ages=None):
+        """Adds many people at once; ages defaults to 0 like Human()."""
+        name_ids = np.fromiter((self.names.intern(n) for n in names), dtype=np.int32)
+        count = len(name_ids)
+        columns = {"name_ids": name_ids,
+                   "ages": np.zeros(count, dtype=self.age_dtype) if ages is None else ages}
+        self._extend_columns(count, columns)
+
+    def _extend_columns(self, count, columns):
+        self._reserve(count)
+        start, stop = self._size, self._size + count
+        for column, values in columns.items():
+            self._columns[column][start:stop] = values
+        self._size = stop
+
+    @classmethod
+    def from_humans(cls, humans):
+        """Builds a table from existing Human objects."""
+        table = cls()
+        for human in humans:
+            table.append(human.name, human.age)
+        return table
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self._size
+        if not 0 <= row < self._size:
+            raise IndexError("row index out of range")
+        return self.row_class(self, row)
+
+    def __iter__(self):
+        for row in range(self._size):
+            yield self.row_class(self, row)
+
+    def rows(self, mask):
+        """Yields the row views selected by a boolean mask or index array."""
+        for row in np.flatnonzero(mask) if np.asarray(mask).dtype == bool else mask:
+            yield self.row_class(self, int(row))
+
+    def filter(self, mask):
+        """Returns a new table with only the selected rows (sharing the name pool)."""
+        selected = self._empty_like()
+        columns = {column: getattr(self, column)[mask] for column in self._columns}
+        selected._extend_columns(len(columns["ages"]), columns)
+        return selected
+
+    def _empty_like(self):
+        return type(self)(capacity=0, names=self.names)
+
+    def age_between(self, low, high):
+        """Boolean mask of rows with low <= age < high."""
+        ages = self.ages
+        return (ages >= low) & (ages < high)
+
+    def grow_older(self, years=1, mask=None):
+        """Adds years to every age (or only the rows selected by mask)."""
+        if mask is None:
+            self.ages[:] += years
+        else:
+            self.ages[mask] += years
+
+
+class SuperheroRow(HumanRow):
+    """Row i of a SuperheroTable, with the attributes and methods of a Superhero."""
+
+    __slots__ = ()
+
+    species = Superhero.species
+    sing = Superhero.sing
+    boast = Superhero.boast
+
+    @property
+    def fictional(self):
+        return bool(self._table.fictional[self._row])
+
+    @fictional.setter
+    def fictional(self, value):
+        self._table.fictional[self._row] = value
+
+    @property
+    def movie(self):
+        return bool(self._table.movie[self._row])
+
+    @movie.setter
+    def movie(self, value):
+        self._table.movie[self._row] = value
+
+    @property
+    def superpowers(self):
+        table = self._table
+        return list(table.power_sets[table.power_set_ids[self._row]])
+
+    @superpowers.setter
+    def superpowers(self, powers):
+        table = self._table
+        table.power_set_ids[self._row] = table.power_sets.intern(tuple(powers))
+
+
+class SuperheroTable(HumanTable):
+    """A HumanTable with the extra Superhero columns.
+
+    fictional and movie are bool columns. Heroes usually share a few power
+    combinations, so each distinct tuple of superpowers is pooled like the
+    names and power_set_ids holds one id per row.
+    """
+
+    row_class = SuperheroRow
+
+    def __init__(self, capacity=16, names=None, power_sets=None):
+        self.power_sets = power_sets if power_sets is not None else InternPool()
+        super().__init__(capacity, names)
+
+    def _column_dtypes(self):
+        dtypes = super()._column_dtypes()
+        dtypes.update(fictional=np.bool_, movie=np.bool_, power_set_ids=np.int32)
+        return dtypes
+
+    def append(self, name, movie=False, superpowers=("super strength", "bulletproofing"),
+               age=0, fictional=True):
+        return self._append_row({
+            "name_ids": self.names.intern(name),
+            "ages": age,
+            "fictional": fictional,
+            "movie": movie,
+            "power_set_ids": self.power_sets.intern(tuple(superpowers)),
+        })
+
+    def extend(self, names, ages=None, movie=False,
+               superpowers=("super strength", "bulletproofing"), fictional=True):
+        """Adds many heroes; movie, fictional and superpowers apply to all of them."""
+        start = self._size
+        super().extend(names, ages)
+        self._columns["fictional"][start:self._size] = fictional
+        self._columns["movie"][start:self._size] = movie
+        self._columns["power_set_ids"][start:self._size] = self.power_sets.intern(tuple(superpowers))
+
+    @classmethod
+    def from_humans(cls, heroes):
+        table = cls()
+        for hero in heroes:
+            table.append(hero.name, hero.movie, hero.superpowers, hero.age, hero.fictional)
+        return table
+
+    def _empty_like(self):
+        return type(self)(capacity=0, names=self.names, power_sets=self.power_sets)
+
+
+if __name__ == "__main__":
+    people = HumanTable()
+    people.extend(["Ian", "Joel", "Ian"], ages=[42, 17, 8])
+    ian = people[0]
+    ian.say("hi")                    # => Ian: hi
+    print(hasattr(ian, "__dict__"))  # => False (a row view has no dict of its own)
+    print(ian.sing())                # => yo... yo... microphone check... one two... one two...
+
+    # Vectorized update: everyone under 18 has a birthday.
+    people.grow_older(1, mask=people.age_between(0, 18))
+    print(people.ages)               # => [42 18  9]
+    ian.age = 43                     # the age property writes through to the column
+    print(people.ages[0])            # => 43
+    print(len(people.names))         # => 2 (the name "Ian" is stored once)
+
+    heroes = SuperheroTable()
+    tick = heroes.append("Tick")
+    heroes.append("Batman", movie=True, superpowers=["Wealthy"])
+    print(tick.sing())               # => Dun, dun, DUN!
+    tick.boast()                     # => I wield the power of super strength!
+                                     # => I wield the power of bulletproofing!
+    in_movies = heroes.filter(heroes.movie)
+    print([hero.name for hero in in_movies])  # => ['Batman']
@@ -0,0 +1,209 @@
+####################################################
+## 6.5 Bitmasks and inverted indexes
+####################################################
+
+# Superhero keeps superpowers as a list, so "which heroes can fly but are not
+# wealthy?" means scanning every hero and every list. Two tricks make such
+# questions cheap:
+#
+# 1. A registry gives each distinct power a bit number. A hero's powers then
+#    fit in one int: bit k is set if the hero has power k. Testing powers is
+#    a single "&" instead of list membership checks.
+#
+# 2. An inverted index flips the table around: for each power, an int whose
+#    bit i is set if hero i has that power. Python ints can be millions of
+#    bits long and &, |, ~ on them run in C, so
+#        flight & ~wealthy
+#    answers the question above for every hero at once.
+
+import numpy as np
+
+from human.superhero.Superhero import Superhero
+
+
+class PowerRegistry:
+    """Interns power names and gives each one a bit number."""
+
+    def __init__(self):
+        self._bits = {}
+        self._names = []
+
+    def __len__(self):
+        return len(self._names)
+
+    def bit(self, power, create=True):
+        """Returns the bit number of power (None if unknown and create is False)."""
+        bit = self._bits.get(power)
+        if bit is None and create:
+            bit = self._bits[power] = len(self._names)
+            self._names.append(power)
+        return bit
+
+    def mask(self, powers):
+        """Returns the bitmask with the bit of every power in powers set."""
+        mask = 0
+        for power in powers:
+            mask |= 1 << self.bit(power)
+        return mask
+
+    def names(self, mask):
+        """Returns the power names whose bits are set in mask, in bit order."""
+        return [name for bit, name in enumerate(self._names) if mask >> bit & 1]
+
+
+# The global registry shared by BitmaskSuperhero and HeroIndex by default.
+POWERS = PowerRegistry()
+
+
+class BitmaskSuperhero(Superhero):
+    """A Superhero whose superpowers are stored as a bitmask in POWERS.
+
+    Reading superpowers builds a fresh list each time, so the shared mutable
+    default of Superhero.__init__ can no longer leak between heroes.
+    """
+
+    registry = POWERS
+
+    @property
+    def superpowers(self):
+        return self.registry.names(self.power_mask)
+
+    @superpowers.setter
+    def superpowers(self, powers):
+        self.power_mask = self.registry.mask(powers)
+
+    def has_powers(self, *powers):
+        # A query must not register names: a misspelt power would use up a bit.
+        wanted = 0
+        for power in powers:
+            bit = self.registry.bit(power, create=False)
+            if bit is None:
+                return False  # nobody has a power that was never registered
+            wanted |= 1 << bit
+        return self.power_mask & wanted == wanted
+
+
+def _bitset_from_ids(ids):
+    """Returns the int with bit i set for every i in ids (ascending, not empty).
+
+    Only the span from the first to the last id is built in NumPy, so
+    merging a few new heroes costs O(their span), not O(all heroes).
+    """
+    low = ids[0]
+    bits = np.zeros(ids[-1] - low + 1, dtype=bool)
+    bits[np.asarray(ids) - low] = True
+    return int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little") << low
+
+
+class HeroIndex:
+    """Inverted index from power to the set of hero ids that have it.
+
+    Hero ids are 0, 1, 2, ... in the order heroes are added. Each set of ids
+    is an int bitset, so queries combine whole sets with &, | and ~. New ids
+    are buffered per power and merged into the bitsets in one pass when a
+    query needs them, which keeps adding a hero O(number of its powers).
+    """
+
+    def __init__(self, registry=POWERS):
+        self.registry = registry
+        self.masks = []      # hero id -> power bitmask
+        self._bitsets = {}   # power bit -> bitset of hero ids
+        self._pending = {}   # power bit -> hero ids not merged into the bitset yet
+
+    def __len__(self):
+        return len(self.masks)
+
+    def add(self, powers):
+        """Adds a hero with the given powers and returns its id."""
+        hero_id = len(self.masks)
+        mask = 0
+        bit_of, pending = self.registry.bit, self._pending
+        for power in powers:
+            bit = bit_of(power)
+            mask |= 1 << bit
+            ids = pending.get(bit)
+            if ids is None:
+                pending[bit] = [hero_id]
+            else:
+                ids.append(hero_id)
+        self.masks.append(mask)
+        return hero_id
+
+    def add_hero(self, hero):
+        """Adds a Superhero (or anything with a superpowers list); returns its id."""
+        return self.add(hero.superpowers)
+
+    def update(self, hero_id, powers):
+        """Replaces the powers of an already added hero."""
+        self._flush()
+        old, new = self.masks[hero_id], self.registry.mask(powers)
+        hero_bit = 1 << hero_id
+        for bit in range(max(old.bit_length(), new.bit_length())):
+            had, has = old >> bit & 1, new >> bit & 1
+            if had and not has:
+                self._bitsets[bit] &= ~hero_bit
+            elif has and not had:
+                self._bitsets[bit] = self._bitsets.get(bit, 0) | hero_bit
+        self.masks[hero_id] = new
+
+    def _flush(self):
+        for bit, ids in self._pending.items():
+            self._bitsets[bit] = self._bitsets.get(bit, 0) | _bitset_from_ids(ids)
+        self._pending.clear()
+
+    def everyone(self):
+        """Returns the bitset of all hero ids."""
+        return (1 << len(self.masks)) - 1
+
+    def with_power(self, power):
+        """Returns the bitset of heroes that have power."""
+        self._flush()
+        bit = self.registry.bit(power, create=False)
+        return 0 if bit is None else self._bitsets.get(bit, 0)
+
+    def query(self, all_of=(), any_of=(), none_of=()):
+        """Returns the bitset of heroes with every power in all_of, at least
+        one power in any_of (if given) and none of the powers in none_of.
+
+        "All heroes with flight AND NOT wealth" is
+        query(all_of=["flight"], none_of=["wealth"]).
+        """
+        result = self.everyone()
+        for power in all_of:
+            result &= self.with_power(power)
+        if any_of:
+            either = 0
+            for power in any_of:
+                either |= self.with_power(power)
+            result &= either
+        for power in none_of:
+            result &= ~self.with_power(power)
+        return result
+
+    def ids(self, bitset):
+        """Returns the hero ids in a bitset as a sorted NumPy array."""
+        size = len(self.masks)
+        data = np.frombuffer(bitset.to_bytes((size + 7) // 8, "little"), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(data, bitorder="little")[:size])
+
+    @staticmethod
+    def count(bitset):
+        return bin(bitset).count("1")
+
+
+if __name__ == "__main__":
+    tick = BitmaskSuperhero(name="Tick")
+    tick.boast()                     # => I wield the power of super strength!
+                                     # => I wield the power of bulletproofing!
+    print(tick.has_powers("super strength"))  # => True
+    tick.superpowers.append("flight")         # a fresh list: the hero is unchanged
+    print(tick.superpowers)          # => ['super strength', 'bulletproofing']
+
+    index = HeroIndex()
+    index.add_hero(tick)                              # id 0
+    index.add(["flight", "super strength"])           # id 1
+    index.add(["flight", "Wealthy"])                  # id 2
+    index.add(["Wealthy"])                            # id 3
+    flying_not_wealthy = index.query(all_of=["flight"], none_of=["Wealthy"])
+    print(index.ids(flying_not_wealthy))              # => [1]
+    print(index.count(index.with_power("Wealthy")))   # => 2
@@ -0,0 +1,188 @@
+####################################################
+## 6.4 __slots__ and fast construction
+####################################################
+
+# By default every instance stores its attributes in its own __dict__. A
+# class that lists its attributes in __slots__ gets fixed storage instead:
+# no per-instance dict, less memory and slightly faster attribute access.
+#
+# These are slotted versions of Human, Superhero, Bat and Batman. Unlike
+# Batman.py, which calls Superhero.__init__ and Bat.__init__ explicitly, every
+# __init__ here takes **kwargs and passes what it does not use on with
+# super().__init__(), so one call walks the whole MRO ("cooperative"
+# multiple inheritance).
+#
+# One catch: Python only allows one base class with non-empty __slots__ in a
+# multiple inheritance list ("multiple bases have instance lay-out
+# conflict"). So the Bat behaviour lives in SlottedBatBase, which declares no
+# slots, and each concrete class (SlottedBat, SlottedBatman) declares the
+# "fly" slot itself.
+
+from copy import copy
+from functools import lru_cache
+
+from human.sinks import write_lines
+
+
+class SlottedHuman:
+
+    __slots__ = ("name", "_age")
+
+    species = "H. sapiens"
+
+    # Only settable on the class (SlottedHuman.sink = ...): there is no
+    # "sink" slot, and a slot cannot share its name with a class attribute.
+    sink = None
+
+    def __init__(self, name, **kwargs):
+        super().__init__(**kwargs)
+        self.name = name
+        self._age = 0
+
+    def say(self, msg):
+        line = "{name}: {message}".format(name=self.name, message=msg)
+        if self.sink is None:
+            print(line)
+        else:
+            self.sink.write(line)
+
+    def sing(self):
+        return "yo... yo... microphone check... one two... one two..."
+
+    @classmethod
+    def get_species(cls):
+        return cls.species
+
+    @staticmethod
+    def grunt():
+        return "*grunt*"
+
+    @property
+    def age(self):
+        return self._age
+
+    @age.setter
+    def age(self, age):
+        self._age = age
+
+    @age.deleter
+    def age(self):
+        del self._age
+
+
+class SlottedSuperhero(SlottedHuman):
+
+    __slots__ = ("fictional", "movie", "superpowers")
+
+    species = "Superhuman"
+
+    # A tuple default cannot be shared and mutated by accident; each hero
+    # gets its own list.
+    def __init__(self, name, movie=False,
+                 superpowers=("super strength", "bulletproofing"), **kwargs):
+        self.fictional = True
+        self.movie = movie
+        self.superpowers = list(superpowers)
+        super().__init__(name, **kwargs)
+
+    def sing(self):
+        return "Dun, dun, DUN!"
+
+    def boast(self):
+        lines = ["I wield the power of {pow}!".format(pow=power) for power in self.superpowers]
+        write_lines(self.sink, lines)
+
+
+class SlottedBatBase:
+
+    __slots__ = ()
+
+    species = "Baty"
+
+    def __init__(self, can_fly=True, **kwargs):
+        super().__init__(**kwargs)
+        self.fly = can_fly
+
+    def say(self, msg):
+        msg = "... ... ..."
+        return msg
+
+    def sonar(self):
+        return "))) ... ((("
+
+
+class SlottedBat(SlottedBatBase):
+
+    __slots__ = ("fly",)
+
+
+class SlottedBatman(SlottedSuperhero, SlottedBatBase):
+
+    __slots__ = ("fly",)
+
+    # One super() call reaches SlottedSuperhero, SlottedHuman and
+    # SlottedBatBase in MRO order, each taking the arguments it knows.
+    def __init__(self, **kwargs):
+        super().__init__(name="anonymous", movie=True, superpowers=["Wealthy"],
+                         can_fly=False, **kwargs)
+        self.name = "Sad Affleck"
+
+    def sing(self):
+        return "nan nan nan nan nan batman!"
+
+
+def _all_slots(cls):
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        yield from (slots,) if isinstance(slots, str) else slots
+
+
+@lru_cache(maxsize=None)
+def cached_factory(cls, *args, **kwargs):
+    """Returns a function that builds cls(*args, **kwargs) instances quickly.
+
+    The initializer chain runs once, on a prototype; the factory then creates
+    each instance with cls.__new__ and copies the prototype's slot values
+    into it. A list, dict or set in a slot is copied for every instance, but
+    only one level deep: the lists inside a list of lists stay shared with
+    the prototype. Factories are cached per class and arguments, which must
+    therefore be hashable.
+    """
+    prototype = cls(*args, **kwargs)
+    values = []
+    for slot in _all_slots(cls):
+        if slot in ("__dict__", "__weakref__"):
+            continue
+        try:
+            value = getattr(prototype, slot)
+        except AttributeError:
+            continue
+        values.append((slot, value, isinstance(value, (list, dict, set))))
+    new = cls.__new__
+
+    def build():
+        instance = new(cls)
+        for slot, value, mutable in values:
+            setattr(instance, slot, copy(value) if mutable else value)
+        return instance
+    return build
+
+
+if __name__ == "__main__":
+    sup = SlottedBatman()
+    print([klass.__name__ for klass in SlottedBatman.__mro__])
+    # => ['SlottedBatman', 'SlottedSuperhero', 'SlottedHuman', 'SlottedBatBase', 'object']
+    print(sup.get_species())         # => Superhuman
+    print(sup.sing())                # => nan nan nan nan nan batman!
+    sup.say("I agree")               # => Sad Affleck: I agree
+    print(sup.sonar())               # => ))) ... (((
+    sup.age = 100
+    print(sup.age)                   # => 100
+    print("Can I fly? " + str(sup.fly))  # => Can I fly? False
+    print(hasattr(sup, "__dict__"))  # => False
+
+    make_batman = cached_factory(SlottedBatman)
+    clone = make_batman()
+    clone.superpowers.append("Gadgets")
+    print(clone.name, clone.superpowers, make_batman().superpowers)
+    # => Sad Affleck ['Wealthy', 'Gadgets'] ['Wealthy']
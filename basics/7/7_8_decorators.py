@@ -87,6 +87,7 @@ obj.display()
 # Output:
 # Method display is called.
 # This is a method in MyClass.
+# (tracing.py has a log_method that records calls instead of printing them.)
 
 # 5. Built-in Decorators
 # Python provides built-in decorators like @staticmethod, @classmethod, and @property.
@@ -88,3 +88,7 @@ my_function(1,2)  # => "Entering function my_function"
 
 print(my_function.__name__)  # => 'my_function'
 print(my_function.__code__.co_argcount)  # => 2
+
+# Printing on every call is fine for a lesson but far too slow for a function
+# called millions of times. tracing.py has a log_function that records sampled
+# timings into a ring buffer and flushes them to a JSONL file instead.
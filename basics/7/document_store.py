@@ -0,0 +1,329 @@
+# Lesson: An Indexed Document Store
+# 7_3_data_structures.py keeps records as dictionaries inside lists and
+# dictionaries, e.g. nested_dict['person']['name']. Finding "every student
+# with grade 'A'" then means looping over the whole list, and a company with
+# departments with employees needs a loop per level.
+#
+# A secondary index trades a little memory for fast lookups, the same way a
+# book's index does. Each record (a "document") gets an id, and for a chosen
+# path such as "grade" or "department.name" the store keeps:
+#
+# - a hash index: a dict {value: set of ids}, for "equals" questions, and/or
+# - a sorted index: the (value, id) pairs in sorted order, for "between"
+#   questions, answered with bisect in O(log n).
+#
+# Query results are plain sets of ids, so they combine with the set
+# operations from the lesson: & (and), | (or), - (but not).
+#
+#   store = DocumentStore()
+#   store.insert_many(students)
+#   store.create_index("grade")
+#   store.create_index("age", kind="sorted")
+#   ids = store.eq("grade", "A") & store.range("age", 18, 21)
+#   store.docs(ids)
+
+from bisect import bisect_left, bisect_right
+from heapq import merge
+
+_MISSING = object()
+
+
+def values_at(doc, path):
+    """Yields every value at a dotted path such as "department.name".
+
+    Lists along the way are walked element by element, so
+    "employees.name" yields the name of every employee. A path that does
+    not exist yields nothing.
+    """
+    parts = path.split(".") if isinstance(path, str) else path
+    stack = [(doc, 0)]
+    while stack:
+        value, depth = stack.pop()
+        if isinstance(value, list):
+            stack.extend((item, depth) for item in reversed(value))
+        elif depth == len(parts):
+            yield value
+        elif isinstance(value, dict):
+            child = value.get(parts[depth], _MISSING)
+            if child is not _MISSING:
+                stack.append((child, depth + 1))
+
+
+def unwind(doc, path):
+    """Yields one copy of doc per element of the list at a dotted path.
+
+    In each copy the list is replaced by one of its elements, so a company
+    unwound on "departments.employees" gives one record per employee that
+    still carries its company and department fields:
+
+        {"name": "Acme", "departments": {"name": "R&D", "employees": {"name": "Ann"}}}
+    """
+    key, _, rest = path.partition(".")
+    value = doc.get(key, _MISSING)
+    if value is _MISSING:
+        return
+    for item in value if isinstance(value, list) else [value]:
+        if rest:
+            if not isinstance(item, dict):
+                continue
+            for unwound in unwind(item, rest):
+                yield {**doc, key: unwound}
+        else:
+            yield {**doc, key: item}
+
+
+class HashIndex:
+    """{value: set of document ids} for one path."""
+
+    def __init__(self):
+        self.ids = {}
+
+    def add(self, value, doc_id):
+        self.ids.setdefault(value, set()).add(doc_id)
+
+    def remove(self, value, doc_id):
+        ids = self.ids.get(value)
+        if ids is not None:
+            ids.discard(doc_id)
+            if not ids:
+                del self.ids[value]
+
+    def eq(self, value):
+        return set(self.ids.get(value, ()))
+
+
+class SortedIndex:
+    """(value, id) pairs kept sorted for range queries on one path.
+
+    Inserts are appended to a pending list and merged in the next time the
+    index is queried: a few pending pairs are bisected into place, a larger
+    batch is sorted on its own and merged with the indexed pairs in one pass.
+    So bulk loading costs O(n log n), and a query after each insert does not
+    re-sort the whole index.
+    """
+
+    # Up to this many pending pairs are inserted one by one with bisect.
+    BISECT_LIMIT = 64
+
+    def __init__(self):
+        self.keys = []
+        self.doc_ids = []
+        self._pending = []
+
+    def check(self, values):
+        """Raises TypeError if values cannot be sorted with the indexed ones."""
+        reference = self.keys[:1] or [value for value, _ in self._pending[:1]]
+        try:
+            sorted(reference + list(values))
+        except TypeError:
+            raise TypeError("cannot order {!r} with the values in a sorted index "
+                            "(such as {!r})".format(list(values), reference[:1])) from None
+
+    def add(self, value, doc_id):
+        """Adds a pair; call check() first, an unorderable value breaks the index."""
+        self._pending.append((value, doc_id))
+
+    def remove(self, value, doc_id):
+        self._merge()
+        i = bisect_left(self.keys, value)
+        while i < len(self.keys) and self.keys[i] == value:
+            if self.doc_ids[i] == doc_id:
+                del self.keys[i], self.doc_ids[i]
+                return
+            i += 1
+
+    def _merge(self):
+        pending = self._pending
+        if not pending:
+            return
+        if len(pending) <= self.BISECT_LIMIT:
+            keys, doc_ids = self.keys, self.doc_ids
+            for value, doc_id in pending:
+                i = bisect_right(keys, value)
+                keys.insert(i, value)
+                doc_ids.insert(i, doc_id)
+        else:
+            pairs = list(merge(zip(self.keys, self.doc_ids), sorted(pending)))
+            self.keys = [key for key, _ in pairs]
+            self.doc_ids = [doc_id for _, doc_id in pairs]
+        self._pending = []
+
+    def range(self, low=None, high=None, include_low=True, include_high=False):
+        self._merge()
+        keys = self.keys
+        if low is None:
+            start = 0
+        else:
+            start = bisect_left(keys, low) if include_low else bisect_right(keys, low)
+        if high is None:
+            stop = len(keys)
+        else:
+            stop = bisect_right(keys, high) if include_high else bisect_left(keys, high)
+        return set(self.doc_ids[start:stop])
+
+    def eq(self, value):
+        # None is an open bound for range(), but no indexed value equals it.
+        if value is None:
+            return set()
+        return self.range(value, value, True, True)
+
+
+class DocumentStore:
+    """Nested dict documents with hash and sorted indexes on dotted paths.
+
+    Indexed values must be hashable (hash index) and comparable with each
+    other (sorted index); dicts and lists at the end of a path are skipped.
+    insert() raises TypeError for a value a sorted index cannot order, and
+    leaves the store unchanged.
+    Documents must not be changed in place while stored: remove() and
+    insert() them again so the indexes stay correct.
+    """
+
+    def __init__(self):
+        self._docs = {}
+        self._next_id = 0
+        self._hash = {}      # path -> HashIndex
+        self._sorted = {}    # path -> SortedIndex
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __getitem__(self, doc_id):
+        return self._docs[doc_id]
+
+    def _indexes(self):
+        yield from self._hash.items()
+        yield from self._sorted.items()
+
+    @staticmethod
+    def _index_values(doc, path):
+        # A list can hold the same value twice; index it once.
+        seen = set()
+        for value in values_at(doc, path):
+            if isinstance(value, (dict, list)) or value is None or value in seen:
+                continue
+            seen.add(value)
+            yield value
+
+    def insert(self, doc):
+        """Stores doc and returns its id."""
+        values = [(index, list(self._index_values(doc, path))) for path, index in self._indexes()]
+        # Check everything first, so a rejected doc leaves no trace in any index.
+        for index, index_values in values:
+            if isinstance(index, SortedIndex):
+                index.check(index_values)
+        doc_id = self._next_id
+        self._next_id += 1
+        self._docs[doc_id] = doc
+        for index, index_values in values:
+            for value in index_values:
+                index.add(value, doc_id)
+        return doc_id
+
+    def insert_many(self, docs):
+        return [self.insert(doc) for doc in docs]
+
+    def remove(self, doc_id):
+        """Removes a document and returns it."""
+        doc = self._docs.pop(doc_id)
+        for path, index in self._indexes():
+            for value in self._index_values(doc, path):
+                index.remove(value, doc_id)
+        return doc
+
+    def create_index(self, path, kind="hash"):
+        """Indexes path ("hash" for eq/isin, "sorted" for range and eq)."""
+        if kind == "hash":
+            indexes, index = self._hash, HashIndex()
+        elif kind == "sorted":
+            indexes, index = self._sorted, SortedIndex()
+        else:
+            raise ValueError("index kind must be 'hash' or 'sorted', not {!r}".format(kind))
+        if path not in indexes:
+            for doc_id, doc in self._docs.items():
+                values = list(self._index_values(doc, path))
+                if kind == "sorted":
+                    index.check(values)
+                for value in values:
+                    index.add(value, doc_id)
+            indexes[path] = index
+
+    def _scan(self, path, matches):
+        # Without an index there is nothing better than looking at everything.
+        return {doc_id for doc_id, doc in self._docs.items()
+                if any(matches(value) for value in self._index_values(doc, path))}
+
+    def all(self):
+        return set(self._docs)
+
+    def eq(self, path, value):
+        """Ids of documents with value at path."""
+        if path in self._hash:
+            return self._hash[path].eq(value)
+        if path in self._sorted:
+            return self._sorted[path].eq(value)
+        return self._scan(path, lambda found: found == value)
+
+    def isin(self, path, values):
+        """Ids of documents with any of values at path (a union of eq queries)."""
+        ids = set()
+        for value in values:
+            ids |= self.eq(path, value)
+        return ids
+
+    def range(self, path, low=None, high=None, include_low=True, include_high=False):
+        """Ids of documents with low <= value < high at path.
+
+        None leaves that end open; include_low/include_high choose whether
+        the ends themselves match.
+        """
+        if path in self._sorted:
+            return self._sorted[path].range(low, high, include_low, include_high)
+
+        def matches(value):
+            try:
+                if low is not None and (value < low if include_low else value <= low):
+                    return False
+                return high is None or (value <= high if include_high else value < high)
+            except TypeError:
+                return False
+        if path in self._hash:
+            ids = set()
+            for value, value_ids in self._hash[path].ids.items():
+                if matches(value):
+                    ids |= value_ids
+            return ids
+        return self._scan(path, matches)
+
+    def docs(self, ids):
+        """Returns the documents for ids, in insertion order."""
+        return [self._docs[doc_id] for doc_id in sorted(ids)]
+
+
+if __name__ == "__main__":
+    students = [
+        {"name": "Alice", "age": 20, "grade": "A"},
+        {"name": "Bob", "age": 22, "grade": "B"},
+        {"name": "Cara", "age": 19, "grade": "A"},
+    ]
+    store = DocumentStore()
+    store.insert_many(students)
+    store.create_index("grade")
+    store.create_index("age", kind="sorted")
+
+    top = store.eq("grade", "A")
+    young = store.range("age", 18, 21)
+    print([s["name"] for s in store.docs(top & young)])       # => ['Alice', 'Cara']
+    print([s["name"] for s in store.docs(top | store.eq("name", "Bob"))])
+    # => ['Alice', 'Bob', 'Cara']  (name has no index, so that part scans)
+
+    company = {"name": "Acme", "departments": [
+        {"name": "R&D", "employees": [{"name": "Ann", "salary": 120}, {"name": "Ben", "salary": 90}]},
+        {"name": "Sales", "employees": [{"name": "Cid", "salary": 80}]},
+    ]}
+    staff = DocumentStore()
+    staff.insert_many(unwind(company, "departments.employees"))
+    staff.create_index("departments.name")
+    staff.create_index("departments.employees.salary", kind="sorted")
+    rich = staff.range("departments.employees.salary", 85) - staff.eq("departments.name", "Sales")
+    print([e["departments"]["employees"]["name"] for e in staff.docs(rich)])  # => ['Ann', 'Ben']
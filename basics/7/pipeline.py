@@ -0,0 +1,280 @@
+####################################################
+## 7. Advanced: chunked generator pipelines
+####################################################
+
+# double_numbers in 7_Advanced.py is lazy, but it pays the interpreter's
+# per-element cost (a generator resume, an addition, a yield) for every
+# value. Over range(1, 900000000) that is minutes per pass.
+#
+# A chunked pipeline keeps the laziness and drops most of that cost: values
+# flow through the stages as NumPy arrays of chunk_size elements, so each
+# stage runs once per chunk, in C, instead of once per value. Nothing is
+# computed until the pipeline is iterated, and stopping early (take, until,
+# take_while or a plain break) stops pulling chunks from the source.
+#
+#   doubled = Pipeline.range(1, 900000000).map(lift(double_numbers, vectorize=True))
+#   for i in doubled.until(lambda a: a >= 30):
+#       print(i)                     # 2 4 6 ... 30, after one chunk of work
+
+from functools import reduce as _reduce
+from itertools import islice
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def range_chunks(start, stop=None, step=1, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.int64):
+    """Yields range(start, stop, step) as arrays of up to chunk_size values."""
+    if stop is None:
+        start, stop = 0, start
+    span = chunk_size * step
+    for first in range(start, stop, span):
+        last = min(first + span, stop) if step > 0 else max(first + span, stop)
+        yield np.arange(first, last, step, dtype=dtype)
+
+
+def iter_chunks(iterable, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.int64):
+    """Yields the values of any iterable as arrays of up to chunk_size values."""
+    iterator = iter(iterable)
+    while True:
+        chunk = np.fromiter(islice(iterator, chunk_size), dtype=dtype)
+        if not len(chunk):
+            return
+        yield chunk
+
+
+# float64 holds every integer up to this exactly.
+_EXACT_FLOAT_INTS = 2 ** 53
+
+
+class LiftedGenerator:
+    """A per-element generator function used as a pipeline stage; see lift()."""
+
+    def __init__(self, gen_func, vectorize=False, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.gen_func = gen_func
+        self.vectorize = vectorize
+        self.chunk_size = chunk_size
+        self.__name__ = getattr(gen_func, "__name__", "lifted")
+        self.__doc__ = getattr(gen_func, "__doc__", None)
+
+    def stage(self, chunks):
+        if self.vectorize:
+            for chunk in chunks:
+                yield self._vectorized(chunk)
+            return
+        # One generator for the whole stream, so state carries across chunks.
+        values = (value for chunk in chunks for value in chunk.tolist())
+        outputs = self.gen_func(values)
+        while True:
+            batch = list(islice(outputs, self.chunk_size))
+            if not batch:
+                return
+            # Python ints too big for int64 give an object array: exact, not wrapped.
+            yield np.array(batch)
+
+    def _vectorized(self, chunk):
+        # Integer chunks are computed in float64 and checked: int64 arithmetic
+        # would wrap around silently, float64 overflow at least shows.
+        integer = np.issubdtype(chunk.dtype, np.integer)
+        results = list(self.gen_func((chunk.astype(np.float64) if integer else chunk,)))
+        if (len(results) != 1 or not isinstance(results[0], np.ndarray)
+                or results[0].shape != chunk.shape):
+            raise ValueError("{} is not element-wise arithmetic; use lift() without "
+                             "vectorize".format(self.__name__))
+        result = results[0]
+        if integer and np.issubdtype(result.dtype, np.floating):
+            if len(result) and not np.max(np.abs(result)) <= _EXACT_FLOAT_INTS:
+                raise OverflowError("{} gives values beyond 2**53, which float64 cannot hold "
+                                    "exactly; use lift() without vectorize".format(self.__name__))
+            if np.array_equal(result, np.trunc(result)):
+                result = result.astype(np.int64)
+        return result
+
+
+def lift(gen_func, vectorize=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Turns a per-element generator function into a stage for Pipeline.map.
+
+    By default the values are fed through one run of gen_func, element by
+    element, so any generator works (one that keeps a running total, yields
+    more or fewer items than it gets, has side effects, ...) and the body runs
+    once per item. Results are plain Python numbers packed into arrays, so big
+    integers stay exact. This is correct but only about as fast as the
+    original generator.
+
+    vectorize=True is an opt-in for bodies that are pure element-wise
+    arithmetic, like double_numbers: gen_func is called once per chunk with a
+    one-item iterable holding the whole chunk, so "i + i" adds two arrays in
+    C. Integer chunks are computed in float64, and a result beyond 2**53
+    raises OverflowError instead of wrapping (intermediate values must stay
+    below that too). A body that does not yield exactly one array of the
+    chunk's shape raises ValueError.
+    """
+    return LiftedGenerator(gen_func, vectorize, chunk_size)
+
+
+def _once(iterator):
+    used = False
+
+    def source():
+        nonlocal used
+        if used:
+            raise RuntimeError("this pipeline reads from an iterator, which can only be "
+                               "iterated once")
+        used = True
+        return iterator
+    return source
+
+
+class Pipeline:
+    """A lazy sequence of NumPy chunks with chainable stages.
+
+    Every stage returns a new Pipeline wrapping a generator over the previous
+    one, so building a pipeline costs nothing; work happens only as chunks
+    are pulled by iterating it (value by value) or calling chunks().
+
+    chunks is a function returning a fresh iterator of chunks, or a
+    collection of chunks. Each iteration then starts over from the source,
+    so a pipeline can be iterated more than once. A pipeline over an
+    iterator (a generator, or from_iterable(iterator)) raises RuntimeError
+    when iterated a second time instead of silently yielding nothing.
+    """
+
+    def __init__(self, chunks):
+        if callable(chunks):
+            self._source = chunks
+        elif iter(chunks) is chunks:
+            self._source = _once(chunks)
+        else:
+            self._source = lambda: iter(chunks)
+
+    @classmethod
+    def range(cls, start, stop=None, step=1, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.int64):
+        return cls(lambda: range_chunks(start, stop, step, chunk_size, dtype))
+
+    @classmethod
+    def from_iterable(cls, iterable, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.int64):
+        if iter(iterable) is iterable:
+            return cls(iter_chunks(iterable, chunk_size, dtype))
+        return cls(lambda: iter_chunks(iterable, chunk_size, dtype))
+
+    def chunks(self):
+        """Returns an iterator over the chunks (NumPy arrays)."""
+        return iter(self._source())
+
+    def __iter__(self):
+        # tolist() hands back plain Python numbers, just like double_numbers.
+        for chunk in self.chunks():
+            yield from chunk.tolist()
+
+    def _then(self, stage):
+        return type(self)(lambda: stage(self.chunks()))
+
+    def map(self, func):
+        """Applies func (chunk -> chunk, e.g. a ufunc) to every chunk, or runs
+        the chunks through a lift()ed generator."""
+        if isinstance(func, LiftedGenerator):
+            return self._then(func.stage)
+
+        def stage(chunks):
+            for chunk in chunks:
+                yield func(chunk)
+        return self._then(stage)
+
+    def filter(self, predicate):
+        """Keeps the values where predicate(chunk) (a boolean mask) is True."""
+        def stage(chunks):
+            for chunk in chunks:
+                kept = chunk[predicate(chunk)]
+                if len(kept):
+                    yield kept
+        return self._then(stage)
+
+    def take_while(self, predicate):
+        """Yields values while predicate holds and stops at the first that fails."""
+        def stage(chunks):
+            for chunk in chunks:
+                failed = np.flatnonzero(~np.asarray(predicate(chunk), dtype=bool))
+                if len(failed):
+                    if failed[0]:
+                        yield chunk[:failed[0]]
+                    return
+                yield chunk
+        return self._then(stage)
+
+    def until(self, predicate):
+        """Yields values up to and including the first one where predicate holds.
+
+        This is the chunked form of "print(i); if i >= 30: break".
+        """
+        def stage(chunks):
+            for chunk in chunks:
+                hits = np.flatnonzero(predicate(chunk))
+                if len(hits):
+                    yield chunk[:hits[0] + 1]
+                    return
+                yield chunk
+        return self._then(stage)
+
+    def take(self, n):
+        """Yields at most the first n values."""
+        def stage(chunks):
+            left = n
+            if left <= 0:
+                return
+            for chunk in chunks:
+                if len(chunk) >= left:
+                    yield chunk[:left]
+                    return
+                left -= len(chunk)
+                yield chunk
+        return self._then(stage)
+
+    def reduce(self, func, initial=None):
+        """Folds every value into one, consuming the pipeline.
+
+        With a NumPy ufunc (np.add, np.maximum, ...) each chunk is reduced in C
+        and the per-chunk results are combined with the same ufunc. Any other
+        two-argument function is applied value by value, like
+        functools.reduce. Raises TypeError on an empty pipeline without an
+        initial value.
+        """
+        result = initial
+        if isinstance(func, np.ufunc):
+            for chunk in self.chunks():
+                if len(chunk):
+                    partial = func.reduce(chunk)
+                    result = partial if result is None else func(result, partial)
+            if result is None:
+                raise TypeError("reduce() of empty pipeline with no initial value")
+            return result.item() if isinstance(result, np.generic) else result
+        values = iter(self)
+        if initial is None:
+            return _reduce(func, values)
+        return _reduce(func, values, initial)
+
+    def sum(self):
+        return self.reduce(np.add, 0)
+
+    def to_list(self):
+        return list(self)
+
+
+if __name__ == "__main__":
+    def double_numbers(iterable):
+        for i in iterable:
+            yield i + i
+
+    # The loop from 7_Advanced.py, one 65536-value chunk of work in total.
+    doubled = Pipeline.range(1, 900000000).map(lift(double_numbers, vectorize=True))
+    for i in doubled.until(lambda a: a >= 30):
+        print(i)                     # => 2 4 6 ... 30
+
+    evens_below_100 = (Pipeline.range(1, 900000000)
+                       .filter(lambda a: a % 2 == 0)
+                       .take_while(lambda a: a < 100))
+    print(evens_below_100.sum())     # => 2450
+
+    # The whole range, doubled and summed, takes seconds instead of minutes.
+    print(Pipeline.range(1, 900000000).map(lift(double_numbers, vectorize=True)).reduce(np.add))
+    # => 809999999100000000
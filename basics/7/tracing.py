@@ -0,0 +1,268 @@
+####################################################
+## 7. Advanced: sampling trace decorators
+####################################################
+
+# log_function (7_Advanced.py) and log_method (7_8_decorators.py) print on
+# every call. print() is slow, so on a function called a million times the
+# logging costs far more than the function itself.
+#
+# A tracer records instead of printing. Each traced call bumps a counter; one
+# call in every sample_every is also timed with perf_counter_ns and stored in
+# a ring buffer: a list allocated once with room for `capacity` records, which
+# overwrites the oldest records when it wraps around. A background thread
+# appends new records to a JSONL file (one JSON object per line) every
+# flush_interval seconds.
+#
+#   tracer = Tracer("trace.jsonl", sample_every=100)
+#   tracer.start()
+#
+#   @tracer.trace
+#   def my_function(x, y):
+#       return x + y
+#
+# Thread and asyncio safety: slots in the ring buffer are handed out by
+# next() on an itertools.count, which is atomic, and each record is written
+# with a single list assignment, so recording takes no lock. The call and
+# error counts are plain ints behind a small lock each. Async functions get
+# an async wrapper that times the whole await.
+#
+# With tracer.enabled = False a traced call costs one attribute check on top
+# of the original call.
+
+import asyncio
+import itertools
+import json
+import threading
+import time
+from functools import wraps
+
+
+class _Counter:
+    """A thread-safe counter: an int guarded by a lock."""
+
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def increment(self):
+        """Adds one and returns the count before it (0 for the first call)."""
+        with self._lock:
+            value = self._value
+            self._value = value + 1
+            return value
+
+    def value(self):
+        return self._value
+
+
+class Tracer:
+    """Collects call counts, sampled timings and exceptions of traced functions.
+
+    Records are tuples (seq, name, thread id, start_ns, duration_ns, error),
+    where error is the exception class name or None. flush() appends the
+    records written since the last flush to `path` as JSONL; records that were
+    overwritten before they could be flushed are counted in `dropped`.
+    """
+
+    def __init__(self, path=None, capacity=1 << 16, sample_every=1, flush_interval=1.0,
+                 enabled=True):
+        self.path = path
+        self.capacity = capacity
+        self.sample_every = sample_every
+        self.flush_interval = flush_interval
+        self.enabled = enabled
+        self.dropped = 0
+        self._records = [None] * capacity
+        self._next_seq = itertools.count().__next__
+        self._flushed = 0            # seq of the first record not flushed yet
+        self._calls = {}             # name -> _Counter
+        self._errors = {}            # name -> _Counter
+        self._flush_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def trace(self, func=None, *, sample_every=None):
+        """Decorator that traces func; usable as @tracer.trace or
+        @tracer.trace(sample_every=10). functools.wraps keeps the name,
+        docstring and signature of func.
+
+        Without a sample_every of its own, func follows tracer.sample_every,
+        which is read on every call and so can be changed at any time."""
+        if func is None:
+            return lambda func: self.trace(func, sample_every=sample_every)
+
+        name = "{}.{}".format(func.__module__, func.__qualname__)
+        count_call = self._calls.setdefault(name, _Counter()).increment
+        count_error = self._errors.setdefault(name, _Counter()).increment
+        records, capacity, next_seq = self._records, self.capacity, self._next_seq
+        clock, get_ident = time.perf_counter_ns, threading.get_ident
+
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return await func(*args, **kwargs)
+                if count_call() % (sample_every or self.sample_every):
+                    try:
+                        return await func(*args, **kwargs)
+                    except BaseException:
+                        count_error()
+                        raise
+                error = None
+                start = clock()
+                try:
+                    return await func(*args, **kwargs)
+                except BaseException as exc:
+                    error = type(exc).__name__
+                    count_error()
+                    raise
+                finally:
+                    duration = clock() - start
+                    seq = next_seq()
+                    records[seq % capacity] = (seq, name, get_ident(), start, duration, error)
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            if count_call() % (sample_every or self.sample_every):
+                try:
+                    return func(*args, **kwargs)
+                except BaseException:
+                    count_error()
+                    raise
+            error = None
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            except BaseException as exc:
+                error = type(exc).__name__
+                count_error()
+                raise
+            finally:
+                duration = clock() - start
+                seq = next_seq()
+                records[seq % capacity] = (seq, name, get_ident(), start, duration, error)
+        return wrapper
+
+    def stats(self):
+        """Returns {function name: {"calls": n, "errors": n}}.
+
+        Calls and errors are counted while the tracer is enabled, whether
+        the call was sampled or not.
+        """
+        return {name: {"calls": counter.value(), "errors": self._errors[name].value()}
+                for name, counter in self._calls.items()}
+
+    def drain(self):
+        """Returns the records written since the last drain/flush, oldest first."""
+        with self._flush_lock:
+            return self._drain()
+
+    def _drain(self):
+        records, seq, capacity = [], self._flushed, self.capacity
+        while True:
+            record = self._records[seq % capacity]
+            if record is None or record[0] < seq:
+                # Not written yet: either the slot is still empty or the
+                # thread holding this seq has not stored it. Pick it up on
+                # the next drain.
+                break
+            if record[0] > seq:
+                # The buffer wrapped around and overwrote this record.
+                self.dropped += 1
+            else:
+                records.append(record)
+            seq += 1
+        self._flushed = seq
+        return records
+
+    def flush(self):
+        """Appends the new records to path as JSONL; returns how many."""
+        # One lock around draining and writing, so a manual flush and the
+        # background thread cannot interleave their lines in the file.
+        with self._flush_lock:
+            records = self._drain()
+            if records and self.path is not None:
+                with open(self.path, "a") as f:
+                    for _, name, thread, start, duration, error in records:
+                        f.write(json.dumps({"func": name, "thread": thread, "start_ns": start,
+                                            "duration_ns": duration, "error": error}))
+                        f.write("\n")
+            return len(records)
+
+    def _flush_periodically(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def start(self):
+        """Starts the background thread that flushes every flush_interval seconds."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._flush_periodically,
+                                            name="tracer-flush", daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self):
+        """Stops the flush thread and flushes what is left."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# A default tracer, disabled until someone turns it on, so the decorators
+# below can be left on code permanently.
+TRACER = Tracer(enabled=False)
+
+
+def log_function(func=None, *, sample_every=None):
+    """Tracing replacement for log_function in 7_Advanced.py."""
+    return TRACER.trace(func, sample_every=sample_every)
+
+
+# Methods are just functions looked up on the class, so the same decorator works.
+log_method = log_function
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), "trace.jsonl")
+    TRACER.path = path
+    TRACER.sample_every = 1000
+    TRACER.enabled = True
+
+    @log_function
+    def my_function(x, y):
+        """Adds x and y."""
+        return x + y
+
+    class MyClass:
+        @log_method
+        def display(self):
+            return "This is a method in MyClass."
+
+    with TRACER:
+        for i in range(1000000):
+            my_function(i, 1)
+        MyClass().display()
+
+    print(my_function.__name__, my_function.__doc__)  # => my_function Adds x and y.
+    print(TRACER.stats()["__main__.my_function"])     # => {'calls': 1000000, 'errors': 0}
+    with open(path) as f:
+        lines = f.readlines()
+    print(len(lines))                # => 1001 (one in 1000 calls, plus display)
+    print(json.loads(lines[0])["func"])               # => __main__.my_function
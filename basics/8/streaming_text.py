@@ -0,0 +1,105 @@
+####################################################
+## 8. String Manipulation: streaming clean_text
+####################################################
+
+# clean_text in 8_String_Manipulation.py is " ".join(text.split()): it needs
+# the whole text in memory, plus a list with every word in it. For a file of
+# several GB that does not fit.
+#
+# Collapsing whitespace only ever needs to know one thing about the past:
+# whether whitespace has been seen since the last word character. So the
+# text can be read in fixed-size chunks and each chunk cleaned with the same
+# split/join, as long as the chunk edges are handled:
+#
+#   "...quick bro" + "wn   fox..."   the word continues: no space added
+#   "...quick "    + "brown fox..."  a gap at the edge: one space added
+#   "...quick"     + "   "  + "brown"  an all-whitespace chunk is just a gap
+#
+# Output is produced chunk by chunk, so memory stays at about one chunk no
+# matter how long the text (or a single word in it) is.
+#
+# The bytes path works on raw bytes and skips decoding. bytes.split() only
+# knows ASCII whitespace and, unlike str.split(), not the separators
+# \x1c-\x1f, so those are translated to spaces first. The result is then the
+# same as clean_text for ASCII text; in UTF-8 text, Unicode-only whitespace
+# such as U+00A0 (no-break space) is kept as it is.
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+_ASCII_SEPARATORS = bytes.maketrans(b"\x1c\x1d\x1e\x1f", b"    ")
+
+
+def clean_text(text):
+    """Remove extra whitespace and normalize text (as in 8_String_Manipulation.py)."""
+    return " ".join(text.split())
+
+
+def clean_chunks(chunks):
+    """Yields the cleaned text of an iterable of str (or bytes) chunks.
+
+    "".join(clean_chunks(chunks)) == clean_text("".join(chunks)) for str
+    chunks; bytes chunks follow the ASCII rules described above.
+    """
+    started = False   # has any word been yielded yet?
+    gap = False       # whitespace seen since the last word character?
+    for chunk in chunks:
+        if not chunk:
+            continue
+        is_bytes = isinstance(chunk, (bytes, bytearray))
+        if is_bytes:
+            chunk = chunk.translate(_ASCII_SEPARATORS)
+        words = chunk.split()
+        if not words:
+            gap = True
+            continue
+        space = b" " if is_bytes else " "
+        cleaned = space.join(words)
+        if started and (gap or chunk[:1].isspace()):
+            cleaned = space + cleaned
+        yield cleaned
+        started = True
+        gap = chunk[-1:].isspace()
+
+
+def read_chunks(file, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yields chunk_size reads from an open file until it is exhausted."""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def clean_file(src_path, dst_path, chunk_size=DEFAULT_CHUNK_SIZE, encoding="utf-8"):
+    """Writes the cleaned contents of src_path to dst_path, chunk by chunk.
+
+    encoding=None uses the bytes path (no decoding, ASCII whitespace rules).
+    Returns the number of characters (or bytes) written.
+    """
+    read_mode, write_mode = ("rb", "wb") if encoding is None else ("r", "w")
+    written = 0
+    with open(src_path, read_mode, encoding=encoding) as src, \
+            open(dst_path, write_mode, encoding=encoding) as dst:
+        for piece in clean_chunks(read_chunks(src, chunk_size)):
+            written += dst.write(piece)
+    return written
+
+
+if __name__ == "__main__":
+    text = "  This   is    a    messy    text   "
+    print("".join(clean_chunks([text[i:i + 4] for i in range(0, len(text), 4)])))
+    # => This is a messy text (same as clean_text(text))
+
+    print(b"".join(clean_chunks([b"  bytes\t\tare", b"  fine\x1ctoo \n"])))
+    # => b'bytes are fine too'
+
+    import os
+    import tempfile
+    directory = tempfile.mkdtemp()
+    src, dst = os.path.join(directory, "messy.txt"), os.path.join(directory, "clean.txt")
+    with open(src, "w") as f:
+        for i in range(100000):
+            f.write("word{}  \n\t ".format(i))
+    clean_file(src, dst, chunk_size=4096, encoding=None)
+    with open(src) as f, open(dst) as g:
+        print(g.read() == clean_text(f.read()))  # => True
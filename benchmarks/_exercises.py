@@ -0,0 +1,53 @@
+# Helpers shared by the benchmark scripts.
+
+import ast
+import os
+import sys
+import types
+
+EXERCISE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "excercise")
+DEFINITIONS = (ast.Import, ast.ImportFrom, ast.FunctionDef, ast.ClassDef)
+
+
+def load_definitions(path, module_name):
+    """Returns a module with only the imports, functions and classes of the
+    Python file at path; the rest of its top-level code is not run."""
+    with open(path) as f:
+        tree = ast.parse(f.read(), path)
+    tree.body = [node for node in tree.body if isinstance(node, DEFINITIONS)]
+    module = types.ModuleType(module_name)
+    module.__file__ = path
+    exec(compile(tree, path, "exec"), module.__dict__)
+    return module
+
+
+def load_exercise(module_name):
+    """Returns the functions and classes defined in excercise/<module_name>.py.
+
+    The exercise files print demo output (and exercise_01 raises) at import
+    time, so only the imports and def/class statements are executed.
+    """
+    return load_definitions(os.path.join(EXERCISE_DIR, module_name + ".py"), module_name)
+
+
+BASICS_DIR = os.path.join(os.path.dirname(EXERCISE_DIR), "basics")
+
+
+def add_lesson_path(chapter):
+    """Makes the basics/<chapter> lesson modules importable the way they
+    import each other (they expect their own directory on sys.path)."""
+    directory = os.path.join(BASICS_DIR, str(chapter))
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+
+
+def load_lesson(chapter, file_name):
+    """Returns the functions and classes defined in basics/<chapter>/<file_name>,
+    whose names (like 8_String_Manipulation.py) cannot be imported."""
+    path = os.path.join(BASICS_DIR, str(chapter), file_name)
+    return load_definitions(path, os.path.splitext(file_name)[0])
+
+
+def add_lesson_6_path():
+    add_lesson_path(6)
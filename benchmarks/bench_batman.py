@@ -0,0 +1,50 @@
+# bench_batman.py
+#
+# Builds N Batman objects three ways and reports time and tracemalloc peak:
+# the dict-based Batman from basics/6/Batman.py, SlottedBatman from
+# basics/6/slotted.py, and SlottedBatman through cached_factory.
+#
+#   python -m benchmarks.bench_batman --count 1000000
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks._exercises import add_lesson_6_path
+
+add_lesson_6_path()
+
+from Batman import Batman  # noqa: E402
+from slotted import SlottedBatman, cached_factory  # noqa: E402
+
+
+def measure(label, build, count):
+    # Time and memory come from separate runs: tracemalloc slows down every
+    # allocation and would distort the timing.
+    gc.collect()
+    start = time.perf_counter()
+    heroes = [build() for _ in range(count)]
+    elapsed = time.perf_counter() - start
+    del heroes
+    gc.collect()
+    tracemalloc.start()
+    heroes = [build() for _ in range(count)]
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("{:<28} {:>8.3f}s   peak {:>9.1f} MiB   ({:.0f} bytes/object)".format(
+        label, elapsed, peak / 2 ** 20, peak / len(heroes)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batman construction benchmark")
+    parser.add_argument("--count", type=int, default=10 ** 6)
+    args = parser.parse_args(argv)
+    print("{} Batman objects".format(args.count))
+    measure("Batman (dict)", Batman, args.count)
+    measure("SlottedBatman", SlottedBatman, args.count)
+    measure("cached_factory(SlottedBatman)", cached_factory(SlottedBatman), args.count)
+
+
+if __name__ == "__main__":
+    main()
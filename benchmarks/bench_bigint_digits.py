@@ -0,0 +1,61 @@
+# bench_bigint_digits.py
+#
+# Compares the scalar first_digit / reverse_number exercises against the
+# big-integer mode in excercise/digits.py for numbers from 10 to 10**6 digits.
+#
+#   python -m benchmarks.bench_bigint_digits
+#   python -m benchmarks.bench_bigint_digits --max-digits 100000
+
+import argparse
+import random
+import sys
+import time
+
+from benchmarks._exercises import load_exercise
+from excercise.digits import first_digit_big, pow10, reverse_number_big
+
+
+def time_call(func, n):
+    # Start every measurement cold so cached powers of ten are paid for.
+    pow10.cache_clear()
+    start = time.perf_counter()
+    func(n)
+    return time.perf_counter() - start
+
+
+def random_int(digits, rng):
+    # Built from cached powers so making the input is not the slow part.
+    return rng.randrange(pow10(digits - 1), pow10(digits))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Big-integer digit benchmark")
+    parser.add_argument("--max-digits", type=int, default=10 ** 6)
+    parser.add_argument("--loop-limit", type=int, default=10 ** 5,
+                        help="largest size to run the divide-by-10 loop on (it is quadratic)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    first_digit = load_exercise("exercise_02").first_digit
+    reverse_number = load_exercise("exercise_03").reverse_number
+    str_limit = sys.get_int_max_str_digits() if hasattr(sys, "get_int_max_str_digits") else 0
+    rng = random.Random(args.seed)
+
+    print("{:>9} {:>14} {:>14} {:>16} {:>16}".format(
+        "digits", "first_digit", "first_big", "reverse_number", "reverse_big"))
+    digits = 10
+    while digits <= args.max_digits:
+        n = random_int(digits, rng)
+        loop = ("{:.6f}".format(time_call(first_digit, n))
+                if digits <= args.loop_limit else "skipped")
+        if str_limit and digits > str_limit:
+            via_str = "str limit"
+        else:
+            via_str = "{:.6f}".format(time_call(reverse_number, n))
+        print("{:>9} {:>14} {:>14.6f} {:>16} {:>16.6f}".format(
+            digits, loop, time_call(first_digit_big, n), via_str, time_call(reverse_number_big, n)))
+        digits *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# bench_bounded_queue.py
+#
+# Drains a BoundedQueue fed by a producer thread, one dequeue() per item
+# versus dequeue_batch(), to show the per-item locking cost that batching saves.
+#
+#   python -m benchmarks.bench_bounded_queue --items 1000000 --batch 256
+
+import argparse
+import threading
+import time
+
+from excercise.bounded_queue import BoundedQueue
+
+
+def run(items, maxsize, drain):
+    q = BoundedQueue(maxsize)
+    producer = threading.Thread(target=lambda: [q.enqueue(i) for i in range(items)])
+    start = time.perf_counter()
+    producer.start()
+    drain(q, items)
+    producer.join()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="BoundedQueue drain benchmark")
+    parser.add_argument("--items", type=int, default=10 ** 6)
+    parser.add_argument("--maxsize", type=int, default=4096)
+    parser.add_argument("--batch", type=int, default=256)
+    args = parser.parse_args(argv)
+
+    def one_by_one(q, items):
+        for _ in range(items):
+            q.dequeue()
+
+    def batched(q, items):
+        taken = 0
+        while taken < items:
+            taken += len(q.dequeue_batch(args.batch))
+
+    # Producer and consumer share the lock, so time the drain on a full queue
+    # as well: that isolates the consumer's own cost per item.
+    def prefilled(drain):
+        q = BoundedQueue(args.items)
+        for i in range(args.items):
+            q.enqueue(i)
+        start = time.perf_counter()
+        drain(q, args.items)
+        return time.perf_counter() - start
+
+    for label, drain in (("dequeue()", one_by_one),
+                         ("dequeue_batch({})".format(args.batch), batched)):
+        print("{:<20} with producer {:>7.3f}s   prefilled {:>7.3f}s".format(
+            label, run(args.items, args.maxsize, drain), prefilled(drain)))
+
+
+if __name__ == "__main__":
+    main()
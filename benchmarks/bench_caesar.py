@@ -0,0 +1,77 @@
+# bench_caesar.py
+#
+# Enciphers --size bytes of ASCII text with a per-character loop (the obvious
+# way to write caesar_cipher) and with the translation tables of
+# excercise/cipher.py: str.translate, bytes.translate and the chunked file
+# mode. The loop is timed on --loop-size bytes (default: the same size) since
+# it is the slow one.
+#
+#   python -m benchmarks.bench_caesar --size 100000000
+
+import argparse
+import os
+import random
+import string
+import tempfile
+import time
+
+from excercise.cipher import caesar_cipher, caesar_cipher_file
+
+
+def per_character(text, shift):
+    result = []
+    for char in text:
+        if "a" <= char <= "z":
+            result.append(chr((ord(char) - 97 + shift) % 26 + 97))
+        elif "A" <= char <= "Z":
+            result.append(chr((ord(char) - 65 + shift) % 26 + 65))
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def report(label, size, elapsed):
+    print("{:<24} {:>8.3f}s {:>10.1f} MB/s".format(label, elapsed, size / elapsed / 1e6))
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Caesar cipher throughput benchmark")
+    parser.add_argument("--size", type=int, default=100 * 10 ** 6)
+    parser.add_argument("--loop-size", type=int, default=None)
+    parser.add_argument("--shift", type=int, default=3)
+    args = parser.parse_args(argv)
+    rng = random.Random(0)
+    alphabet = string.ascii_letters + " .,!\n"
+    block = "".join(rng.choice(alphabet) for _ in range(1 << 16))
+    text = (block * (args.size // len(block) + 1))[:args.size]
+    loop_size = args.loop_size or args.size
+    print("{} bytes (per-character loop on {})".format(args.size, loop_size))
+
+    expected, elapsed = timed(lambda: per_character(text[:loop_size], args.shift))
+    report("per-character loop", loop_size, elapsed)
+
+    result, elapsed = timed(lambda: caesar_cipher(text, args.shift))
+    report("str.translate", args.size, elapsed)
+    assert result[:loop_size] == expected
+
+    data = text.encode("ascii")
+    result, elapsed = timed(lambda: caesar_cipher(data, args.shift))
+    report("bytes.translate", args.size, elapsed)
+    assert result[:loop_size] == expected.encode("ascii")
+
+    with tempfile.TemporaryDirectory() as directory:
+        src, dst = os.path.join(directory, "plain"), os.path.join(directory, "secret")
+        with open(src, "wb") as f:
+            f.write(data)
+        _, elapsed = timed(lambda: caesar_cipher_file(src, dst, args.shift))
+        report("file (1 MiB chunks)", args.size, elapsed)
+
+
+if __name__ == "__main__":
+    main()
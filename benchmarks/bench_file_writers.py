@@ -0,0 +1,115 @@
+# bench_file_writers.py
+#
+# Throughput of the writers in basics/7/durable_files.py against the plain
+# open() patterns of basics/7/7_5_file_handling.py, in a temporary directory
+# (use --dir to put it on the disk you care about: fsync cost depends on it).
+#
+# append: --count lines of --line-size bytes
+#   open('a') per line      the lesson's pattern, no fsync
+#   os.write + fsync        durable after every line
+#   AppendWriter            buffered, fsync grouped by size/time window
+#
+# replace: --replaces rewrites of a --file-size file
+#   open('w')               truncate and write, not atomic or durable
+#   atomic_write            temp file, fsync, rename
+#
+#   python -m benchmarks.bench_file_writers --count 100000
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks._exercises import add_lesson_path
+
+add_lesson_path(7)
+
+from durable_files import AppendWriter, atomic_write  # noqa: E402
+
+
+def report(label, count, nbytes, elapsed, extra=""):
+    print("{:<24} {:>10.0f} ops/s {:>9.1f} MiB/s {}".format(
+        label, count / elapsed, nbytes / elapsed / 2 ** 20, extra))
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def bench_append(directory, count, line, fsync_count):
+    path = os.path.join(directory, "append.log")
+    data = line.encode()
+
+    def open_per_line():
+        for _ in range(count):
+            with open(path, "a") as file:
+                file.write(line)
+    elapsed, _ = timed(open_per_line)
+    report("open('a') per line", count, count * len(data), elapsed)
+    os.remove(path)
+
+    # Syncing every line is slow enough that a smaller count gives the rate.
+    def fsync_every_line():
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            for _ in range(fsync_count):
+                os.write(fd, data)
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+    elapsed, _ = timed(fsync_every_line)
+    report("os.write + fsync", fsync_count, fsync_count * len(data), elapsed,
+           "({} fsyncs)".format(fsync_count))
+    os.remove(path)
+
+    def append_writer():
+        with AppendWriter(path) as writer:
+            for _ in range(count):
+                writer.write(data)
+        return writer.fsyncs
+    elapsed, fsyncs = timed(append_writer)
+    report("AppendWriter", count, count * len(data), elapsed, "({} fsyncs)".format(fsyncs))
+    os.remove(path)
+
+
+def bench_replace(directory, replaces, size):
+    path = os.path.join(directory, "replace.txt")
+    data = "x" * (size - 1) + "\n"
+
+    def plain():
+        for _ in range(replaces):
+            with open(path, "w") as file:
+                file.write(data)
+    elapsed, _ = timed(plain)
+    report("open('w')", replaces, replaces * size, elapsed)
+
+    def atomic():
+        for _ in range(replaces):
+            atomic_write(path, data)
+    elapsed, _ = timed(atomic)
+    report("atomic_write", replaces, replaces * size, elapsed)
+    os.remove(path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="append and replace writer benchmark")
+    parser.add_argument("--count", type=int, default=100000, help="lines to append")
+    parser.add_argument("--line-size", type=int, default=100)
+    parser.add_argument("--fsync-count", type=int, default=1000,
+                        help="lines to append in the fsync-every-line case")
+    parser.add_argument("--replaces", type=int, default=200)
+    parser.add_argument("--file-size", type=int, default=1 << 20)
+    parser.add_argument("--dir", help="directory to write in (default: a temporary one)")
+    args = parser.parse_args(argv)
+    line = "x" * (args.line_size - 1) + "\n"
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        print("append: {} lines of {} bytes".format(args.count, args.line_size))
+        bench_append(directory, args.count, line, args.fsync_count)
+        print("replace: {} files of {} bytes".format(args.replaces, args.file_size))
+        bench_replace(directory, args.replaces, args.file_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# bench_output_sink.py
+#
+# Has N humans say() a line, once with the default print() and once through
+# a BufferedSink, writing to an unbuffered /dev/null file behind a
+# line-buffered text stream (which is how stdout behaves on a terminal).
+# Every write that reaches the file is one write system call, so the counts
+# show how many syscalls each approach costs.
+#
+#   python -m benchmarks.bench_output_sink --count 1000000
+
+import argparse
+import contextlib
+import io
+import os
+import time
+
+from benchmarks._exercises import add_lesson_6_path
+
+add_lesson_6_path()
+
+from human.Human import Human  # noqa: E402
+from human.sinks import BufferedSink  # noqa: E402
+
+
+class CountingFile(io.FileIO):
+    """An unbuffered file that counts its write() calls."""
+
+    def __init__(self, path):
+        super().__init__(path, "w")
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+def _terminal_like():
+    raw = CountingFile(os.devnull)
+    stream = io.TextIOWrapper(io.BufferedWriter(raw), line_buffering=True)
+    return raw, stream
+
+
+def measure(label, people, sink):
+    raw, stream = _terminal_like()
+    Human.sink = sink(stream) if sink else None
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(stream):
+        for person in people:
+            person.say("hello")
+        if Human.sink is not None:
+            Human.sink.flush()
+    elapsed = time.perf_counter() - start
+    Human.sink = None
+    stream.close()
+    print("{:<26} {:>8.3f}s   {:>9} write syscalls".format(label, elapsed, raw.writes))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Human.say output sink benchmark")
+    parser.add_argument("--count", type=int, default=10 ** 6)
+    parser.add_argument("--max-chars", type=int, default=1 << 16)
+    args = parser.parse_args(argv)
+    people = [Human("Human{}".format(i % 1000)) for i in range(args.count)]
+    print("{} calls to say()".format(args.count))
+    measure("print()", people, None)
+    measure("BufferedSink({})".format(args.max_chars), people,
+            lambda stream: BufferedSink(stream, max_chars=args.max_chars))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# bench_persistent.py
+#
+# Undo-history workload: push N items and keep a snapshot every --every
+# operations. The mutable Stack/Queue from exercise_05.py need
+# copy.deepcopy for each snapshot; the persistent versions just keep the
+# current version. Reports time and the memory retained by all snapshots.
+#
+#   python -m benchmarks.bench_persistent --items 20000 --every 100
+
+import argparse
+import copy
+import time
+import tracemalloc
+
+from benchmarks._exercises import load_exercise
+from excercise.persistent import PersistentQueue, PersistentStack
+
+
+def snapshot_mutable(cls, add, items, every):
+    container, snapshots = cls(), []
+    for i in range(items):
+        getattr(container, add)(i)
+        if i % every == 0:
+            snapshots.append(copy.deepcopy(container))
+    return snapshots
+
+
+def snapshot_persistent(cls, add, items, every):
+    version, snapshots = cls(), []
+    for i in range(items):
+        version = getattr(version, add)(i)
+        if i % every == 0:
+            snapshots.append(version)
+    return snapshots
+
+
+def measure(label, func, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    snapshots = func(*args)
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print("{:<34} {:>8.3f}s   retained {:>9.2f} MiB   peak {:>9.2f} MiB   ({} snapshots)".format(
+        label, elapsed, retained / 2 ** 20, peak / 2 ** 20, len(snapshots)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="deepcopy snapshots vs persistent versions")
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--every", type=int, default=100)
+    args = parser.parse_args(argv)
+    ex05 = load_exercise("exercise_05")
+
+    measure("Stack + deepcopy", snapshot_mutable, ex05.Stack, "push", args.items, args.every)
+    measure("PersistentStack", snapshot_persistent, PersistentStack, "push",
+            args.items, args.every)
+    measure("Queue + deepcopy", snapshot_mutable, ex05.Queue, "enqueue", args.items, args.every)
+    measure("PersistentQueue", snapshot_persistent, PersistentQueue, "enqueue",
+            args.items, args.every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# bench_priority_queue.py
+#
+# A scheduler-style workload (push N tasks, reprioritise many of them, then
+# drain) run on heapq with lazy tombstones and on IndexedPriorityQueue.
+#
+#   python -m benchmarks.bench_priority_queue --tasks 200000 --updates 1000000
+
+import argparse
+import heapq
+import itertools
+import random
+import time
+
+from excercise.priority_queue import IndexedPriorityQueue
+
+REMOVED = object()
+
+
+def run_heapq(priorities, updates):
+    heap, entries, counter = [], {}, itertools.count()
+    for task, priority in enumerate(priorities):
+        entry = [priority, next(counter), task]
+        entries[task] = entry
+        heapq.heappush(heap, entry)
+    peak = len(heap)
+    for task, priority in updates:
+        # Tombstone the old entry and push a new one; the heap keeps both.
+        entries[task][-1] = REMOVED
+        entry = [priority, next(counter), task]
+        entries[task] = entry
+        heapq.heappush(heap, entry)
+        peak = max(peak, len(heap))
+    drained = 0
+    while heap:
+        if heapq.heappop(heap)[-1] is not REMOVED:
+            drained += 1
+    return drained, peak
+
+
+def run_indexed(priorities, updates):
+    queue, handles = IndexedPriorityQueue.heapify(enumerate(priorities))
+    for task, priority in updates:
+        queue.update_priority(handles[task], priority)
+    peak = len(queue)
+    drained = 0
+    while not queue.is_empty():
+        queue.pop()
+        drained += 1
+    return drained, peak
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="heapq with tombstones vs IndexedPriorityQueue")
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--updates", type=int, default=500000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    rng = random.Random(args.seed)
+    priorities = [rng.random() for _ in range(args.tasks)]
+    updates = [(rng.randrange(args.tasks), rng.random()) for _ in range(args.updates)]
+
+    for label, run in (("heapq + tombstones", run_heapq), ("IndexedPriorityQueue", run_indexed)):
+        start = time.perf_counter()
+        drained, peak = run(priorities, updates)
+        print("{:<22} {:>8.3f}s   drained {}   peak heap size {}".format(
+            label, time.perf_counter() - start, drained, peak))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# bench_typed_stack.py
+#
+# Compares the list-backed Stack from exercise_05.py with TypedStack:
+# push/pop time and the memory held by N integer frames.
+#
+#   python -m benchmarks.bench_typed_stack --size 10000000
+
+import argparse
+from array import array
+import time
+import tracemalloc
+
+from benchmarks._exercises import load_exercise
+from excercise.typed_stack import TypedStack
+
+BATCH = 4096
+
+
+def measure(label, build, drain):
+    tracemalloc.start()
+    start = time.perf_counter()
+    stack = build()
+    build_time = time.perf_counter() - start
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    start = time.perf_counter()
+    drain(stack)
+    drain_time = time.perf_counter() - start
+    print("{:<30} push {:>8.3f}s   pop {:>8.3f}s   memory {:>10.1f} MiB".format(
+        label, build_time, drain_time, held / 2 ** 20))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stack vs TypedStack benchmark")
+    parser.add_argument("--size", type=int, default=10 ** 6)
+    args = parser.parse_args(argv)
+    size = args.size
+    Stack = load_exercise("exercise_05").Stack
+    # Values above 256 so the list really holds one boxed int per frame.
+    first = 1000
+
+    def build_list():
+        s = Stack()
+        for i in range(first, first + size):
+            s.push(i)
+        return s
+
+    def drain_list(s):
+        while not s.is_empty():
+            s.pop()
+
+    def build_typed():
+        s = TypedStack()
+        for i in range(first, first + size):
+            s.push(i)
+        return s
+
+    # Frames for the bulk test arrive as ready-made arrays, as they would
+    # from another TypedStack or a socket buffer.
+    source = array("q", range(first, first + size))
+
+    def build_typed_bulk():
+        s = TypedStack()
+        for i in range(0, size, BATCH):
+            s.push_many(source[i:i + BATCH])
+        return s
+
+    def drain_typed_bulk(s):
+        while len(s) >= BATCH:
+            s.pop_many(BATCH)
+        s.pop_many(len(s))
+
+    print("{} integer frames".format(size))
+    measure("Stack (list)", build_list, drain_list)
+    measure("TypedStack push/pop", build_typed, drain_list)
+    measure("TypedStack push_many/pop_many", build_typed_bulk, drain_typed_bulk)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# bench_validators.py
+#
+# Checks --rows random emails and passwords with the one-at-a-time functions
+# of basics/8/8_String_Manipulation.py and with the batch functions of
+# basics/8/bulk_validation.py, verifies that both give identical results and
+# reports rows/sec. A few rows contain non-ASCII characters to exercise the
+# fallback path.
+#
+#   python -m benchmarks.bench_validators --rows 1000000
+#   python -m benchmarks.bench_validators --rows 10000000 --workers 8
+
+import argparse
+import random
+import string
+import time
+
+from benchmarks._exercises import add_lesson_path, load_lesson
+
+add_lesson_path(8)
+
+from bulk_validation import check_passwords, validate_emails  # noqa: E402
+
+ALPHABET = string.ascii_letters + string.digits + "@.-_!"
+
+
+def random_strings(count, rng, min_len=4, max_len=16):
+    rows = []
+    for i in range(count):
+        text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(min_len, max_len)))
+        rows.append(text + "É" if i % 1000 == 0 else text)
+    return rows
+
+
+def timed(label, rows, func):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print("{:<34} {:>8.3f}s {:>12.0f} rows/s".format(label, elapsed, rows / elapsed))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="bulk email/password validation benchmark")
+    parser.add_argument("--rows", type=int, default=10 ** 6)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="process pool size; the pool is always used when given")
+    args = parser.parse_args(argv)
+    lesson = load_lesson(8, "8_String_Manipulation.py")
+    rng = random.Random(0)
+    emails = [s.replace("-", "@", 1) for s in random_strings(args.rows, rng, 6, 24)]
+    passwords = random_strings(args.rows, rng)
+    pool = {} if args.workers is None else {"workers": args.workers, "parallel_threshold": 0}
+    print("{} rows".format(args.rows))
+
+    expected = timed("is_valid_email per row", args.rows,
+                     lambda: [lesson.is_valid_email(e) for e in emails])
+    got = timed("validate_emails", args.rows, lambda: validate_emails(emails, **pool))
+    assert got == expected, "validate_emails differs from is_valid_email"
+
+    expected = timed("check_password_strength per row", args.rows,
+                     lambda: [lesson.check_password_strength(p) for p in passwords])
+    got = timed("check_passwords", args.rows, lambda: check_passwords(passwords, **pool))
+    assert got == expected, "check_passwords differs from check_password_strength"
+
+
+if __name__ == "__main__":
+    main()
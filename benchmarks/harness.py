@@ -0,0 +1,338 @@
+# harness.py
+#
+# Benchmark harness and regression gate for the excercise package.
+#
+# Every case is timed at input sizes 10, 100, ... up to --max-size after a
+# warm-up pass. Ops are run in blocks of --block; each block is timed with
+# perf_counter_ns, giving p50/p99 of the per-op time within a block.
+#
+# A repeat sets the case up and runs all its ops again and again (one round
+# each) until --min-time seconds have been timed, or MAX_ROUNDS rounds. The
+# suite makes --repeat passes over every case and size, so the repeats of
+# one case are spread over the whole run and a slow spell of the machine
+# only spoils some of them. The reported ops/sec is the best repeat, and
+# p50/p99 the median over repeats. A size too small to reach --min-time
+# within MAX_ROUNDS is still reported but marked as not gated, and compare
+# ignores it.
+#
+#   python -m benchmarks.harness run --out results.json
+#   python -m benchmarks.harness run --out new.json --baseline results.json --threshold 0.15
+#   python -m benchmarks.harness compare new.json results.json --threshold 0.15
+#
+# compare (and run with --baseline) exits with status 1 when any gated
+# case's ops/sec fell more than the threshold below the baseline.
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+
+from benchmarks._exercises import load_exercise
+
+DEFAULT_THRESHOLD = 0.15
+DEFAULT_REPEAT = 10
+MIN_TIME = 0.02    # seconds of timed ops per repeat
+MAX_ROUNDS = 1000
+WARMUP_OPS = 10000
+
+
+def _random_ints(size, rng):
+    return [rng.randrange(-10 ** 12, 10 ** 12) for _ in range(size)]
+
+
+# Each case is setup(size, rng) -> run, where run(start, stop) performs ops
+# start..stop-1. setup is called again before every round and is not timed.
+# A setup with a `block` attribute overrides the block size; None means all
+# `size` ops in one run() call.
+
+def _calls(func):
+    def setup(size, rng):
+        data = _random_ints(size, rng)
+
+        def run(start, stop):
+            for n in data[start:stop]:
+                func(n)
+        return run
+    return setup
+
+
+def _max_of_numbers(func):
+    def setup(size, rng):
+        data = _random_ints(size, rng)
+
+        def run(start, stop):
+            func(*data[start:stop])
+        return run
+    # One call with all `size` numbers as arguments, so the call itself scales.
+    setup.block = None
+    return setup
+
+
+def _push(cls, method):
+    def setup(size, rng):
+        container = cls()
+        push = getattr(container, method)
+
+        def run(start, stop):
+            for i in range(start, stop):
+                push(i)
+        return run
+    return setup
+
+
+def _pop(cls, fill, method):
+    def setup(size, rng):
+        container = cls()
+        for i in range(size):
+            getattr(container, fill)(i)
+        pop = getattr(container, method)
+
+        def run(start, stop):
+            for _ in range(start, stop):
+                pop()
+        return run
+    return setup
+
+
+def _tree_build(cls):
+    def setup(size, rng):
+        nodes = [None] * size
+
+        def run(start, stop):
+            # Grow a complete binary tree: node i hangs under node (i - 1) // 2.
+            for i in range(start, stop):
+                node = nodes[i] = cls(i)
+                if i:
+                    parent = nodes[(i - 1) // 2]
+                    if i % 2:
+                        parent.left = node
+                    else:
+                        parent.right = node
+        return run
+    return setup
+
+
+def default_cases():
+    """Returns {case name: setup} for the excercise package."""
+    ex05 = load_exercise("exercise_05")
+    return {
+        "last_digit": _calls(load_exercise("exercise_01").last_digit),
+        "first_digit": _calls(load_exercise("exercise_02").first_digit),
+        "reverse_number": _calls(load_exercise("exercise_03").reverse_number),
+        "max_of_numbers": _max_of_numbers(load_exercise("exercise_04").max_of_numbers),
+        "Stack.push": _push(ex05.Stack, "push"),
+        "Stack.pop": _pop(ex05.Stack, "push", "pop"),
+        "Queue.enqueue": _push(ex05.Queue, "enqueue"),
+        "Queue.dequeue": _pop(ex05.Queue, "enqueue", "dequeue"),
+        "TreeNode.build": _tree_build(ex05.TreeNode),
+    }
+
+
+def percentile(sorted_values, fraction):
+    """Returns the nearest-rank percentile of an already sorted list."""
+    index = min(int(fraction * len(sorted_values)), len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def _warm_up(setup, size, rng):
+    warmup = setup(min(size, WARMUP_OPS), rng)
+    warmup(0, min(size, WARMUP_OPS))
+
+
+def _time_repeat(setup, size, block, rng, min_time, max_rounds):
+    """Times one repeat: rounds of setup and ops until min_time seconds of
+    ops are timed (at least one round, at most max_rounds).
+
+    As in timeit, the garbage collector is off while ops are timed, so a
+    collection triggered by setup's allocations does not land in a block.
+    """
+    block = getattr(setup, "block", block) or size
+    timer = time.perf_counter_ns
+    min_ns = min_time * 1e9
+    per_op, timed_ns, rounds = [], 0, 0
+    while rounds == 0 or (timed_ns < min_ns and rounds < max_rounds):
+        run = setup(size, rng)
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for start in range(0, size, block):
+                stop = min(start + block, size)
+                began = timer()
+                run(start, stop)
+                elapsed = timer() - began
+                timed_ns += elapsed
+                per_op.append(elapsed / (stop - start))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        rounds += 1
+    per_op.sort()
+    return {
+        # A coarse clock can time a tiny size at 0 ns; count it as 1 ns so
+        # the JSON output never holds Infinity.
+        "ops_per_sec": size * rounds / (max(timed_ns, 1) / 1e9),
+        "p50_ns": percentile(per_op, 0.50),
+        "p99_ns": percentile(per_op, 0.99),
+        "timed_ns": timed_ns,
+        "gated": timed_ns >= min_ns,
+    }
+
+
+def _summarize(repeats):
+    return {
+        "ops_per_sec": max(r["ops_per_sec"] for r in repeats),
+        "p50_ns": statistics.median(r["p50_ns"] for r in repeats),
+        "p99_ns": statistics.median(r["p99_ns"] for r in repeats),
+        "timed_ns": sum(r["timed_ns"] for r in repeats),
+        "gated": all(r["gated"] for r in repeats),
+    }
+
+
+def measure(setup, size, repeat=DEFAULT_REPEAT, block=100, seed=0, min_time=MIN_TIME,
+            max_rounds=MAX_ROUNDS):
+    """Times one case at one size, its repeats back to back.
+
+    Returns ops_per_sec (of the best repeat), p50_ns and p99_ns (medians
+    over repeats), timed_ns (over all repeats) and gated: False when a
+    repeat hit max_rounds before min_time seconds were timed.
+    """
+    rng = random.Random(seed)
+    _warm_up(setup, size, rng)
+    return _summarize([_time_repeat(setup, size, block, rng, min_time, max_rounds)
+                       for _ in range(repeat)])
+
+
+def sizes_up_to(max_size, min_size=10):
+    size = min_size
+    while size <= max_size:
+        yield size
+        size *= 10
+
+
+def run_suite(cases, max_size=10 ** 5, repeat=DEFAULT_REPEAT, block=100, only=None, log=None,
+              min_time=MIN_TIME):
+    """Runs every case at every size and returns the JSON-ready report.
+
+    Makes `repeat` passes over all cases and sizes, timing one repeat of
+    each per pass; the stats are those of measure().
+    """
+    jobs = [(name, setup, size, random.Random(0))
+            for name, setup in cases.items() if not only or name in only
+            for size in sizes_up_to(max_size)]
+    repeats = {}
+    for number in range(repeat):
+        if log and repeat > 1:
+            log("pass {}/{}".format(number + 1, repeat))
+        for name, setup, size, rng in jobs:
+            if not number:
+                _warm_up(setup, size, rng)
+            repeats.setdefault((name, size), []).append(
+                _time_repeat(setup, size, block, rng, min_time, MAX_ROUNDS))
+    results = {}
+    for name, setup, size, rng in jobs:
+        stats = results.setdefault(name, {})[str(size)] = _summarize(repeats[name, size])
+        if log:
+            log("{:<16} {:>9} {:>14.0f} ops/s  p50 {:>9.0f} ns  p99 {:>9.0f} ns{}".format(
+                name, size, stats["ops_per_sec"], stats["p50_ns"], stats["p99_ns"],
+                "" if stats["gated"] else "  (too short, not gated)"))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "created": datetime.now(timezone.utc).isoformat(),
+            "repeat": repeat,
+            "block": block,
+            "min_time": min_time,
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold=DEFAULT_THRESHOLD):
+    """Returns a list of regressions of current against baseline.
+
+    A regression is any (case, size) present in both reports whose ops/sec is
+    more than threshold (a fraction, 0.10 = 10%) below the baseline's. Sizes
+    not gated in either report (timed too briefly to trust) are skipped.
+    """
+    regressions = []
+    for name, by_size in current["results"].items():
+        for size, stats in by_size.items():
+            base = baseline["results"].get(name, {}).get(size)
+            if base is None or not stats.get("gated", True) or not base.get("gated", True):
+                continue
+            ratio = stats["ops_per_sec"] / base["ops_per_sec"]
+            if ratio < 1 - threshold:
+                regressions.append({
+                    "case": name,
+                    "size": int(size),
+                    "baseline_ops_per_sec": base["ops_per_sec"],
+                    "ops_per_sec": stats["ops_per_sec"],
+                    "change": ratio - 1,
+                })
+    return regressions
+
+
+def report_regressions(regressions, threshold):
+    if not regressions:
+        print("No regressions beyond {:.0%}.".format(threshold))
+        return 0
+    for r in regressions:
+        print("REGRESSION {case} at size {size}: {baseline_ops_per_sec:.0f} -> "
+              "{ops_per_sec:.0f} ops/s ({change:+.1%})".format(**r))
+    return 1
+
+
+def _load_json(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="excercise package benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmarks and write JSON results")
+    run.add_argument("--out", help="file to write the JSON results to (default: stdout)")
+    run.add_argument("--max-size", type=int, default=10 ** 5,
+                     help="largest input size to time (default: 100000)")
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    run.add_argument("--block", type=int, default=100)
+    run.add_argument("--min-time", type=float, default=MIN_TIME,
+                     help="seconds of timed ops per repeat before a size is gated")
+    run.add_argument("--case", action="append", dest="cases", help="run only this case (repeatable)")
+    run.add_argument("--baseline", help="JSON results to compare against after the run")
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    cmp_ = commands.add_parser("compare", help="compare two JSON result files")
+    cmp_.add_argument("current")
+    cmp_.add_argument("baseline")
+    cmp_.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        regressions = compare(_load_json(args.current), _load_json(args.baseline), args.threshold)
+        return report_regressions(regressions, args.threshold)
+
+    report = run_suite(default_cases(), args.max_size, args.repeat, args.block, args.cases,
+                       log=lambda line: print(line, file=sys.stderr), min_time=args.min_time)
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if args.baseline:
+        regressions = compare(report, _load_json(args.baseline), args.threshold)
+        return report_regressions(regressions, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+# bounded_queue.py
+#
+# A bounded FIFO queue (see Queue in exercise_05.py) that threads and asyncio
+# coroutines can share. When the queue is full, enqueue blocks (or awaits)
+# until there is room, which gives producers backpressure; when it is empty,
+# dequeue blocks (or awaits) instead of spinning on is_empty().
+
+import asyncio
+import threading
+import time
+from collections import deque
+
+
+def _wake(future):
+    if not future.done():
+        future.set_result(None)
+
+
+class BoundedQueue:
+    """Thread-safe, asyncio-aware FIFO queue holding at most maxsize items.
+
+    Threads use enqueue/dequeue/dequeue_batch; coroutines use the *_async
+    methods, which never block the event loop. Both kinds of caller can use
+    the same queue at the same time. Like Queue, an empty (or full) queue
+    raises IndexError when the caller does not wait or its timeout expires.
+    """
+
+    def __init__(self, maxsize):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._data = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        # (loop, future) pairs for coroutines waiting on each condition.
+        self._async_getters = deque()
+        self._async_putters = deque()
+
+    def __len__(self):
+        return len(self._data)
+
+    def is_empty(self):
+        return not self._data
+
+    def is_full(self):
+        return len(self._data) >= self.maxsize
+
+    # Wake-ups. Both are called with the lock held, once per state change,
+    # and wake one waiting thread plus one waiting coroutine; whichever loses
+    # the race simply waits again.
+
+    def _item_added(self):
+        self._not_empty.notify()
+        self._wake_one(self._async_getters)
+
+    def _space_freed(self, count=1):
+        self._not_full.notify(count)
+        for _ in range(count):
+            if not self._wake_one(self._async_putters):
+                break
+
+    @staticmethod
+    def _wake_one(waiters):
+        while waiters:
+            loop, future = waiters.popleft()
+            if not future.done():
+                loop.call_soon_threadsafe(_wake, future)
+                return True
+        return False
+
+    # Thread API
+
+    def _wait(self, condition, ready, block, timeout, message):
+        """Waits on condition until ready() is true; the lock must be held."""
+        if ready():
+            return
+        if not block:
+            raise IndexError(message)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not ready():
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise IndexError(message)
+            condition.wait(remaining)
+
+    def enqueue(self, item, block=True, timeout=None):
+        """Adds item at the back, waiting up to timeout seconds for room."""
+        with self._lock:
+            self._wait(self._not_full, lambda: len(self._data) < self.maxsize,
+                       block, timeout, "enqueue to full queue")
+            self._data.append(item)
+            self._item_added()
+
+    def dequeue(self, block=True, timeout=None):
+        """Removes and returns the front item, waiting up to timeout seconds."""
+        with self._lock:
+            self._wait(self._not_empty, lambda: self._data,
+                       block, timeout, "dequeue from empty queue")
+            item = self._data.popleft()
+            self._space_freed()
+            return item
+
+    def dequeue_batch(self, max_n, timeout=None):
+        """Removes and returns up to max_n items from the front as a list.
+
+        Waits up to timeout seconds (None: forever, 0: not at all) for the
+        first item, then takes whatever is available without waiting for
+        more. The whole batch costs one lock round trip instead of max_n.
+        Returns an empty list if nothing arrived before the timeout.
+        """
+        if max_n < 1:
+            raise ValueError("max_n must be at least 1")
+        with self._lock:
+            try:
+                self._wait(self._not_empty, lambda: self._data,
+                           timeout != 0, timeout, "dequeue from empty queue")
+            except IndexError:
+                return []
+            return self._take(max_n)
+
+    def _take(self, max_n):
+        data = self._data
+        batch = [data.popleft() for _ in range(min(max_n, len(data)))]
+        self._space_freed(len(batch))
+        return batch
+
+    # asyncio API
+    #
+    # Coroutines must not block the event loop on self._lock while a thread
+    # holds it, so they take it with _acquire_async instead of `with`.
+
+    async def _acquire_async(self):
+        """Takes the lock without blocking the event loop.
+
+        Polls with non-blocking acquires, sleeping a little longer (up to
+        1 ms) after each miss; threads only hold the lock briefly. Always
+        ends holding the lock: a cancellation that arrives meanwhile is
+        re-raised once the lock is taken, so callers can release it in a
+        finally block.
+        """
+        delay, cancelled = 0, False
+        while not self._lock.acquire(blocking=False):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled = True
+            delay = min(delay * 2 or 1e-5, 1e-3)
+        if cancelled:
+            raise asyncio.CancelledError
+
+    async def _await_turn(self, waiters, timeout_at):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiters.append((loop, future))
+        # Release the lock while waiting; the caller re-checks afterwards.
+        self._lock.release()
+        error = None
+        try:
+            if timeout_at is None:
+                await future
+            else:
+                await asyncio.wait_for(future, max(timeout_at - loop.time(), 0))
+        except BaseException as exc:
+            error = exc
+        try:
+            await self._acquire_async()
+        except asyncio.CancelledError:
+            if error is None:
+                # Woken, but cancelled before we could use the wake-up.
+                self._wake_one(waiters)
+            raise
+        finally:
+            if error is not None:
+                try:
+                    waiters.remove((loop, future))
+                except ValueError:
+                    # Already popped by a wake-up that we can no longer use;
+                    # pass it on so the next waiter is not left stranded.
+                    self._wake_one(waiters)
+        if error is not None:
+            raise error
+
+    async def _async_wait(self, waiters, ready, timeout, message):
+        """Awaits until ready() is true; the lock must be held."""
+        loop = asyncio.get_running_loop()
+        timeout_at = None if timeout is None else loop.time() + timeout
+        while not ready():
+            try:
+                await self._await_turn(waiters, timeout_at)
+            except asyncio.TimeoutError:
+                raise IndexError(message) from None
+
+    async def enqueue_async(self, item, timeout=None):
+        """Awaitable enqueue; suspends the coroutine while the queue is full."""
+        try:
+            await self._acquire_async()
+            await self._async_wait(self._async_putters, lambda: len(self._data) < self.maxsize,
+                                   timeout, "enqueue to full queue")
+            self._data.append(item)
+            self._item_added()
+        finally:
+            self._lock.release()
+
+    async def dequeue_async(self, timeout=None):
+        """Awaitable dequeue; suspends the coroutine while the queue is empty."""
+        try:
+            await self._acquire_async()
+            await self._async_wait(self._async_getters, lambda: self._data,
+                                   timeout, "dequeue from empty queue")
+            item = self._data.popleft()
+            self._space_freed()
+            return item
+        finally:
+            self._lock.release()
+
+    async def dequeue_batch_async(self, max_n, timeout=None):
+        """Awaitable dequeue_batch; returns an empty list on timeout."""
+        if max_n < 1:
+            raise ValueError("max_n must be at least 1")
+        try:
+            await self._acquire_async()
+            try:
+                await self._async_wait(self._async_getters, lambda: self._data,
+                                       timeout, "dequeue from empty queue")
+            except IndexError:
+                return []
+            return self._take(max_n)
+        finally:
+            self._lock.release()
@@ -0,0 +1,75 @@
+# cipher.py
+#
+# caesar_cipher (exercises/exercise_08_string_manipulation.py) with
+# translation tables. A Caesar shift maps each letter to another letter and
+# leaves everything else alone, which is exactly what str.translate and
+# bytes.translate do in C. There are only 26 distinct shifts, so the tables
+# for all of them are built once at import; enciphering is then a single
+# translate() call.
+#
+# Letters are the ASCII letters; case is kept and other characters pass
+# through unchanged. Because UTF-8 never uses ASCII byte values inside a
+# multi-byte character, the bytes tables encipher UTF-8 text correctly
+# without decoding it, which is what the file mode relies on.
+
+import string
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def _rotate(letters, shift):
+    return letters[shift:] + letters[:shift]
+
+
+def _shifted():
+    lower, upper = string.ascii_lowercase, string.ascii_uppercase
+    for shift in range(26):
+        yield lower + upper, _rotate(lower, shift) + _rotate(upper, shift)
+
+
+STR_TABLES = tuple(str.maketrans(plain, shifted) for plain, shifted in _shifted())
+BYTES_TABLES = tuple(bytes.maketrans(plain.encode(), shifted.encode())
+                     for plain, shifted in _shifted())
+
+
+def caesar_cipher(text, shift):
+    """Shifts every ASCII letter in text (str or bytes-like) by shift places.
+
+    A negative shift deciphers: caesar_cipher(caesar_cipher(t, 3), -3) == t.
+    """
+    if isinstance(text, str):
+        return text.translate(STR_TABLES[shift % 26])
+    return bytes(text).translate(BYTES_TABLES[shift % 26])
+
+
+def caesar_cipher_stream(chunks, shift):
+    """Yields the enciphered form of each chunk of a stream.
+
+    str chunks give str; any other chunk (bytes, bytearray, memoryview) is
+    read as bytes and gives bytes. Each character is enciphered on its own,
+    so chunks can be cut anywhere.
+    """
+    str_table, bytes_table = STR_TABLES[shift % 26], BYTES_TABLES[shift % 26]
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            yield chunk.translate(str_table)
+        else:
+            # memoryview has no translate(); bytes() of a bytes object is free.
+            yield bytes(chunk).translate(bytes_table)
+
+
+def caesar_cipher_file(src_path, dst_path, shift, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Enciphers src_path into dst_path chunk by chunk, in constant memory.
+
+    The file is processed as bytes, so it can be any ASCII-compatible text
+    encoding (UTF-8 included). Returns the number of bytes written.
+    """
+    table = BYTES_TABLES[shift % 26]
+    written = 0
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            written += dst.write(chunk.translate(table))
+    return written
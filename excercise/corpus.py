@@ -0,0 +1,286 @@
+# corpus.py
+#
+# word_frequency and count_letters (exercises/exercise_08_string_manipulation.py)
+# for corpora too big for one string.
+#
+# A file is cut into one byte range per worker, each cut moved forward to the
+# next whitespace byte so no word is split between two ranges. Workers in a
+# process pool count their range chunk by chunk into one partial result each,
+# and the parent folds the partials into the first one with functools.reduce.
+# Each merge updates the running total in place, so every partial is merged
+# exactly once. The merging stays in the parent on purpose: sending partials
+# back through the pool would pickle every Counter (or 32 MB sketch) again,
+# which costs several times more than the merge itself.
+#
+# An exact count needs memory for every distinct word. For "the top N words"
+# of a huge vocabulary, HeavyHitters keeps a count-min sketch (a fixed-size
+# table of counters) plus a bounded set of candidate words instead.
+#
+# Files are read as bytes: words are split on ASCII whitespace, which never
+# occurs inside a UTF-8 encoded character, and decoded only at the end.
+
+import hashlib
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 1 << 22
+VOWELS = b"aeiou"
+
+# str.split() also splits on the separators \x1c-\x1f; bytes.split() does not.
+_SEPARATORS = bytes.maketrans(b"\x1c\x1d\x1e\x1f", b"    ")
+_WHITESPACE = re.compile(rb"[ \t\n\r\x0b\x0c\x1c-\x1f]")
+_ASCII_LETTERS = bytes(range(ord("A"), ord("Z") + 1)) + bytes(range(ord("a"), ord("z") + 1))
+_NOT_LETTERS = bytes(b for b in range(256) if b not in _ASCII_LETTERS)
+_LOWER = bytes.maketrans(_ASCII_LETTERS[:26], _ASCII_LETTERS[26:])
+
+
+def word_frequency(text):
+    """Returns {word: count} for the whitespace-separated words of text."""
+    return dict(Counter(text.split()))
+
+
+def _letter_counts(data):
+    letters = data.translate(_LOWER, _NOT_LETTERS)
+    vowels = sum(letters.count(vowel) for vowel in VOWELS)
+    return {"vowels": vowels, "consonants": len(letters) - vowels}
+
+
+def count_letters(text):
+    """Returns {'vowels': n, 'consonants': n} for the ASCII letters in text.
+
+    y counts as a consonant: count_letters("PYTHON") gives 1 vowel and 5
+    consonants.
+    """
+    return _letter_counts(text.encode("ascii", "ignore") if isinstance(text, str) else text)
+
+
+def split_offsets(path, parts):
+    """Returns byte offsets [0, ..., size] cutting path into up to parts ranges.
+
+    Every inner offset is at a whitespace byte, so no word spans two ranges.
+    """
+    size = os.path.getsize(path)
+    offsets = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            target = max(size * i // parts, offsets[-1])
+            f.seek(target)
+            position = target
+            while True:
+                block = f.read(1 << 16)
+                if not block:
+                    position = size
+                    break
+                match = _WHITESPACE.search(block)
+                if match:
+                    position += match.start()
+                    break
+                position += len(block)
+            if offsets[-1] < position < size:
+                offsets.append(position)
+    offsets.append(size)
+    return offsets
+
+
+def iter_words(path, start=0, end=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yields lists of the words (bytes) in path[start:end], one list per chunk."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        left = (os.path.getsize(path) if end is None else end) - start
+        carry = b""
+        while left > 0:
+            data = f.read(min(chunk_size, left))
+            if not data:
+                break
+            left -= len(data)
+            data = data.translate(_SEPARATORS)
+            words = data.split()
+            if carry:
+                if words and not data[:1].isspace():
+                    words[0] = carry + words[0]
+                else:
+                    words.insert(0, carry)
+                carry = b""
+            if words and left > 0 and not data[-1:].isspace():
+                carry = words.pop()
+            yield words
+        if carry:
+            yield [carry]
+
+
+class CountMinSketch:
+    """A depth x width table of counters giving over-estimates of counts.
+
+    Each word is hashed to one counter per row; its estimate is the smallest
+    of its counters. The error is at most about 2 * total / width with
+    probability 1 - 2 ** -depth. Hashes come from blake2b, not hash(), so
+    sketches built in different processes agree and can be added together.
+    """
+
+    def __init__(self, width=1 << 20, depth=4):
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype=np.int64)
+
+    def _columns(self, words):
+        digests = b"".join(hashlib.blake2b(word, digest_size=8).digest() for word in words)
+        hashes = np.frombuffer(digests, dtype="<u8")
+        h1, h2 = hashes & 0xFFFFFFFF, (hashes >> np.uint64(32)) | np.uint64(1)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+        # Double hashing: row i uses h1 + i * h2.
+        return ((h1 + rows * h2) % np.uint64(self.width)).astype(np.intp)
+
+    def add(self, words, counts):
+        """Adds counts[i] occurrences of words[i] and returns the new estimates."""
+        columns = self._columns(words)
+        counts = np.asarray(counts, dtype=np.int64)
+        for row in range(self.depth):
+            np.add.at(self.table[row], columns[row], counts)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+    def estimate(self, words):
+        columns = self._columns(words)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+    def merge(self, other):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("cannot merge sketches of different sizes")
+        self.table += other.table
+        return self
+
+
+class HeavyHitters:
+    """Approximate top words in bounded memory.
+
+    Counts go into a CountMinSketch; the `capacity` words with the highest
+    estimates are kept as candidates (pruned whenever there are twice as
+    many). Memory is the sketch plus at most 2 * capacity words, however
+    large the vocabulary. Reported counts are sketch estimates, which are
+    never below the true counts.
+    """
+
+    def __init__(self, capacity=1000, width=1 << 20, depth=4):
+        self.capacity = capacity
+        self.sketch = CountMinSketch(width, depth)
+        self.candidates = {}
+
+    def update(self, counts):
+        """Adds a {word: count} mapping (e.g. the Counter of one chunk)."""
+        if not counts:
+            return
+        words = list(counts)
+        estimates = self.sketch.add(words, [counts[word] for word in words])
+        self.candidates.update(zip(words, estimates.tolist()))
+        if len(self.candidates) > 2 * self.capacity:
+            self._prune()
+
+    def _prune(self):
+        top = sorted(self.candidates.items(), key=lambda item: item[1], reverse=True)
+        self.candidates = dict(top[:self.capacity])
+
+    def merge(self, other):
+        self.sketch.merge(other.sketch)
+        words = list(self.candidates.keys() | other.candidates.keys())
+        if words:
+            self.candidates = dict(zip(words, self.sketch.estimate(words).tolist()))
+            self._prune()
+        return self
+
+    def top(self, n):
+        """Returns the n (word, estimated count) pairs with the highest estimates."""
+        return sorted(self.candidates.items(), key=lambda item: (-item[1], item[0]))[:n]
+
+
+def _count_range(task):
+    path, start, end, chunk_size = task
+    counts = Counter()
+    for words in iter_words(path, start, end, chunk_size):
+        counts.update(words)
+    return counts
+
+
+def _heavy_range(task):
+    path, start, end, chunk_size, capacity, width, depth = task
+    hitters = HeavyHitters(capacity, width, depth)
+    for words in iter_words(path, start, end, chunk_size):
+        hitters.update(Counter(words))
+    return hitters
+
+
+def _letters_range(task):
+    path, start, end, chunk_size = task
+    totals = Counter()
+    with open(path, "rb") as f:
+        f.seek(start)
+        left = end - start
+        while left > 0:
+            data = f.read(min(chunk_size, left))
+            if not data:
+                break
+            left -= len(data)
+            totals.update(_letter_counts(data))
+    return totals
+
+
+def _merge_counters(first, second):
+    first.update(second)
+    return first
+
+
+def _merge_hitters(first, second):
+    return first.merge(second)
+
+
+def _map_reduce(path, work, merge, extra, workers, chunk_size):
+    workers = workers or os.cpu_count() or 1
+    offsets = split_offsets(path, workers)
+    tasks = [(path, start, end, chunk_size) + extra for start, end in zip(offsets, offsets[1:])]
+    if workers == 1 or len(tasks) == 1:
+        partials = [work(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            partials = list(pool.map(work, tasks))
+    return reduce(merge, partials) if partials else None
+
+
+def word_frequency_file(path, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, top_n=None,
+                        capacity=None, sketch_width=1 << 20, sketch_depth=4):
+    """Counts the words in a file with a pool of `workers` processes.
+
+    Without top_n, returns the exact {word: count} dict. With top_n, returns
+    the top_n approximate (word, count) pairs from HeavyHitters, keeping
+    `capacity` candidates (default 10 * top_n) in bounded memory.
+
+    Words that are not valid UTF-8 are decoded with U+FFFD replacement
+    characters; byte words that decode to the same str are counted together.
+    """
+    if top_n is None:
+        counts = _map_reduce(path, _count_range, _merge_counters, (), workers, chunk_size)
+        if counts is None:
+            return {}
+        return dict(_decode_counts(counts.items()))
+    extra = (capacity or 10 * top_n, sketch_width, sketch_depth)
+    hitters = _map_reduce(path, _heavy_range, _merge_hitters, extra, workers, chunk_size)
+    if hitters is None:
+        return []
+    counts = _decode_counts(hitters.candidates.items())
+    return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:top_n]
+
+
+def _decode_counts(items):
+    counts = Counter()
+    for word, count in items:
+        counts[word.decode("utf-8", "replace")] += count
+    return counts
+
+
+def count_letters_file(path, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """count_letters for a whole file, counted by a pool of processes."""
+    totals = _map_reduce(path, _letters_range, _merge_counters, (), workers, chunk_size)
+    totals = totals or {}
+    return {"vowels": totals.get("vowels", 0), "consonants": totals.get("consonants", 0)}
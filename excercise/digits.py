@@ -0,0 +1,232 @@
+# digits.py
+#
+# Batch versions of the digit exercises (last_digit, first_digit and
+# reverse_number from exercise_01.py - exercise_03.py). Each function takes a
+# NumPy integer/bool array or any iterable of integers and works on the whole
+# column at once instead of calling the scalar function once per row.
+#
+# first_digit_big and reverse_number_big handle the other extreme: a single
+# integer with hundreds of thousands of digits, where the scalar versions are
+# quadratic or hit CPython's int/str conversion limit.
+
+import decimal
+from functools import lru_cache
+from math import log10
+from numbers import Integral
+
+import numpy as np
+
+INT64_MAX = np.iinfo(np.int64).max
+
+# 10**0 .. 10**19 covers every magnitude an int64 can hold (|int64| <= 2**63).
+POWERS_OF_TEN = np.array([10 ** k for k in range(20)], dtype=np.uint64)
+MAX_DIGITS = 19
+
+
+def _require_integral(value):
+    """Returns value as an int, rejecting anything that is not an integer."""
+    if not isinstance(value, Integral):
+        raise TypeError("Input must be an integer, got {!r}.".format(value))
+    return int(value)
+
+
+def _coerce_like_int(value):
+    """Converts value the same way last_digit does (int() or TypeError)."""
+    try:
+        return int(value)
+    except ValueError:
+        raise TypeError("Input must be an integer or convertible to an integer.")
+
+
+def _to_int_list(values, coerce):
+    if isinstance(values, np.ndarray):
+        return [coerce(v) for v in values.ravel().tolist()]
+    return [coerce(v) for v in values]
+
+
+def _to_int64(values, coerce=_require_integral):
+    """Returns values as an int64 array, or None if they do not fit in int64.
+
+    NumPy integer and bool arrays are converted without a Python-level loop;
+    everything else goes through coerce() one element at a time.
+    """
+    if isinstance(values, np.ndarray):
+        if values.dtype == np.bool_ or np.issubdtype(values.dtype, np.signedinteger):
+            return values.astype(np.int64, copy=False)
+        if np.issubdtype(values.dtype, np.unsignedinteger):
+            if values.size and values.max() > INT64_MAX:
+                return None
+            return values.astype(np.int64)
+        if coerce is _coerce_like_int and np.issubdtype(values.dtype, np.floating):
+            if not np.isfinite(values).all():
+                raise TypeError("Input must be an integer or convertible to an integer.")
+            # int() truncates toward zero, and so does astype().
+            if values.size and np.abs(values).max() >= 2.0 ** 63:
+                return None
+            return values.astype(np.int64)
+    ints = _to_int_list(values, coerce)
+    try:
+        return np.array(ints, dtype=np.int64)
+    except OverflowError:
+        return None
+
+
+def _magnitudes(arr):
+    # astype(uint64) maps int64 min (-2**63) onto 2**63, where np.abs() would
+    # overflow, so this is the exact absolute value for every int64.
+    return np.abs(arr).astype(np.uint64)
+
+
+def last_digit_batch(values) -> np.ndarray:
+    """Returns the last digit of every integer in values."""
+    arr = _to_int64(values, _coerce_like_int)
+    if arr is None:
+        ints = _to_int_list(values, _coerce_like_int)
+        return np.array([abs(n) % 10 for n in ints], dtype=np.int64)
+    return (_magnitudes(arr) % np.uint64(10)).astype(np.int64)
+
+
+def first_digit_batch(values) -> np.ndarray:
+    """Returns the first digit of every integer in values.
+
+    The number of digits is found with a power-of-ten table lookup rather than
+    a float log10, which rounds wrongly for values such as 999999999999999999.
+    """
+    arr = _to_int64(values)
+    if arr is None:
+        ints = _to_int_list(values, _require_integral)
+        return np.array([first_digit_big(n) for n in ints], dtype=np.int64)
+    mags = _magnitudes(arr)
+    exponent = np.searchsorted(POWERS_OF_TEN, mags, side="right") - 1
+    # Zero has no power of ten below it; 0 // 10**0 keeps the answer at 0.
+    np.maximum(exponent, 0, out=exponent)
+    return (mags // POWERS_OF_TEN[exponent]).astype(np.int64)
+
+
+def reverse_number_batch(values) -> np.ndarray:
+    """Returns every integer in values with its digits reversed.
+
+    Reversal is done arithmetically on the whole column. A 19-digit int64 can
+    reverse to a number larger than int64 allows; in that case the result is
+    an object array of Python ints, matching reverse_number exactly.
+    """
+    arr = _to_int64(values)
+    if arr is None:
+        ints = _to_int_list(values, _require_integral)
+        return np.array([reverse_number_big(n) for n in ints], dtype=object)
+    mags = _magnitudes(arr)
+    digit_counts = np.searchsorted(POWERS_OF_TEN, mags, side="right")
+    # Reverse every row as a 19-digit number (|int64| never has more digits),
+    # then drop the zeros that the padding left at the end of short rows.
+    reversed_mags = np.zeros_like(mags)
+    ten = np.uint64(10)
+    for _ in range(MAX_DIGITS):
+        mags, digit = np.divmod(mags, ten)
+        reversed_mags *= ten
+        reversed_mags += digit
+    reversed_mags //= POWERS_OF_TEN[MAX_DIGITS - digit_counts]
+    signs = np.where(arr < 0, -1, 1)
+    if reversed_mags.size and reversed_mags.max() > INT64_MAX:
+        return np.array([s * int(r) for s, r in zip(signs.tolist(), reversed_mags.tolist())],
+                        dtype=object)
+    return signs * reversed_mags.astype(np.int64)
+
+
+# Big-integer mode
+#
+# Ints below this many bits/digits are converted directly; above it the work
+# is split in half recursively so that every step is a multiplication of two
+# similar-sized numbers, which CPython and libmpdec do in subquadratic time.
+BIG_BIT_LIMIT = 1024
+BIG_DIGIT_LIMIT = 1000
+
+_EXACT_CONTEXT = decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX,
+                                 Emin=decimal.MIN_EMIN, traps=[decimal.Inexact])
+
+
+@lru_cache(maxsize=None)
+def pow10(k: int) -> int:
+    """Returns 10**k, caching it and the halves it was built from."""
+    if k <= 64:
+        return 10 ** k
+    half = pow10(k // 2)
+    result = half * half
+    return result * 10 if k % 2 else result
+
+
+@lru_cache(maxsize=None)
+def _decimal_pow2(k: int) -> decimal.Decimal:
+    if k <= BIG_BIT_LIMIT:
+        return _EXACT_CONTEXT.power(2, k)
+    half = _decimal_pow2(k // 2)
+    result = _EXACT_CONTEXT.multiply(half, half)
+    return _EXACT_CONTEXT.multiply(result, 2) if k % 2 else result
+
+
+def _decimal_digits(n: int) -> str:
+    """Returns the decimal digits of a non-negative int without str(int)."""
+
+    def convert(n, bits):
+        if bits <= BIG_BIT_LIMIT:
+            return decimal.Decimal(n)
+        low_bits = bits // 2
+        hi = n >> low_bits
+        lo = n - (hi << low_bits)
+        hi_part = _EXACT_CONTEXT.multiply(convert(hi, bits - low_bits), _decimal_pow2(low_bits))
+        return _EXACT_CONTEXT.add(hi_part, convert(lo, low_bits))
+
+    return str(convert(n, n.bit_length()))
+
+
+def _int_from_digits(digits: str) -> int:
+    """Returns the int spelled by a string of decimal digits without int(str)."""
+    if len(digits) <= BIG_DIGIT_LIMIT:
+        return int(digits)
+    low = len(digits) // 2
+    return _int_from_digits(digits[:-low]) * pow10(low) + _int_from_digits(digits[-low:])
+
+
+def digit_count(n: int) -> int:
+    """Returns the number of decimal digits in abs(n) (1 for zero)."""
+    n = abs(_require_integral(n))
+    if n < 10:
+        return 1
+    # bit_length pins the digit count down to one of two neighbours; the
+    # loops only guard against float rounding in the estimate.
+    count = int((n.bit_length() - 1) * log10(2)) + 1
+    while n < pow10(count - 1):
+        count -= 1
+    while n >= pow10(count):
+        count += 1
+    return count
+
+
+def first_digit_big(n: int) -> int:
+    """Returns the first digit of an integer of any size.
+
+    Instead of dividing by 10 once per digit, this compares n against
+    c * 10**(d-1) for c = 9..1, which needs one cached power of ten and no
+    long division at all.
+    """
+    n = abs(_require_integral(n))
+    if n < 10:
+        return n
+    scale = pow10(digit_count(n) - 1)
+    digit = 9
+    while digit * scale > n:
+        digit -= 1
+    return digit
+
+
+def reverse_number_big(n: int) -> int:
+    """Returns an integer of any size with its digits reversed.
+
+    Works past sys.get_int_max_str_digits(): the digits are produced by
+    divide-and-conquer over powers of two in the decimal module, and the
+    reversed digits are turned back into an int by splitting them in half and
+    recombining with cached powers of ten.
+    """
+    n = _require_integral(n)
+    sign = -1 if n < 0 else 1
+    digits = _decimal_digits(abs(n))
+    return sign * _int_from_digits(digits[::-1])
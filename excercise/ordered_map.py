@@ -0,0 +1,262 @@
+# ordered_map.py
+#
+# A self-balancing (AVL) search tree with nodes shaped like TreeNode from
+# exercise_05.py. Hand-linked TreeNode trees can degenerate into O(n) chains;
+# OrderedMap keeps every path O(log n) by rotating nodes after each insert and
+# delete. Each node also stores the size of its subtree, which gives
+# rank/select in O(log n) too.
+#
+# AVLNode has the same value/left/right attributes as TreeNode, so code
+# written for TreeNode trees can walk it, but it does not subclass TreeNode:
+# a subclass of an unslotted class gets a __dict__ anyway, and a map can hold
+# millions of nodes.
+
+
+class AVLNode:
+    """A tree node whose value is the key, plus the mapped data and AVL bookkeeping."""
+
+    __slots__ = ("value", "left", "right", "data", "height", "size")
+
+    def __init__(self, key, data=None):
+        self.value = key
+        self.left = None
+        self.right = None
+        self.data = data
+        self.height = 1
+        self.size = 1
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def _update(node):
+    left, right = node.left, node.right
+    lh = left.height if left is not None else 0
+    rh = right.height if right is not None else 0
+    node.height = (lh if lh > rh else rh) + 1
+    node.size = _size(left) + _size(right) + 1
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class OrderedMap:
+    """Sorted key -> data map on an AVL tree.
+
+    insert, delete, find, floor, ceil, rank and select are O(log n); range
+    yields the k matching items in O(log n + k). Keys must be mutually
+    comparable with <.
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self, items=()):
+        self.root = None
+        for key, data in items:
+            self.insert(key, data)
+
+    def __len__(self):
+        return _size(self.root)
+
+    def is_empty(self):
+        return self.root is None
+
+    def _find_node(self, key):
+        node = self.root
+        while node is not None:
+            if key < node.value:
+                node = node.left
+            elif node.value < key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def __contains__(self, key):
+        return self._find_node(key) is not None
+
+    def find(self, key, default=None):
+        """Returns the data stored under key, or default if key is absent."""
+        node = self._find_node(key)
+        return default if node is None else node.data
+
+    def __getitem__(self, key):
+        node = self._find_node(key)
+        if node is None:
+            raise KeyError(key)
+        return node.data
+
+    def __setitem__(self, key, data):
+        self.insert(key, data)
+
+    def __delitem__(self, key):
+        self.delete(key)
+
+    def insert(self, key, data=None):
+        """Stores data under key, replacing any data already there."""
+        self.root = self._insert(self.root, key, data)
+
+    def _insert(self, node, key, data):
+        if node is None:
+            return AVLNode(key, data)
+        if key < node.value:
+            node.left = self._insert(node.left, key, data)
+        elif node.value < key:
+            node.right = self._insert(node.right, key, data)
+        else:
+            node.data = data
+            return node
+        return _rebalance(node)
+
+    def delete(self, key):
+        """Removes key and returns its data; raises KeyError if absent."""
+        removed = []
+        self.root = self._delete(self.root, key, removed)
+        return removed[0]
+
+    def _delete(self, node, key, removed):
+        if node is None:
+            raise KeyError(key)
+        if key < node.value:
+            node.left = self._delete(node.left, key, removed)
+        elif node.value < key:
+            node.right = self._delete(node.right, key, removed)
+        else:
+            removed.append(node.data)
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # Replace the node with its in-order successor.
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.right = self._delete_min(node.right)
+            successor.left, successor.right = node.left, node.right
+            node = successor
+        return _rebalance(node)
+
+    def _delete_min(self, node):
+        if node.left is None:
+            return node.right
+        node.left = self._delete_min(node.left)
+        return _rebalance(node)
+
+    def floor(self, key):
+        """Returns the largest key <= key, or None if there is none."""
+        node, best = self.root, None
+        while node is not None:
+            if key < node.value:
+                node = node.left
+            else:
+                best = node.value
+                if not node.value < key:
+                    break
+                node = node.right
+        return best
+
+    def ceil(self, key):
+        """Returns the smallest key >= key, or None if there is none."""
+        node, best = self.root, None
+        while node is not None:
+            if node.value < key:
+                node = node.right
+            else:
+                best = node.value
+                if not key < node.value:
+                    break
+                node = node.left
+        return best
+
+    def rank(self, key):
+        """Returns the number of keys strictly less than key."""
+        node, count = self.root, 0
+        while node is not None:
+            if key < node.value:
+                node = node.left
+            elif node.value < key:
+                count += _size(node.left) + 1
+                node = node.right
+            else:
+                return count + _size(node.left)
+        return count
+
+    def select(self, index):
+        """Returns the key at position index in sorted order (0 is the smallest)."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index > left_size:
+                index -= left_size + 1
+                node = node.right
+            else:
+                return node.value
+
+    def range(self, lo=None, hi=None):
+        """Yields (key, data) pairs with lo <= key < hi in sorted order.
+
+        Either bound may be None to leave that side open. Subtrees entirely
+        outside the bounds are never visited.
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                if lo is not None and node.value < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+                continue
+            node = stack.pop()
+            if hi is not None and not node.value < hi:
+                return
+            yield node.value, node.data
+            node = node.right
+
+    def items(self):
+        return self.range()
+
+    def __iter__(self):
+        for key, _ in self.range():
+            yield key
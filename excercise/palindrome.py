@@ -0,0 +1,95 @@
+# palindrome.py
+#
+# is_palindrome (exercises/exercise_08_string_manipulation.py) ignores case
+# and non-alphanumeric characters, so "A man a plan a canal Panama" counts.
+# The simple way builds a cleaned, lowercased copy and compares it with its
+# reverse - fine for a sentence, not for a multi-GB file.
+#
+# For bytes-like input (bytes, bytearray, memoryview, mmap) the check walks
+# inward from both ends instead: it takes a block from the front or the back,
+# cleans it with one bytes.translate call (lowercase, delete everything that
+# is not an ASCII letter or digit) and compares it against what is pending
+# from the other end. It always reads from the end that is behind, so no more
+# than about one block per end is held at a time, and it stops at the first
+# mismatch. Binary input follows ASCII rules: other bytes are skipped.
+#
+# str input follows Unicode rules (str.isalnum, str.lower), with the bytes
+# route as a fast path for ASCII strings.
+
+import mmap
+import string
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+_ALNUM = (string.ascii_letters + string.digits).encode()
+_NOT_ALNUM = bytes(b for b in range(256) if b not in _ALNUM)
+_LOWER = bytes.maketrans(string.ascii_uppercase.encode(), string.ascii_lowercase.encode())
+
+
+def _clean(data):
+    return data.translate(_LOWER, _NOT_ALNUM)
+
+
+def _is_palindrome_text(text):
+    if text.isascii():
+        cleaned = _clean(text.encode("ascii"))
+    else:
+        cleaned = "".join(char for char in text if char.isalnum()).lower()
+    return cleaned == cleaned[::-1]
+
+
+def _is_palindrome_buffer(buffer, block_size):
+    front_pos, back_pos = 0, len(buffer)
+    front = bytearray()   # cleaned bytes from the front, not compared yet
+    back = bytearray()    # cleaned bytes from the back, in reverse order
+    while front_pos < back_pos:
+        if len(front) <= len(back):
+            end = min(front_pos + block_size, back_pos)
+            front += _clean(bytes(buffer[front_pos:end]))
+            front_pos = end
+        else:
+            start = max(back_pos - block_size, front_pos)
+            back += _clean(bytes(buffer[start:back_pos]))[::-1]
+            back_pos = start
+        common = min(len(front), len(back))
+        if front[:common] != back[:common]:
+            return False
+        del front[:common], back[:common]
+    # The ends met; whatever one side still holds is the middle of the
+    # cleaned text and must read the same both ways.
+    middle = front or back
+    return middle == middle[::-1]
+
+
+def is_palindrome(text, block_size=DEFAULT_BLOCK_SIZE):
+    """Check if text (str or bytes-like) reads the same forwards and
+    backwards, ignoring case and non-alphanumeric characters."""
+    if isinstance(text, str):
+        return _is_palindrome_text(text)
+    if isinstance(text, memoryview) and (text.ndim != 1 or text.itemsize != 1):
+        text = text.cast("B")
+    return _is_palindrome_buffer(text, block_size)
+
+
+def is_palindrome_file(path, block_size=DEFAULT_BLOCK_SIZE):
+    """is_palindrome for a whole file, read through mmap (ASCII rules)."""
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return True   # an empty file cannot be mapped, and is a palindrome
+    with mapped:
+        return _is_palindrome_buffer(mapped, block_size)
+
+
+def palindromes(texts):
+    """Returns is_palindrome(text) for each of many short strings."""
+    results = []
+    append, clean = results.append, _clean
+    for text in texts:
+        if isinstance(text, str) and text.isascii():
+            cleaned = clean(text.encode("ascii"))
+            append(cleaned == cleaned[::-1])
+        else:
+            append(is_palindrome(text))
+    return results
@@ -0,0 +1,177 @@
+# persistent.py
+#
+# Immutable (persistent) versions of Stack and Queue from exercise_05.py.
+# push/pop and enqueue/dequeue return a new version and leave the old one
+# untouched; versions share all the structure they have in common, so taking
+# a snapshot is just keeping a reference - O(1) instead of a deep copy.
+#
+#   s1 = PersistentStack().push(1).push(2)
+#   item, s2 = s1.pop()       # item == 2, s1 still holds [1, 2]
+
+
+class _Cons:
+    """One cell of an immutable singly linked list."""
+
+    __slots__ = ("head", "tail")
+
+    def __init__(self, head, tail):
+        self.head = head
+        self.tail = tail
+
+
+class PersistentStack:
+    """LIFO stack where push and pop return new stacks in O(1)."""
+
+    __slots__ = ("_top", "_size")
+
+    def __init__(self, items=()):
+        top, size = None, 0
+        for item in items:
+            top, size = _Cons(item, top), size + 1
+        self._top = top
+        self._size = size
+
+    @classmethod
+    def _make(cls, top, size):
+        stack = cls.__new__(cls)
+        stack._top = top
+        stack._size = size
+        return stack
+
+    def push(self, item):
+        """Returns a new stack with item on top."""
+        return self._make(_Cons(item, self._top), self._size + 1)
+
+    def pop(self):
+        """Returns (top item, stack without it)."""
+        if self._top is None:
+            raise IndexError("pop from empty stack")
+        return self._top.head, self._make(self._top.tail, self._size - 1)
+
+    def peek(self):
+        if self._top is None:
+            raise IndexError("peek from empty stack")
+        return self._top.head
+
+    def is_empty(self):
+        return self._top is None
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        """Yields items from the top of the stack down."""
+        cell = self._top
+        while cell is not None:
+            yield cell.head
+            cell = cell.tail
+
+
+class _Lazy:
+    """A memoised suspension of a stream cell: None or (head, next _Lazy).
+
+    Forcing it runs the suspended computation once; every version of a queue
+    that shares this cell then shares the result, which is what keeps the
+    banker's queue amortised O(1) even when old versions are reused.
+    """
+
+    __slots__ = ("_thunk", "_cell")
+
+    def __init__(self, thunk=None, cell=None):
+        self._thunk = thunk
+        self._cell = cell
+
+    def force(self):
+        if self._thunk is not None:
+            self._cell = self._thunk()
+            self._thunk = None
+        return self._cell
+
+
+_EMPTY_STREAM = _Lazy()
+
+
+def _append(front, back):
+    """Lazily concatenates two streams, one cell per force."""
+
+    def step():
+        cell = front.force()
+        if cell is None:
+            return back.force()
+        head, tail = cell
+        return head, _append(tail, back)
+
+    return _Lazy(step)
+
+
+def _reversed_stream(cons):
+    """Suspends reversing a cons list into a stream (done in one go when forced)."""
+
+    def build():
+        stream, cell = _EMPTY_STREAM, cons
+        while cell is not None:
+            stream = _Lazy(cell=(cell.head, stream))
+            cell = cell.tail
+        return stream.force()
+
+    return _Lazy(build)
+
+
+class PersistentQueue:
+    """FIFO queue where enqueue and dequeue return new queues.
+
+    This is Okasaki's banker's queue: a lazy front stream and a reversed rear
+    list, rotated (front ++ reverse(rear)) whenever the rear grows longer
+    than the front. Both operations are amortised O(1).
+    """
+
+    __slots__ = ("_front", "_front_size", "_rear", "_rear_size")
+
+    def __init__(self, items=()):
+        queue = self._make(_EMPTY_STREAM, 0, None, 0)
+        for item in items:
+            queue = queue.enqueue(item)
+        self._front, self._front_size = queue._front, queue._front_size
+        self._rear, self._rear_size = queue._rear, queue._rear_size
+
+    @classmethod
+    def _make(cls, front, front_size, rear, rear_size):
+        if rear_size > front_size:
+            front = _append(front, _reversed_stream(rear))
+            front_size, rear, rear_size = front_size + rear_size, None, 0
+        queue = cls.__new__(cls)
+        queue._front, queue._front_size = front, front_size
+        queue._rear, queue._rear_size = rear, rear_size
+        return queue
+
+    def enqueue(self, item):
+        """Returns a new queue with item at the back."""
+        return self._make(self._front, self._front_size,
+                          _Cons(item, self._rear), self._rear_size + 1)
+
+    def dequeue(self):
+        """Returns (front item, queue without it)."""
+        cell = self._front.force()
+        if cell is None:
+            raise IndexError("dequeue from empty queue")
+        item, rest = cell
+        return item, self._make(rest, self._front_size - 1, self._rear, self._rear_size)
+
+    def peek(self):
+        cell = self._front.force()
+        if cell is None:
+            raise IndexError("peek from empty queue")
+        return cell[0]
+
+    def is_empty(self):
+        return self._front_size == 0
+
+    def __len__(self):
+        return self._front_size + self._rear_size
+
+    def __iter__(self):
+        """Yields items from the front of the queue to the back."""
+        queue = self
+        while not queue.is_empty():
+            item, queue = queue.dequeue()
+            yield item
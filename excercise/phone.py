@@ -0,0 +1,102 @@
+# phone.py
+#
+# One phone number normaliser for the three format_phone_number variants:
+# the exercise stub (exercises/exercise_08_string_manipulation.py), the
+# re.sub version in basics/10/10_Regular_Expressions.py and
+# PhoneNumberField.clean in django/3_Django_Forms_and_Validation.py. All
+# three turn a 10-digit number into "(XXX) XXX-XXXX"; this module does it
+# for whole columns.
+#
+# Per number:
+#   1. the common shapes ("1234567890", "123-456-7890", "(123) 456.7890")
+#      are matched by one precompiled pattern;
+#   2. anything else is reduced to its digits with a str.translate table that
+#      deletes every non-digit (and maps other Unicode digits, which
+#      str.isdigit accepts as the Django field does, to ASCII); it must then
+#      have exactly 10 digits.
+# Results are kept in an LRU cache, since contact lists repeat numbers.
+#
+# normalize_phones never raises for a bad row: it returns the formatted
+# numbers (None where a row failed) and a list of (row, value, message)
+# errors, so one bad row does not stop a 10M-row import.
+
+import re
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+
+CACHE_SIZE = 1 << 16
+LENGTH_MESSAGE = "Phone number must have 10 digits"
+MISSING_MESSAGE = "Phone number is missing"
+
+PHONE_PATTERN = re.compile(r"\s*\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})\s*", re.ASCII)
+
+
+class _DigitsOnly(dict):
+    """str.translate table keeping only digits, built lazily per character.
+
+    ASCII digits map to themselves, other characters for which str.isdigit()
+    is true map to their ASCII digit, and everything else is deleted.
+    """
+
+    def __missing__(self, code):
+        char = chr(code)
+        value = str(unicodedata.digit(char)) if char.isdigit() else None
+        self[code] = value
+        return value
+
+
+DIGITS_ONLY = _DigitsOnly()
+
+BatchResult = namedtuple("BatchResult", ["values", "errors"])
+
+
+def phone_digits(phone):
+    """Returns only the digits of phone, like ''.join(filter(str.isdigit, phone))
+    but with every digit in ASCII."""
+    return phone.translate(DIGITS_ONLY)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize(phone):
+    """Returns (formatted, None) or (None, error message)."""
+    match = PHONE_PATTERN.fullmatch(phone)
+    if match:
+        return "({}) {}-{}".format(*match.groups()), None
+    digits = phone.translate(DIGITS_ONLY)
+    if len(digits) != 10:
+        return None, LENGTH_MESSAGE
+    return "({}) {}-{}".format(digits[:3], digits[3:6], digits[6:]), None
+
+
+def format_phone_number(phone):
+    """Format a 10-digit phone number as (XXX) XXX-XXXX.
+
+    Raises ValueError if phone does not contain exactly 10 digits.
+    """
+    formatted, error = _normalize(str(phone))
+    if error:
+        raise ValueError(error)
+    return formatted
+
+
+def normalize_phones(phones):
+    """Formats a column of phone numbers without raising.
+
+    Returns BatchResult(values, errors): values[i] is the formatted number
+    or None, and errors lists (row index, original value, message) for every
+    row that could not be formatted. Non-str values such as ints are
+    converted with str(); None is reported as missing.
+    """
+    values, errors = [], []
+    append, normalize = values.append, _normalize
+    for row, phone in enumerate(phones):
+        if phone is None:
+            append(None)
+            errors.append((row, phone, MISSING_MESSAGE))
+            continue
+        formatted, error = normalize(phone if isinstance(phone, str) else str(phone))
+        append(formatted)
+        if error:
+            errors.append((row, phone, error))
+    return BatchResult(values, errors)
@@ -0,0 +1,142 @@
+# priority_queue.py
+#
+# An indexed binary min-heap to go with Stack and Queue in exercise_05.py.
+# Every pushed item gets a Handle that remembers where the item sits in the
+# heap, so update_priority and remove are O(log n) and the heap never holds
+# dead entries (unlike heapq with lazy "tombstone" deletion).
+
+
+class Handle:
+    """Returned by push(); refers to one entry of an IndexedPriorityQueue."""
+
+    __slots__ = ("item", "priority", "index")
+
+    def __init__(self, item, priority, index):
+        self.item = item
+        self.priority = priority
+        self.index = index  # position in the heap list, -1 once removed
+
+    def __repr__(self):
+        return "Handle({!r}, priority={!r})".format(self.item, self.priority)
+
+
+class IndexedPriorityQueue:
+    """Min-priority queue with O(log n) update_priority and remove."""
+
+    def __init__(self):
+        self._heap = []
+
+    @classmethod
+    def heapify(cls, pairs):
+        """Builds a queue from (item, priority) pairs in O(n).
+
+        Returns (queue, handles), with handles in the same order as pairs.
+        """
+        queue = cls()
+        handles = [Handle(item, priority, i) for i, (item, priority) in enumerate(pairs)]
+        queue._heap = list(handles)
+        for i in reversed(range(len(handles) // 2)):
+            queue._sift_down(i)
+        return queue, handles
+
+    def __len__(self):
+        return len(self._heap)
+
+    def is_empty(self):
+        return not self._heap
+
+    def push(self, item, priority):
+        """Adds item with the given priority and returns its Handle."""
+        handle = Handle(item, priority, len(self._heap))
+        self._heap.append(handle)
+        self._sift_up(handle.index)
+        return handle
+
+    def peek(self):
+        """Returns (item, priority) with the lowest priority without removing it."""
+        if not self._heap:
+            raise IndexError("peek from empty priority queue")
+        top = self._heap[0]
+        return top.item, top.priority
+
+    def pop(self):
+        """Removes and returns (item, priority) with the lowest priority."""
+        if not self._heap:
+            raise IndexError("pop from empty priority queue")
+        top = self._heap[0]
+        self._remove_at(0)
+        return top.item, top.priority
+
+    def update_priority(self, handle, priority):
+        """Changes the priority of a queued item."""
+        self._check(handle)
+        old = handle.priority
+        handle.priority = priority
+        if priority < old:
+            self._sift_up(handle.index)
+        else:
+            self._sift_down(handle.index)
+
+    def remove(self, handle):
+        """Removes a queued item and returns it."""
+        self._check(handle)
+        self._remove_at(handle.index)
+        return handle.item
+
+    def __contains__(self, handle):
+        heap = self._heap
+        return 0 <= handle.index < len(heap) and heap[handle.index] is handle
+
+    def _check(self, handle):
+        if handle not in self:
+            raise ValueError("{!r} is not in this priority queue".format(handle))
+
+    def _remove_at(self, index):
+        heap = self._heap
+        removed = heap[index]
+        last = heap.pop()
+        removed.index = -1
+        if last is not removed:
+            heap[index] = last
+            last.index = index
+            if index > 0 and last.priority < heap[(index - 1) // 2].priority:
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+
+    def _sift_up(self, index):
+        heap = self._heap
+        handle = heap[index]
+        priority = handle.priority
+        while index > 0:
+            parent_index = (index - 1) // 2
+            parent = heap[parent_index]
+            if not priority < parent.priority:
+                break
+            heap[index] = parent
+            parent.index = index
+            index = parent_index
+        heap[index] = handle
+        handle.index = index
+
+    def _sift_down(self, index):
+        heap = self._heap
+        size = len(heap)
+        handle = heap[index]
+        priority = handle.priority
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+            child = heap[child_index]
+            right_index = child_index + 1
+            if right_index < size and heap[right_index].priority < child.priority:
+                child_index = right_index
+                child = heap[right_index]
+            if not child.priority < priority:
+                break
+            heap[index] = child
+            child.index = index
+            index = child_index
+        heap[index] = handle
+        handle.index = index
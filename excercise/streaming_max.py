@@ -0,0 +1,138 @@
+# streaming_max.py
+#
+# Streaming versions of max_of_numbers (exercise_04.py). max_of_numbers(*args)
+# needs every value in one argument tuple; the functions here reduce any
+# iterable, generator or numeric file while holding only one value (or one
+# chunk, or k values for top_k) in memory.
+
+import heapq
+
+import numpy as np
+
+EMPTY_MESSAGE = "At least one number must be provided"
+DEFAULT_CHUNK_SIZE = 1 << 20  # bytes read per chunk from text files
+
+
+def max_of_iterable(iterable):
+    """Returns the maximum of the values in iterable, consuming it once."""
+    if isinstance(iterable, np.ndarray):
+        if iterable.size == 0:
+            raise ValueError(EMPTY_MESSAGE)
+        return iterable.max()
+    iterator = iter(iterable)
+    try:
+        best = next(iterator)
+    except StopIteration:
+        raise ValueError(EMPTY_MESSAGE) from None
+    for value in iterator:
+        if value > best:
+            best = value
+    return best
+
+
+def max_of_chunks(chunks):
+    """Returns the maximum over an iterable of NumPy arrays (or iterables)."""
+    best = None
+    for chunk in chunks:
+        if not isinstance(chunk, np.ndarray):
+            chunk = np.asarray(list(chunk))
+        if chunk.size == 0:
+            continue
+        chunk_max = chunk.max()
+        if best is None or chunk_max > best:
+            best = chunk_max
+    if best is None:
+        raise ValueError(EMPTY_MESSAGE)
+    return best
+
+
+def iter_file_chunks(path, dtype=np.int64, chunk_size=DEFAULT_CHUNK_SIZE, binary=False):
+    """Yields the numbers stored in a file as NumPy arrays of dtype.
+
+    Text files hold whitespace-separated numbers; a number split across two
+    reads is carried over to the next chunk. Binary files hold raw values of
+    dtype back to back, as written by ndarray.tofile().
+    """
+    dtype = np.dtype(dtype)
+    if binary:
+        count = max(chunk_size // dtype.itemsize, 1)
+        with open(path, "rb") as f:
+            while True:
+                chunk = np.fromfile(f, dtype=dtype, count=count)
+                if chunk.size == 0:
+                    return
+                yield chunk
+        return
+    with open(path, "rb") as f:
+        carry = b""
+        while True:
+            block = f.read(chunk_size)
+            if not block:
+                break
+            block = carry + block
+            # Keep a trailing partial token for the next read.
+            tokens = block.split()
+            if tokens and not block[-1:].isspace():
+                carry = tokens.pop()
+            else:
+                carry = b""
+            if tokens:
+                yield np.array(tokens).astype(dtype)
+        if carry:
+            yield np.array([carry]).astype(dtype)
+
+
+def max_of_file(path, dtype=np.int64, chunk_size=DEFAULT_CHUNK_SIZE, binary=False):
+    """Returns the maximum number stored in a text or binary file."""
+    return max_of_chunks(iter_file_chunks(path, dtype, chunk_size, binary))
+
+
+def top_k(iterable, k):
+    """Returns the k largest values of iterable, largest first.
+
+    Only k values are kept, in a min-heap whose root is the smallest of the
+    current top k, so each new value costs O(log k) at most. NumPy arrays use
+    np.partition instead of a Python loop.
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    if isinstance(iterable, np.ndarray):
+        values = iterable.ravel()
+        if values.size == 0:
+            raise ValueError(EMPTY_MESSAGE)
+        if k < values.size:
+            values = np.partition(values, values.size - k)[values.size - k:]
+        return np.sort(values)[::-1]
+    heap = []
+    for value in iterable:
+        if len(heap) < k:
+            heapq.heappush(heap, value)
+        elif value > heap[0]:
+            heapq.heapreplace(heap, value)
+    if not heap:
+        raise ValueError(EMPTY_MESSAGE)
+    return sorted(heap, reverse=True)
+
+
+def top_k_chunks(chunks, k):
+    """Returns the k largest values over an iterable of NumPy arrays, largest first."""
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    best = None
+    for chunk in chunks:
+        chunk = np.asarray(chunk).ravel()
+        if chunk.size == 0:
+            continue
+        # Only the chunk's own top k can reach the overall top k.
+        candidates = chunk if best is None else np.concatenate((best, chunk))
+        if candidates.size > k:
+            candidates = np.partition(candidates, candidates.size - k)[candidates.size - k:]
+        best = candidates
+    if best is None:
+        raise ValueError(EMPTY_MESSAGE)
+    return np.sort(best)[::-1]
+
+
+def top_k_file(path, k, dtype=np.int64, chunk_size=DEFAULT_CHUNK_SIZE, binary=False):
+    """Returns the k largest numbers stored in a text or binary file, largest first."""
+    return top_k_chunks(iter_file_chunks(path, dtype, chunk_size, binary), k)
@@ -0,0 +1,150 @@
+# tokens.py
+#
+# extract_words (exercises/exercise_08_string_manipulation.py) returns a new
+# lowercase str per word: about 50 bytes of object per token, which is most
+# of the memory when tokenizing millions of documents. tokenize() instead
+# returns a TokenSpans: two NumPy arrays with the start and end offset of each
+# word in the original buffer (4 bytes each while the buffer is under 4 GiB).
+# A word becomes a lowercase str only when it is looked up.
+#
+# A word is a maximal run of alphanumeric characters (str.isalnum), so
+# extract_words("Hello, World! How are you?") gives
+# ['hello', 'world', 'how', 'are', 'you'].
+#
+# bytes, bytearray, memoryview and mmap input is tokenized without decoding,
+# with offsets in bytes. ASCII letters and digits are word bytes, and so is
+# every byte >= 0x80, which keeps UTF-8 encoded letters such as "é" inside
+# their word (but also treats non-ASCII punctuation such as "—" as part of a
+# word). Words are decoded as UTF-8 when materialised.
+
+import mmap
+
+import numpy as np
+
+BLOCK_SIZE = 1 << 24  # bytes classified at a time, to bound temporary memory
+
+_WORD_BYTES = np.zeros(256, dtype=np.int8)
+for _byte in range(256):
+    _WORD_BYTES[_byte] = _byte >= 0x80 or chr(_byte).isalnum()
+del _byte
+
+
+def _offset_dtype(size):
+    return np.uint32 if size < 2 ** 32 else np.uint64
+
+
+def _spans_from_flags(blocks, size):
+    """Turns (offset, int8 word flags) blocks into start and end offsets."""
+    starts, ends, previous = [], [], np.zeros(1, dtype=np.int8)
+    for offset, flags in blocks:
+        # +1 where a word starts, -1 just after it ends.
+        edges = np.diff(flags, prepend=previous)
+        starts.append(np.flatnonzero(edges == 1) + offset)
+        ends.append(np.flatnonzero(edges == -1) + offset)
+        previous = flags[-1:]
+    if previous[0]:
+        ends.append(np.array([size]))
+    dtype = _offset_dtype(size)
+    return (np.concatenate(starts).astype(dtype) if starts else np.zeros(0, dtype),
+            np.concatenate(ends).astype(dtype) if ends else np.zeros(0, dtype))
+
+
+def _byte_blocks(buffer, block_size):
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    for offset in range(0, len(data), block_size):
+        yield offset, _WORD_BYTES[data[offset:offset + block_size]]
+
+
+def _char_blocks(text, block_size):
+    for offset in range(0, len(text), block_size):
+        block = text[offset:offset + block_size]
+        codes = np.frombuffer(block.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        flags = np.zeros(len(codes), dtype=np.int8)
+        ascii_ = codes < 128
+        flags[ascii_] = _WORD_BYTES[codes[ascii_]]
+        others = codes[~ascii_]
+        if len(others):
+            unique = np.unique(others)
+            words = unique[[chr(code).isalnum() for code in unique.tolist()]]
+            flags[~ascii_] = np.isin(others, words)
+        yield offset, flags
+
+
+class TokenSpans:
+    """The words of a buffer as (start, end) offsets, materialised on demand.
+
+    spans[i] is the i-th word in lowercase, spans.raw(i) as it appears in the
+    buffer (str, or bytes for binary input); iteration and slicing give
+    words lazily. starts and ends are the offset arrays.
+    """
+
+    def __init__(self, buffer, starts, ends):
+        self.buffer = buffer
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self):
+        return len(self.starts)
+
+    def raw(self, i):
+        start, end = int(self.starts[i]), int(self.ends[i])
+        return self.buffer[start:end]
+
+    def _word(self, start, end):
+        word = self.buffer[start:end]
+        if not isinstance(word, str):
+            word = bytes(word).decode("utf-8", "replace")
+        return word.lower()
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return TokenSpans(self.buffer, self.starts[i], self.ends[i])
+        return self._word(int(self.starts[i]), int(self.ends[i]))
+
+    def __iter__(self):
+        word = self._word
+        for start, end in zip(self.starts.tolist(), self.ends.tolist()):
+            yield word(start, end)
+
+    def lengths(self):
+        """Returns the length of every word (in characters, or bytes)."""
+        return self.ends - self.starts
+
+    def tolist(self):
+        return list(self)
+
+
+def tokenize(buffer, block_size=BLOCK_SIZE):
+    """Returns the TokenSpans of a str, bytes, bytearray, memoryview or mmap.
+
+    The buffer is referenced, not copied, and must not change while the
+    spans are in use.
+    """
+    if isinstance(buffer, str):
+        blocks = _char_blocks(buffer, block_size)
+    else:
+        if isinstance(buffer, memoryview) and (buffer.ndim != 1 or buffer.itemsize != 1):
+            buffer = buffer.cast("B")
+        blocks = _byte_blocks(buffer, block_size)
+    starts, ends = _spans_from_flags(blocks, len(buffer))
+    return TokenSpans(buffer, starts, ends)
+
+
+def tokenize_file(path, block_size=BLOCK_SIZE):
+    """Tokenizes a file through mmap, without reading or decoding it whole.
+
+    The returned spans keep the file mapped; close it with spans.buffer.close()
+    once done.
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file cannot be mapped.
+            return tokenize(b"", block_size)
+    return tokenize(mapped, block_size)
+
+
+def extract_words(text):
+    """Extract all words from a text, removing punctuation and converting to lowercase."""
+    return tokenize(text).tolist()
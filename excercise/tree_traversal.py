@@ -0,0 +1,204 @@
+# tree_traversal.py
+#
+# Iterative traversals and a compact binary file format for TreeNode trees
+# (exercise_05.py). The generators keep their own explicit stack or queue,
+# so a tree a million levels deep does not hit the recursion limit.
+#
+# File format (little-endian, every section padded to 8 bytes):
+#   header  magic b"TRE1", value typecode (1 byte), index typecode (1 byte),
+#           2 pad bytes, node count (uint64)
+#   values  node values in level order, as array(value typecode)
+#   left    index of each node's left child in level order, -1 for none
+#   right   the same for right children
+# load_tree() maps the file with mmap and hands out memoryviews over these
+# sections, so opening a tree costs the same whatever its size.
+
+import mmap
+import struct
+import sys
+from array import array
+from collections import deque
+
+from excercise.exercise_05 import TreeNode
+
+MAGIC = b"TRE1"
+HEADER = struct.Struct("<4sccxxQ")
+
+
+def preorder(root):
+    """Yields nodes root, left subtree, right subtree."""
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.right is not None:
+            stack.append(node.right)
+        if node.left is not None:
+            stack.append(node.left)
+
+
+def inorder(root):
+    """Yields nodes left subtree, root, right subtree."""
+    stack = []
+    node = root
+    while stack or node is not None:
+        if node is not None:
+            stack.append(node)
+            node = node.left
+        else:
+            node = stack.pop()
+            yield node
+            node = node.right
+
+
+def postorder(root):
+    """Yields nodes left subtree, right subtree, root."""
+    stack = []
+    node, last = root, None
+    while stack or node is not None:
+        if node is not None:
+            stack.append(node)
+            node = node.left
+            continue
+        top = stack[-1]
+        if top.right is not None and top.right is not last:
+            node = top.right
+        else:
+            last = stack.pop()
+            yield last
+
+
+def level_order(root):
+    """Yields nodes breadth first, left to right on each level."""
+    queue = deque([root] if root is not None else [])
+    while queue:
+        node = queue.popleft()
+        yield node
+        if node.left is not None:
+            queue.append(node.left)
+        if node.right is not None:
+            queue.append(node.right)
+
+
+def _pad(f, written):
+    f.write(b"\0" * (-written % 8))
+
+
+def save_tree(root, path, typecode="q"):
+    """Writes the tree under root to path in the binary format above.
+
+    typecode is the array typecode the node values are stored as, so values
+    must be numbers that fit it ('q' for int64, 'd' for float, ...).
+    Returns the number of nodes written.
+    """
+    values, left, right = array(typecode), array("q"), array("q")
+    # Level order again, but numbering each child as it is queued: a node's
+    # number is then exactly its position in the output arrays.
+    queue = deque([root] if root is not None else [])
+    queued = len(queue)
+    while queue:
+        node = queue.popleft()
+        values.append(node.value)
+        for child, links in ((node.left, left), (node.right, right)):
+            if child is None:
+                links.append(-1)
+            else:
+                links.append(queued)
+                queue.append(child)
+                queued += 1
+    index_typecode = "i" if len(values) < 2 ** 31 else "q"
+    if index_typecode != "q":
+        left, right = array(index_typecode, left), array(index_typecode, right)
+    if sys.byteorder != "little":
+        for section in (values, left, right):
+            section.byteswap()
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, typecode.encode(), index_typecode.encode(), len(values)))
+        for section in (values, left, right):
+            section.tofile(f)
+            _pad(f, len(section) * section.itemsize)
+    return len(values)
+
+
+class MappedTree:
+    """A tree saved by save_tree, memory-mapped read-only.
+
+    values, left and right are memoryviews indexed by level-order node
+    number; node 0 is the root and -1 means "no child". Use it as a context
+    manager, or call close(), to unmap the file.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # an empty file cannot be mapped
+                raise ValueError("{} is not a saved tree".format(path)) from None
+        self._buffer = memoryview(self._map)
+        sections = []
+        try:
+            if len(self._map) < HEADER.size:
+                raise ValueError("{} is not a saved tree".format(path))
+            magic, typecode, index_typecode, count = HEADER.unpack_from(self._map)
+            if magic != MAGIC:
+                raise ValueError("{} is not a saved tree".format(path))
+            if sys.byteorder != "little":
+                raise ValueError("saved trees can only be mapped on little-endian machines")
+            codes = (typecode.decode(), index_typecode.decode(), index_typecode.decode())
+            sizes = [count * array(code).itemsize for code in codes]
+            needed = HEADER.size + sum(size + (-size % 8) for size in sizes)
+            if len(self._map) < needed:
+                raise ValueError("{} is truncated: {} bytes, expected {}".format(
+                    path, len(self._map), needed))
+            offset = HEADER.size
+            for code, size in zip(codes, sizes):
+                sections.append(self._buffer[offset:offset + size].cast(code))
+                offset += size + (-size % 8)
+        except BaseException:
+            for view in sections:
+                view.release()
+            self._buffer.release()
+            self._map.close()
+            raise
+        self.values, self.left, self.right = sections
+
+    def __len__(self):
+        return len(self.values)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        for view in (self.values, self.left, self.right, self._buffer):
+            view.release()
+        self._map.close()
+
+    def preorder(self):
+        """Yields node numbers in pre-order without building TreeNodes."""
+        stack = [0] if len(self) else []
+        left, right = self.left, self.right
+        while stack:
+            i = stack.pop()
+            yield i
+            if right[i] >= 0:
+                stack.append(right[i])
+            if left[i] >= 0:
+                stack.append(left[i])
+
+    def to_tree(self):
+        """Rebuilds the TreeNode objects; returns the root (None if empty)."""
+        nodes = [TreeNode(value) for value in self.values]
+        for node, l, r in zip(nodes, self.left, self.right):
+            if l >= 0:
+                node.left = nodes[l]
+            if r >= 0:
+                node.right = nodes[r]
+        return nodes[0] if nodes else None
+
+
+def load_tree(path):
+    """Maps a file written by save_tree; see MappedTree."""
+    return MappedTree(path)
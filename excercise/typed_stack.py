@@ -0,0 +1,78 @@
+# typed_stack.py
+#
+# A Stack (see exercise_05.py) for fixed-size numbers. Stack keeps a list of
+# pointers to boxed Python ints (~36 bytes per small int); TypedStack keeps the
+# raw values in an array.array, 8 bytes each for the default 'q' typecode.
+
+from array import array
+
+
+class TypedStack:
+    """LIFO stack of machine numbers backed by array.array."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, typecode="q", items=()):
+        self._data = array(typecode, items)
+
+    @property
+    def typecode(self):
+        return self._data.typecode
+
+    def push(self, item):
+        self._data.append(item)
+
+    def pop(self):
+        if not self._data:
+            raise IndexError("pop from empty stack")
+        return self._data.pop()
+
+    def is_empty(self):
+        return not self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def peek(self):
+        if not self._data:
+            raise IndexError("peek from empty stack")
+        return self._data[-1]
+
+    def push_many(self, items):
+        """Pushes items in order, so the last one ends up on top.
+
+        An array or memoryview with the same typecode is copied in one block;
+        one with another typecode (say array('i') into a 'q' stack) is
+        converted first, so nothing is pushed if an item does not fit.
+        """
+        if isinstance(items, memoryview) and items.format == self._data.typecode:
+            self._data.frombytes(items.cast("B"))
+        elif isinstance(items, array) and items.typecode != self._data.typecode:
+            # array.extend() only accepts arrays of its own typecode.
+            self._data.extend(array(self._data.typecode, items))
+        else:
+            self._data.extend(items)
+
+    def pop_many(self, n):
+        """Pops n items and returns them as an array, top of the stack first.
+
+        This matches calling pop() n times, but copies one slice instead.
+        """
+        if n < 0:
+            raise ValueError("n must not be negative")
+        if n > len(self._data):
+            raise IndexError("pop_many({}) from stack of {} items".format(n, len(self._data)))
+        if n == 0:
+            return array(self._data.typecode)
+        popped = self._data[-n:]
+        del self._data[-n:]
+        popped.reverse()
+        return popped
+
+    def view(self):
+        """Returns a zero-copy memoryview of the items, bottom of the stack first.
+
+        The stack cannot grow or shrink while the view is alive (array raises
+        BufferError); call view.release() or use it in a with block.
+        """
+        return memoryview(self._data)
@@ -0,0 +1,61 @@
+import unittest
+
+from benchmarks.harness import (
+    _max_of_numbers, compare, default_cases, measure, percentile, run_suite
+)
+
+
+def report(ops_per_sec, gated=True):
+    return {"results": {"Stack.push": {"1000": {"ops_per_sec": ops_per_sec, "gated": gated,
+                                                "p50_ns": 1.0, "p99_ns": 2.0}}}}
+
+
+class TestHarness(unittest.TestCase):
+    def test_measure_reports_throughput_and_percentiles(self):
+        stats = measure(default_cases()["Stack.push"], 1000, repeat=2, block=10, min_time=0.001)
+        self.assertGreater(stats["ops_per_sec"], 0)
+        self.assertLessEqual(stats["p50_ns"], stats["p99_ns"])
+        self.assertGreaterEqual(stats["timed_ns"], 2 * 0.001 * 1e9)
+        self.assertTrue(stats["gated"])
+
+    def test_measure_does_not_gate_sizes_below_min_time(self):
+        stats = measure(default_cases()["Stack.push"], 10, repeat=2, min_time=10.0, max_rounds=3)
+        self.assertFalse(stats["gated"])
+
+    def test_max_of_numbers_call_scales_with_size(self):
+        arg_counts = []
+        setup = _max_of_numbers(lambda *numbers: arg_counts.append(len(numbers)))
+        measure(setup, 1000, repeat=1, min_time=0, max_rounds=1)
+        self.assertEqual(arg_counts[-1], 1000)
+
+    def test_run_suite_covers_every_case_and_size(self):
+        suite = run_suite(default_cases(), max_size=100, repeat=1, min_time=0.001)
+        self.assertEqual(set(suite["results"]), set(default_cases()))
+        for by_size in suite["results"].values():
+            self.assertEqual(set(by_size), {"10", "100"})
+
+    def test_compare_flags_only_drops_past_threshold(self):
+        baseline = report(1000.0)
+        self.assertEqual(compare(report(950.0), baseline, threshold=0.10), [])
+        self.assertEqual(compare(report(2000.0), baseline, threshold=0.10), [])
+        regressions = compare(report(800.0), baseline, threshold=0.10)
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0]["case"], "Stack.push")
+        self.assertAlmostEqual(regressions[0]["change"], -0.2)
+
+    def test_compare_skips_sizes_that_are_not_gated(self):
+        self.assertEqual(compare(report(1.0, gated=False), report(1000.0)), [])
+        self.assertEqual(compare(report(1.0), report(1000.0, gated=False)), [])
+
+    def test_compare_ignores_cases_missing_from_baseline(self):
+        self.assertEqual(compare(report(1.0), {"results": {}}), [])
+
+    def test_percentile(self):
+        values = list(range(100))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([7], 0.99), 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import asyncio
+import threading
+import unittest
+
+from excercise.bounded_queue import BoundedQueue
+
+
+class TestBoundedQueue(unittest.TestCase):
+    def test_fifo_like_queue(self):
+        q = BoundedQueue(4)
+        q.enqueue(1)
+        q.enqueue(2)
+        self.assertFalse(q.is_empty())
+        self.assertEqual(q.dequeue(), 1)
+        self.assertEqual(q.dequeue(), 2)
+        self.assertTrue(q.is_empty())
+        with self.assertRaises(IndexError):
+            q.dequeue(block=False)
+
+    def test_backpressure_when_full(self):
+        q = BoundedQueue(2)
+        q.enqueue("a")
+        q.enqueue("b")
+        self.assertTrue(q.is_full())
+        with self.assertRaises(IndexError):
+            q.enqueue("c", block=False)
+        with self.assertRaises(IndexError):
+            q.enqueue("c", timeout=0.01)
+
+    def test_blocked_producer_resumes_after_dequeue(self):
+        q = BoundedQueue(1)
+        q.enqueue(0)
+        producer = threading.Thread(target=q.enqueue, args=(1,))
+        producer.start()
+        self.assertEqual(q.dequeue(), 0)
+        producer.join(timeout=5)
+        self.assertFalse(producer.is_alive())
+        self.assertEqual(q.dequeue(), 1)
+
+    def test_dequeue_batch(self):
+        q = BoundedQueue(10)
+        for i in range(7):
+            q.enqueue(i)
+        self.assertEqual(q.dequeue_batch(5), [0, 1, 2, 3, 4])
+        self.assertEqual(q.dequeue_batch(5), [5, 6])
+        self.assertEqual(q.dequeue_batch(5, timeout=0.01), [])
+        self.assertEqual(q.dequeue_batch(5, timeout=0), [])
+
+    def test_threads_move_every_item_once(self):
+        q = BoundedQueue(8)
+        received = []
+
+        def produce(start):
+            for i in range(start, start + 500):
+                q.enqueue(i)
+
+        producers = [threading.Thread(target=produce, args=(k * 500,)) for k in range(4)]
+        for t in producers:
+            t.start()
+        while len(received) < 2000:
+            received.extend(q.dequeue_batch(16, timeout=5))
+        for t in producers:
+            t.join()
+        self.assertEqual(sorted(received), list(range(2000)))
+
+
+class TestBoundedQueueAsync(unittest.TestCase):
+    def test_async_producer_thread_consumer(self):
+        q = BoundedQueue(2)
+        received = []
+        consumer = threading.Thread(
+            target=lambda: received.extend(q.dequeue(timeout=5) for _ in range(50)))
+        consumer.start()
+
+        async def produce():
+            for i in range(50):
+                await q.enqueue_async(i, timeout=5)
+
+        asyncio.run(produce())
+        consumer.join(timeout=5)
+        self.assertEqual(received, list(range(50)))
+
+    def test_thread_producer_async_consumer(self):
+        q = BoundedQueue(3)
+        producer = threading.Thread(target=lambda: [q.enqueue(i) for i in range(40)])
+
+        async def consume():
+            producer.start()
+            items = []
+            while len(items) < 40:
+                items.extend(await q.dequeue_batch_async(8, timeout=5))
+            return items
+
+        self.assertEqual(asyncio.run(consume()), list(range(40)))
+        producer.join()
+
+    def test_async_timeout_raises_index_error(self):
+        q = BoundedQueue(1)
+
+        async def run():
+            with self.assertRaises(IndexError):
+                await q.dequeue_async(timeout=0.01)
+            self.assertEqual(await q.dequeue_batch_async(4, timeout=0.01), [])
+            await q.enqueue_async("x")
+            with self.assertRaises(IndexError):
+                await q.enqueue_async("y", timeout=0.01)
+            return await q.dequeue_async()
+
+        self.assertEqual(asyncio.run(run()), "x")
+
+    def test_lock_held_by_thread_does_not_block_event_loop(self):
+        q = BoundedQueue(1)
+        q.enqueue("x")
+        held, release = threading.Event(), threading.Event()
+
+        def hold_lock():
+            with q._lock:
+                held.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold_lock)
+        holder.start()
+        held.wait(5)
+
+        async def run():
+            getter = asyncio.create_task(q.dequeue_async(timeout=5))
+            ticks = 0
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+            self.assertFalse(getter.done())
+            release.set()
+            return ticks, await getter
+
+        self.assertEqual(asyncio.run(run()), (5, "x"))
+        holder.join()
+
+    def test_cancelled_waiter_passes_on_its_wake_up(self):
+        q = BoundedQueue(1)
+
+        async def run():
+            first = asyncio.create_task(q.dequeue_async())
+            second = asyncio.create_task(q.dequeue_async(timeout=5))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            await q.enqueue_async("x")
+            with self.assertRaises(asyncio.CancelledError):
+                await first
+            return await second
+
+        self.assertEqual(asyncio.run(run()), "x")
+        self.assertFalse(q._lock.locked())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+import random
+import unittest
+
+from benchmarks._exercises import add_lesson_path, load_lesson
+
+add_lesson_path(8)
+from bulk_validation import (  # noqa: E402
+    check_password_strength, check_passwords, is_valid_email, validate_emails
+)
+
+original = load_lesson(8, "8_String_Manipulation.py")
+
+
+def random_rows(count, alphabet, seed=0):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 14)))
+            for _ in range(count)]
+
+
+class TestBulkValidation(unittest.TestCase):
+    def test_emails_match_the_original(self):
+        rows = random_rows(5000, "ab@.\n-É") + [
+            "", "@", ".", "@.", ".@", "a@b.c", "a.b@c", "a@b@c.d", "a@@.b", "user@example.com",
+            "invalid-email", "line\nbreak@x.y", "é@ü.fr"]
+        expected = [original.is_valid_email(row) for row in rows]
+        self.assertEqual(validate_emails(rows), expected)
+        self.assertEqual([is_valid_email(row) for row in rows], expected)
+
+    def test_passwords_match_the_original(self):
+        rows = random_rows(5000, "aA1 !éÉ٣", seed=1) + [
+            "abc123", "Password123", "password123", "PASSWORD123", "Password", "ÉCOLEécole1"]
+        expected = [original.check_password_strength(row) for row in rows]
+        self.assertEqual(check_passwords(rows), expected)
+        self.assertEqual([check_password_strength(row) for row in rows], expected)
+
+    def test_process_pool_gives_the_same_results(self):
+        rows = random_rows(300, "ab@.", seed=2)
+        self.assertEqual(validate_emails(rows, workers=2, parallel_threshold=0, chunk_size=50),
+                         validate_emails(rows))
+        self.assertEqual(check_passwords(iter(rows), workers=2, parallel_threshold=0,
+                                         chunk_size=50), check_passwords(rows))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+from excercise.cipher import caesar_cipher, caesar_cipher_file, caesar_cipher_stream
+
+
+def reference_cipher(text, shift):
+    result = []
+    for char in text:
+        if "a" <= char <= "z":
+            result.append(chr((ord(char) - ord("a") + shift) % 26 + ord("a")))
+        elif "A" <= char <= "Z":
+            result.append(chr((ord(char) - ord("A") + shift) % 26 + ord("A")))
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+class TestCipher(unittest.TestCase):
+    text = "Hello, World! Zebra-xylophone 123 ÉCOLE naïve"
+
+    def test_docstring_examples(self):
+        self.assertEqual(caesar_cipher("hello", 3), "khoor")
+        self.assertEqual(caesar_cipher("khoor", -3), "hello")
+
+    def test_matches_per_character_loop_for_all_shifts(self):
+        for shift in range(-30, 60):
+            self.assertEqual(caesar_cipher(self.text, shift), reference_cipher(self.text, shift))
+
+    def test_bytes_input(self):
+        data = self.text.encode("utf-8")
+        for buffer in (data, bytearray(data), memoryview(data)):
+            result = caesar_cipher(buffer, 5)
+            self.assertIsInstance(result, bytes)
+            self.assertEqual(result.decode("utf-8"), reference_cipher(self.text, 5))
+
+    def test_stream(self):
+        chunks = [self.text[i:i + 4] for i in range(0, len(self.text), 4)]
+        self.assertEqual("".join(caesar_cipher_stream(chunks, 7)), reference_cipher(self.text, 7))
+        byte_chunks = [chunk.encode("utf-8") for chunk in chunks]
+        self.assertEqual(b"".join(caesar_cipher_stream(byte_chunks, 7)),
+                         reference_cipher(self.text, 7).encode("utf-8"))
+
+    def test_stream_of_memoryviews(self):
+        data = self.text.encode("utf-8")
+        view = memoryview(bytearray(data))
+        chunks = [view[i:i + 5] for i in range(0, len(data), 5)]
+        self.assertEqual(b"".join(caesar_cipher_stream(chunks, 3)),
+                         reference_cipher(self.text, 3).encode("utf-8"))
+
+    def test_file_round_trip(self):
+        directory = tempfile.mkdtemp()
+        plain, secret, back = (os.path.join(directory, name) for name in ("p", "s", "b"))
+        data = (self.text * 50).encode("utf-8")
+        with open(plain, "wb") as f:
+            f.write(data)
+        self.assertEqual(caesar_cipher_file(plain, secret, 11, chunk_size=64), len(data))
+        caesar_cipher_file(secret, back, -11, chunk_size=100)
+        with open(secret, "rb") as f:
+            self.assertEqual(f.read().decode("utf-8"), reference_cipher(self.text * 50, 11))
+        with open(back, "rb") as f:
+            self.assertEqual(f.read(), data)
+        for path in (plain, secret, back):
+            os.remove(path)
+        os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+
+from excercise.corpus import (
+    CountMinSketch, HeavyHitters, count_letters, count_letters_file, iter_words,
+    split_offsets, word_frequency, word_frequency_file
+)
+
+
+class TestCorpus(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        vocabulary = ["w{}".format(i) for i in range(500)] + ["héllo", "Zebra"]
+        weights = [1.0 / (i + 1) for i in range(len(vocabulary))]
+        words = rng.choices(vocabulary, weights, k=20000)
+        separators = [" ", "\n", "\t ", "  \r\n", "\x1c"]
+        self.text = "".join(word + rng.choice(separators) for word in words)
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, "wb") as f:
+            f.write(self.text.encode("utf-8"))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_docstring_examples(self):
+        self.assertEqual(word_frequency("hello world hello python"),
+                         {"hello": 2, "world": 1, "python": 1})
+        self.assertEqual(count_letters("hello world"), {"vowels": 3, "consonants": 7})
+        self.assertEqual(count_letters("PYTHON"), {"vowels": 1, "consonants": 5})
+
+    def test_split_offsets_cut_at_whitespace(self):
+        offsets = split_offsets(self.path, 7)
+        self.assertEqual(offsets[0], 0)
+        self.assertEqual(offsets[-1], os.path.getsize(self.path))
+        self.assertEqual(offsets, sorted(set(offsets)))
+        data = self.text.encode("utf-8")
+        for offset in offsets[1:-1]:
+            self.assertIn(data[offset:offset + 1], b" \t\n\r\x1c")
+
+    def test_iter_words_joins_words_across_chunks(self):
+        words = [w for chunk in iter_words(self.path, chunk_size=7) for w in chunk]
+        self.assertEqual([w.decode() for w in words], self.text.split())
+
+    def test_word_frequency_file_matches_in_memory(self):
+        expected = word_frequency(self.text)
+        self.assertEqual(word_frequency_file(self.path, workers=1, chunk_size=100), expected)
+        self.assertEqual(word_frequency_file(self.path, workers=3, chunk_size=1000), expected)
+
+    def test_count_letters_file(self):
+        expected = count_letters(self.text)
+        self.assertEqual(count_letters_file(self.path, workers=1, chunk_size=64), expected)
+        self.assertEqual(count_letters_file(self.path, workers=2), expected)
+
+    def test_empty_file(self):
+        open(self.path, "w").close()
+        self.assertEqual(word_frequency_file(self.path, workers=1), {})
+        self.assertEqual(word_frequency_file(self.path, workers=1, top_n=3), [])
+        self.assertEqual(count_letters_file(self.path, workers=1), {"vowels": 0, "consonants": 0})
+
+    def test_words_decoding_to_the_same_str_are_summed(self):
+        with open(self.path, "wb") as f:
+            f.write(b"\xff \xfe ok \xff\xfe \xff ok\n")
+        self.assertEqual(word_frequency_file(self.path, workers=1),
+                         {"\ufffd": 3, "ok": 2, "\ufffd\ufffd": 1})
+        self.assertEqual(word_frequency_file(self.path, workers=1, top_n=2),
+                         [("\ufffd", 3), ("ok", 2)])
+
+    def test_count_min_sketch_never_underestimates(self):
+        sketch = CountMinSketch(width=64, depth=3)
+        counts = Counter({"w{}".format(i).encode(): i + 1 for i in range(200)})
+        sketch.add(list(counts), list(counts.values()))
+        estimates = sketch.estimate(list(counts))
+        for estimate, actual in zip(estimates, counts.values()):
+            self.assertGreaterEqual(estimate, actual)
+
+    def test_heavy_hitters_find_top_words(self):
+        exact = Counter(self.text.split()).most_common(5)
+        for workers in (1, 3):
+            top = word_frequency_file(self.path, workers=workers, top_n=5, chunk_size=4096,
+                                      sketch_width=1 << 12)
+            self.assertEqual([word for word, _ in top], [word for word, _ in exact])
+            for (_, estimate), (_, actual) in zip(top, exact):
+                self.assertGreaterEqual(estimate, actual)
+
+    def test_heavy_hitters_memory_is_bounded(self):
+        hitters = HeavyHitters(capacity=10, width=256)
+        for start in range(0, 1000, 100):
+            hitters.update(Counter({str(i).encode(): 1 for i in range(start, start + 100)}))
+            self.assertLessEqual(len(hitters.candidates), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+
+import numpy as np
+
+from excercise.digits import (
+    last_digit_batch, first_digit_batch, reverse_number_batch,
+    digit_count, first_digit_big, reverse_number_big
+)
+
+
+def scalar_first_digit(n):
+    n = abs(n)
+    while n >= 10:
+        n //= 10
+    return n
+
+
+def scalar_reverse_number(n):
+    sign = -1 if n < 0 else 1
+    return sign * int(str(abs(n))[::-1])
+
+
+class TestDigitBatches(unittest.TestCase):
+    values = [0, 7, -7, 10, 100, 100034, -12345, 999999999999999999,
+              np.iinfo(np.int64).max, np.iinfo(np.int64).min]
+
+    def test_last_digit_batch(self):
+        expected = [abs(n) % 10 for n in self.values]
+        self.assertEqual(last_digit_batch(np.array(self.values, dtype=np.int64)).tolist(), expected)
+        self.assertEqual(last_digit_batch(iter(self.values)).tolist(), expected)
+
+    def test_last_digit_batch_converts_like_int(self):
+        self.assertEqual(last_digit_batch(["12345", 3.9, True, False]).tolist(), [5, 3, 1, 0])
+        with self.assertRaises(TypeError):
+            last_digit_batch(["Hi There 123"])
+
+    def test_first_digit_batch(self):
+        expected = [scalar_first_digit(n) for n in self.values]
+        self.assertEqual(first_digit_batch(np.array(self.values, dtype=np.int64)).tolist(), expected)
+        self.assertEqual(first_digit_batch(self.values).tolist(), expected)
+        self.assertEqual(first_digit_batch(np.array([True, False])).tolist(), [1, 0])
+
+    def test_reverse_number_batch(self):
+        values = [0, 5, -456, 100, 100034, True, False]
+        expected = [scalar_reverse_number(n) for n in values]
+        self.assertEqual(reverse_number_batch(values).tolist(), expected)
+
+    def test_reverse_number_batch_past_int64(self):
+        values = np.array([1999999999999999999, -1999999999999999999, 12], dtype=np.int64)
+        expected = [scalar_reverse_number(int(n)) for n in values]
+        self.assertEqual(reverse_number_batch(values).tolist(), expected)
+
+    def test_big_python_ints_fall_back(self):
+        big = 10 ** 30 + 7
+        self.assertEqual(first_digit_batch([big, -3]).tolist(), [1, 3])
+        self.assertEqual(reverse_number_batch([big]).tolist(), [scalar_reverse_number(big)])
+        self.assertEqual(last_digit_batch([big]).tolist(), [7])
+
+    def test_rejects_non_integers(self):
+        for bad in (["12345"], [3.14], [None]):
+            with self.assertRaises(TypeError):
+                first_digit_batch(bad)
+            with self.assertRaises(TypeError):
+                reverse_number_batch(bad)
+
+
+class TestBigIntegerMode(unittest.TestCase):
+    def test_matches_scalar_functions(self):
+        for n in [0, 1, 9, 10, -456, 100, 10 ** 1200 - 1, 7 ** 3000, -(3 ** 5000), True, False]:
+            self.assertEqual(first_digit_big(n), scalar_first_digit(n))
+            self.assertEqual(reverse_number_big(n), scalar_reverse_number(n))
+            self.assertEqual(digit_count(n), len(str(abs(int(n)))))
+
+    def test_past_str_conversion_limit(self):
+        n = 3 * 10 ** 20000 + 12
+        self.assertEqual(digit_count(n), 20001)
+        self.assertEqual(first_digit_big(n), 3)
+        self.assertEqual(reverse_number_big(n), 21 * 10 ** 19999 + 3)
+
+    def test_rejects_non_integers(self):
+        with self.assertRaises(TypeError):
+            first_digit_big("12345")
+        with self.assertRaises(TypeError):
+            reverse_number_big(3.14)
+
+
+if __name__ == "__main__":
+    unittest.main()
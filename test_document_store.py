@@ -0,0 +1,103 @@
+import random
+import unittest
+
+from benchmarks._exercises import add_lesson_path
+
+add_lesson_path(7)
+from document_store import DocumentStore, SortedIndex  # noqa: E402
+
+
+def people():
+    return [
+        {"name": "Alice", "age": 20, "grade": "A"},
+        {"name": "Bob", "age": 22, "grade": "B", "nickname": None},
+        {"name": "Cara", "age": 19, "grade": "A"},
+        {"name": "Dan", "age": 25},
+    ]
+
+
+class TestDocumentStore(unittest.TestCase):
+    def make_store(self, kind=None):
+        store = DocumentStore()
+        store.insert_many(people())
+        if kind is not None:
+            store.create_index("age", kind=kind)
+            store.create_index("nickname", kind=kind)
+        return store
+
+    def test_eq_none_matches_nothing_on_every_path(self):
+        for kind in (None, "hash", "sorted"):
+            store = self.make_store(kind)
+            self.assertEqual(store.eq("nickname", None), set(), kind)
+            self.assertEqual(store.eq("age", None), set(), kind)
+            self.assertEqual(store.isin("age", [None, 20]), {0}, kind)
+
+    def test_range_bounds_agree_on_every_path(self):
+        queries = [(19, 22, True, False), (19, 22, False, True), (None, 20, True, True),
+                   (21, None, True, False), (None, None, True, False)]
+        for low, high, include_low, include_high in queries:
+            expected = self.make_store().range("age", low, high, include_low, include_high)
+            for kind in ("hash", "sorted"):
+                store = self.make_store(kind)
+                self.assertEqual(store.range("age", low, high, include_low, include_high),
+                                 expected, (kind, low, high))
+
+    def test_unorderable_value_is_rejected_and_store_unchanged(self):
+        store = self.make_store("sorted")
+        store.create_index("grade")
+        with self.assertRaises(TypeError):
+            store.insert({"name": "Eve", "age": "thirty", "grade": "C"})
+        self.assertEqual(len(store), 4)
+        self.assertEqual(store.eq("grade", "C"), set())
+        self.assertEqual(store.range("age", 20), {0, 1, 3})
+        self.assertEqual(store.insert({"name": "Eve", "age": 30}), 4)
+        self.assertEqual(store.range("age", 26), {4})
+
+    def test_unorderable_values_within_one_doc_are_rejected(self):
+        store = DocumentStore()
+        store.create_index("tags", kind="sorted")
+        with self.assertRaises(TypeError):
+            store.insert({"tags": [1, "one"]})
+        self.assertEqual(len(store), 0)
+        store.insert({"tags": [2, 1]})
+        self.assertEqual(store.eq("tags", 1), {0})
+
+    def test_create_sorted_index_rejects_unorderable_values(self):
+        store = self.make_store()
+        store.insert({"age": "old"})
+        with self.assertRaises(TypeError):
+            store.create_index("age", kind="sorted")
+        self.assertEqual(store.range("age", 20, 23), {0, 1})
+
+    def test_remove(self):
+        store = self.make_store("sorted")
+        self.assertEqual(store.remove(0)["name"], "Alice")
+        self.assertEqual(store.range("age", None, 21), {2})
+        self.assertEqual(store.eq("age", 20), set())
+
+    def test_interleaved_inserts_and_queries_match_a_scan(self):
+        rng = random.Random(1)
+        indexed, scanned = DocumentStore(), DocumentStore()
+        indexed.create_index("n", kind="sorted")
+        for step in range(600):
+            # Sometimes a single insert between queries, sometimes a batch
+            # bigger than SortedIndex.BISECT_LIMIT.
+            batch = 1 if step % 10 else SortedIndex.BISECT_LIMIT + 5
+            for _ in range(batch):
+                doc = {"n": rng.randrange(100)}
+                indexed.insert(doc)
+                scanned.insert(doc)
+            if step % 7 == 0:
+                doomed = rng.choice(sorted(indexed.all()))
+                indexed.remove(doomed)
+                scanned.remove(doomed)
+            low = rng.randrange(100)
+            high = low + rng.randrange(20)
+            self.assertEqual(indexed.range("n", low, high), scanned.range("n", low, high))
+            self.assertEqual(indexed.eq("n", low), scanned.eq("n", low))
+        index = indexed._sorted["n"]
+        self.assertEqual(index.keys, sorted(index.keys))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from benchmarks._exercises import add_lesson_path
+
+add_lesson_path(7)
+import durable_files  # noqa: E402
+from durable_files import AppendWriter, atomic_open, atomic_write  # noqa: E402
+
+
+def read(path, mode="r"):
+    with open(path, mode) as f:
+        return f.read()
+
+
+class TempDirTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.path = os.path.join(self.directory, "data.txt")
+
+
+class TestAppendWriter(TempDirTestCase):
+    def test_appends_in_order_with_one_sync_on_close(self):
+        with open(self.path, "w") as f:
+            f.write("existing\n")
+        with AppendWriter(self.path, fsync_interval=None) as writer:
+            for i in range(100):
+                writer.write("line {}\n".format(i))
+            writer.write(b"bytes\n")
+        self.assertEqual(read(self.path),
+                         "existing\n" + "".join("line {}\n".format(i) for i in range(100))
+                         + "bytes\n")
+        self.assertEqual(writer.fsyncs, 1)
+
+    def test_buffer_is_written_once_full_and_synced_once_fsync_bytes_wait(self):
+        with mock.patch.object(durable_files, "_datasync") as datasync:
+            writer = AppendWriter(self.path, buffer_size=10, fsync_bytes=30,
+                                  fsync_interval=None)
+            writer.write("12345")
+            self.assertEqual(read(self.path), "")
+            writer.write("67890")
+            self.assertEqual(read(self.path), "1234567890")
+            self.assertEqual(datasync.call_count, 0)
+            writer.write("x" * 20)
+            self.assertEqual(datasync.call_count, 1)
+            writer.flush()
+            writer.sync()
+            self.assertEqual(datasync.call_count, 1)  # nothing new to sync
+            writer.close()
+            writer.close()
+        self.assertEqual(writer.fsyncs, 1)
+        with self.assertRaises(ValueError):
+            writer.write("late")
+
+    def test_sync_writes_and_syncs_the_buffer(self):
+        with mock.patch.object(durable_files, "_datasync") as datasync:
+            with AppendWriter(self.path, fsync_interval=None) as writer:
+                writer.write("record\n")
+                writer.sync()
+                self.assertEqual(read(self.path), "record\n")
+                self.assertEqual(datasync.call_count, 1)
+        self.assertEqual(datasync.call_count, 1)
+
+    def test_background_thread_syncs_after_writes_stop(self):
+        synced = threading.Event()
+        with mock.patch.object(durable_files, "_datasync", side_effect=lambda fd: synced.set()):
+            with AppendWriter(self.path, fsync_interval=0.01) as writer:
+                writer.write("record\n")
+                self.assertTrue(synced.wait(5))
+                self.assertEqual(read(self.path), "record\n")
+
+    def test_concurrent_writers_keep_records_whole(self):
+        with AppendWriter(self.path, buffer_size=64, fsync_interval=None) as writer:
+            def append(n):
+                for i in range(500):
+                    writer.write("{}-{}\n".format(n, i))
+            threads = [threading.Thread(target=append, args=(n,)) for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        lines = read(self.path).splitlines()
+        self.assertEqual(sorted(lines),
+                         sorted("{}-{}".format(n, i) for n in range(4) for i in range(500)))
+
+
+class TestAtomicWrite(TempDirTestCase):
+    def test_replaces_contents_and_keeps_permissions(self):
+        atomic_write(self.path, "old\n")
+        os.chmod(self.path, 0o600)
+        atomic_write(self.path, "new\n")
+        self.assertEqual(read(self.path), "new\n")
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o600)
+        atomic_write(self.path, b"\x00\xff")
+        self.assertEqual(read(self.path, "rb"), b"\x00\xff")
+        self.assertEqual(os.listdir(self.directory), ["data.txt"])
+
+    def test_new_file_gets_default_permissions(self):
+        atomic_write(self.path, "hello")
+        self.assertEqual(stat.S_IMODE(os.stat(self.path).st_mode), 0o644)
+
+    def test_failure_leaves_the_old_file_and_no_temp_file(self):
+        atomic_write(self.path, "old\n")
+        with self.assertRaises(RuntimeError):
+            with atomic_open(self.path) as f:
+                f.write("half a file")
+                raise RuntimeError("crash while writing")
+        self.assertEqual(read(self.path), "old\n")
+        self.assertEqual(os.listdir(self.directory), ["data.txt"])
+
+    def test_file_is_fsynced_before_rename_and_directory_after(self):
+        events = []
+        real_fsync, real_replace = os.fsync, os.replace
+
+        def fsync(fd):
+            events.append("dir fsync" if stat.S_ISDIR(os.fstat(fd).st_mode) else "file fsync")
+            real_fsync(fd)
+
+        def replace(src, dst):
+            events.append("replace")
+            real_replace(src, dst)
+        with mock.patch("os.fsync", fsync), mock.patch("os.replace", replace):
+            atomic_write(self.path, "data")
+        self.assertEqual(events, ["file fsync", "replace", "dir fsync"])
+
+    def test_rejects_other_modes(self):
+        with self.assertRaises(ValueError):
+            with atomic_open(self.path, "a"):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
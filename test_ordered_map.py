@@ -0,0 +1,88 @@
+import bisect
+import random
+import unittest
+
+from excercise.exercise_05 import TreeNode
+from excercise.ordered_map import AVLNode, OrderedMap
+
+
+def check_balanced(node):
+    """Returns (height, size) of node, asserting the AVL and size invariants."""
+    if node is None:
+        return 0, 0
+    lh, ls = check_balanced(node.left)
+    rh, rs = check_balanced(node.right)
+    assert abs(lh - rh) <= 1
+    assert node.height == max(lh, rh) + 1
+    assert node.size == ls + rs + 1
+    return node.height, node.size
+
+
+class TestOrderedMap(unittest.TestCase):
+    def test_nodes_are_slotted_and_tree_nodes_are_not(self):
+        node = AVLNode(1, "one")
+        self.assertFalse(hasattr(node, "__dict__"))
+        self.assertEqual((node.value, node.left, node.right), (1, None, None))
+        tree_node = TreeNode(1)
+        tree_node.label = "extra attributes still work"
+        self.assertEqual(tree_node.label, "extra attributes still work")
+
+    def test_insert_find_delete(self):
+        m = OrderedMap([(5, "five"), (1, "one"), (9, "nine")])
+        self.assertEqual(len(m), 3)
+        self.assertEqual(m.find(1), "one")
+        self.assertIsNone(m.find(2))
+        m.insert(1, "uno")
+        self.assertEqual(m[1], "uno")
+        self.assertEqual(len(m), 3)
+        self.assertEqual(m.delete(5), "five")
+        self.assertNotIn(5, m)
+        with self.assertRaises(KeyError):
+            m.delete(5)
+        with self.assertRaises(KeyError):
+            m[5]
+
+    def test_sorted_inserts_stay_balanced(self):
+        m = OrderedMap()
+        for i in range(2 ** 12):
+            m.insert(i)
+        self.assertEqual(m.root.height, 13)
+        check_balanced(m.root)
+
+    def test_against_sorted_list(self):
+        rng = random.Random(42)
+        m, keys = OrderedMap(), []
+        for _ in range(3000):
+            key = rng.randrange(500)
+            if rng.random() < 0.6:
+                m[key] = -key
+                if key not in keys:
+                    bisect.insort(keys, key)
+            elif key in keys:
+                del m[key]
+                keys.remove(key)
+        check_balanced(m.root)
+        self.assertEqual(list(m), keys)
+        self.assertEqual(list(m.items()), [(k, -k) for k in keys])
+        for probe in range(-1, 502):
+            i = bisect.bisect_right(keys, probe)
+            self.assertEqual(m.floor(probe), keys[i - 1] if i else None)
+            j = bisect.bisect_left(keys, probe)
+            self.assertEqual(m.ceil(probe), keys[j] if j < len(keys) else None)
+            self.assertEqual(m.rank(probe), j)
+        for index, key in enumerate(keys):
+            self.assertEqual(m.select(index), key)
+        self.assertEqual([k for k, _ in m.range(100, 200)],
+                         [k for k in keys if 100 <= k < 200])
+        self.assertEqual([k for k, _ in m.range(hi=50)], [k for k in keys if k < 50])
+        self.assertEqual([k for k, _ in m.range(lo=450)], [k for k in keys if k >= 450])
+
+    def test_select_out_of_range(self):
+        m = OrderedMap([(1, None)])
+        self.assertEqual(m.select(-1), 1)
+        with self.assertRaises(IndexError):
+            m.select(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import random
+import tempfile
+import unittest
+
+from excercise.palindrome import is_palindrome, is_palindrome_file, palindromes
+
+
+def reference(text):
+    cleaned = "".join(char for char in text if char.isalnum()).lower()
+    return cleaned == cleaned[::-1]
+
+
+class TestPalindrome(unittest.TestCase):
+    def test_docstring_examples(self):
+        self.assertTrue(is_palindrome("racecar"))
+        self.assertTrue(is_palindrome("A man a plan a canal Panama"))
+        self.assertFalse(is_palindrome("hello"))
+
+    def test_edge_cases(self):
+        for text in ("", "!!", "a", "ab", "Ab,a", "No 'x' in Nixon", "été", "Été", "éte"):
+            self.assertEqual(is_palindrome(text), reference(text), text)
+
+    def test_bytes_walk_matches_reference_for_any_block_size(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            half = "".join(rng.choice("abAB1 ,.!") for _ in range(rng.randint(0, 12)))
+            text = half + rng.choice(["", "x", "?"]) + half[::-1].swapcase()
+            if rng.random() < 0.3:
+                text = text.replace(rng.choice("abAB1"), "z", 1)
+            data = text.encode("ascii")
+            for block_size in (1, 2, 3, 5, 64):
+                self.assertEqual(is_palindrome(data, block_size), reference(text), (text, block_size))
+            self.assertEqual(is_palindrome(memoryview(bytearray(data)), 4), reference(text))
+
+    def test_lopsided_punctuation(self):
+        text = "ab" + "." * 1000 + "b" + "," * 50 + "A"
+        self.assertTrue(is_palindrome(text.encode(), 8))
+        self.assertFalse(is_palindrome(("ab" + "." * 1000 + "c").encode(), 8))
+
+    def test_file(self):
+        fd, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"A man, a plan,\n" * 1000 + b"a canal: Panama" + b"\n" * 3)
+            self.assertFalse(is_palindrome_file(path, block_size=256))
+            with open(path, "wb") as f:
+                f.write(b"Was it a car or a cat I saw?" * 1001)
+            self.assertTrue(is_palindrome_file(path, block_size=100))
+            with open(path, "ab") as f:
+                f.write(b"x")
+            self.assertFalse(is_palindrome_file(path, block_size=100))
+            with open(path, "wb") as f:
+                f.write(b"Step on no pets! " * 2 + b"x" + b" STEP ON NO PETS" * 2)
+            self.assertTrue(is_palindrome_file(path, block_size=3))
+            open(path, "w").close()
+            self.assertTrue(is_palindrome_file(path))
+        finally:
+            os.remove(path)
+
+    def test_batch(self):
+        texts = ["racecar", "hello", "A man a plan a canal Panama", "Été", "Éta", "", b"Abba"]
+        self.assertEqual(palindromes(texts), [True, False, True, True, False, True, True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import random
+import unittest
+from collections import deque
+
+from excercise.persistent import PersistentQueue, PersistentStack
+
+
+class TestPersistentStack(unittest.TestCase):
+    def test_push_pop_return_new_versions(self):
+        empty = PersistentStack()
+        s1 = empty.push(1)
+        s2 = s1.push(2)
+        self.assertTrue(empty.is_empty())
+        self.assertFalse(s2.is_empty())
+        item, s3 = s2.pop()
+        self.assertEqual(item, 2)
+        self.assertEqual(list(s2), [2, 1])
+        self.assertEqual(list(s3), [1])
+        self.assertEqual(len(s2), 2)
+        with self.assertRaises(IndexError):
+            empty.pop()
+
+    def test_versions_share_structure(self):
+        base = PersistentStack(range(3))
+        a, b = base.push("a"), base.push("b")
+        self.assertIs(a.pop()[1]._top, b.pop()[1]._top)
+
+
+class TestPersistentQueue(unittest.TestCase):
+    def test_fifo_like_queue(self):
+        q = PersistentQueue().enqueue(1).enqueue(2)
+        self.assertFalse(q.is_empty())
+        item, q2 = q.dequeue()
+        self.assertEqual(item, 1)
+        item, q3 = q2.dequeue()
+        self.assertEqual(item, 2)
+        self.assertTrue(q3.is_empty())
+        with self.assertRaises(IndexError):
+            q3.dequeue()
+        self.assertEqual(list(q), [1, 2])
+
+    def test_old_versions_are_unchanged(self):
+        rng = random.Random(3)
+        versions = [(PersistentQueue(), deque())]
+        for _ in range(3000):
+            queue, model = versions[rng.randrange(len(versions))]
+            if model and rng.random() < 0.4:
+                item, queue = queue.dequeue()
+                model = deque(model)
+                self.assertEqual(item, model.popleft())
+            else:
+                item = rng.random()
+                queue = queue.enqueue(item)
+                model = deque(model)
+                model.append(item)
+            versions.append((queue, model))
+        for queue, model in versions[::50]:
+            self.assertEqual(len(queue), len(model))
+            self.assertEqual(list(queue), list(model))
+
+    def test_long_queue(self):
+        q = PersistentQueue(range(100000))
+        total = 0
+        while not q.is_empty():
+            item, q = q.dequeue()
+            total += item
+        self.assertEqual(total, sum(range(100000)))
+
+
+if __name__ == "__main__":
+    unittest.main()
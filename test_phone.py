@@ -0,0 +1,42 @@
+import unittest
+
+from excercise.phone import (
+    LENGTH_MESSAGE, MISSING_MESSAGE, format_phone_number, normalize_phones, phone_digits
+)
+
+
+class TestPhone(unittest.TestCase):
+    def test_docstring_examples(self):
+        for phone in ("1234567890", "123-456-7890", "123.456.7890"):
+            self.assertEqual(format_phone_number(phone), "(123) 456-7890")
+
+    def test_other_shapes_fall_back_to_digits(self):
+        for phone in ("(123) 456-7890", " 123 456 7890 ", "123/456/7890", "tel: 123-45-67-890",
+                      "１２３４５６７８９０", 1234567890):
+            self.assertEqual(format_phone_number(phone), "(123) 456-7890", phone)
+
+    def test_wrong_digit_count_raises(self):
+        for phone in ("", "12345", "123-456-78901", "+1 123 456 7890"):
+            with self.assertRaises(ValueError):
+                format_phone_number(phone)
+
+    def test_phone_digits_matches_isdigit_filter(self):
+        for value in ("(123) 456-7890", "a1b2c3", "٣٤٥ x ²", ""):
+            self.assertEqual(len(phone_digits(value)), len("".join(filter(str.isdigit, value))))
+        self.assertEqual(phone_digits("٣٤٥-²"), "3452")
+
+    def test_batch_reports_errors_per_row(self):
+        phones = ["123-456-7890", "bad", None, "123.456.7890", 9876543210, "123-456-7890"]
+        result = normalize_phones(phones)
+        self.assertEqual(result.values, ["(123) 456-7890", None, None, "(123) 456-7890",
+                                         "(987) 654-3210", "(123) 456-7890"])
+        self.assertEqual(result.errors, [(1, "bad", LENGTH_MESSAGE), (2, None, MISSING_MESSAGE)])
+
+    def test_batch_accepts_any_iterable(self):
+        result = normalize_phones(str(5550000000 + i) for i in range(3))
+        self.assertEqual(result.values, ["(555) 000-0000", "(555) 000-0001", "(555) 000-0002"])
+        self.assertEqual(result.errors, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+
+import numpy as np
+
+from benchmarks._exercises import add_lesson_path
+
+add_lesson_path(7)
+from pipeline import Pipeline, lift  # noqa: E402
+
+
+def double_numbers(iterable):
+    for i in iterable:
+        yield i + i
+
+
+def running_total(iterable):
+    total = 0
+    for i in iterable:
+        total += i
+        yield total
+
+
+def cubes(iterable):
+    for i in iterable:
+        yield i ** 3
+
+
+class TestPipeline(unittest.TestCase):
+    def test_lift_matches_the_generator(self):
+        doubled = Pipeline.range(1, 100, chunk_size=7).map(lift(double_numbers))
+        self.assertEqual(doubled.to_list(), list(double_numbers(range(1, 100))))
+        vectorized = Pipeline.range(1, 100, chunk_size=7).map(
+            lift(double_numbers, vectorize=True))
+        self.assertEqual(vectorized.to_list(), list(double_numbers(range(1, 100))))
+
+    def test_stateful_generator_keeps_state_across_chunks(self):
+        totals = Pipeline.range(1, 6, chunk_size=2).map(lift(running_total))
+        self.assertEqual(totals.to_list(), [1, 3, 6, 10, 15])
+
+    def test_generator_may_change_the_number_of_items(self):
+        def pairs(iterable):
+            for i in iterable:
+                if i % 2:
+                    yield i
+                    yield -i
+        result = Pipeline.range(6, chunk_size=4).map(lift(pairs, chunk_size=3)).to_list()
+        self.assertEqual(result, [1, -1, 3, -3, 5, -5])
+
+    def test_body_runs_once_per_item(self):
+        seen = []
+
+        def record(iterable):
+            for i in iterable:
+                seen.append(i)
+                yield i
+        Pipeline.range(10, chunk_size=3).map(lift(record)).to_list()
+        self.assertEqual(seen, list(range(10)))
+
+    def test_big_integers_stay_exact(self):
+        big = 3 * 10 ** 6
+        result = Pipeline.from_iterable([big]).map(lift(cubes)).to_list()
+        self.assertEqual(result, [27 * 10 ** 18])
+        self.assertEqual(Pipeline.from_iterable([big]).map(lift(cubes)).reduce(np.add),
+                         27 * 10 ** 18)
+
+    def test_vectorized_overflow_raises(self):
+        with self.assertRaises(OverflowError):
+            Pipeline.from_iterable([3 * 10 ** 6]).map(lift(cubes, vectorize=True)).to_list()
+
+    def test_vectorized_rejects_non_elementwise_generators(self):
+        def evens(iterable):
+            for i in iterable:
+                if i % 2 == 0:
+                    yield i
+        with self.assertRaises((ValueError, TypeError)):
+            Pipeline.range(10).map(lift(evens, vectorize=True)).to_list()
+
+    def test_pipeline_can_be_iterated_again(self):
+        doubled = Pipeline.range(1, 10, chunk_size=4).map(lift(running_total))
+        self.assertEqual(doubled.to_list(), doubled.to_list())
+        from_list = Pipeline.from_iterable([1, 2, 3]).filter(lambda a: a > 1)
+        self.assertEqual(from_list.sum(), 5)
+        self.assertEqual(from_list.sum(), 5)
+
+    def test_one_shot_source_raises_on_second_iteration(self):
+        once = Pipeline.from_iterable(iter([1, 2, 3]))
+        self.assertEqual(once.to_list(), [1, 2, 3])
+        with self.assertRaises(RuntimeError):
+            once.to_list()
+
+    def test_stages_stop_early(self):
+        pulled = []
+
+        def source():
+            for start in range(0, 10 ** 6, 10):
+                pulled.append(start)
+                yield np.arange(start, start + 10)
+        values = Pipeline(source).until(lambda a: a >= 25).to_list()
+        self.assertEqual(values, list(range(26)))
+        self.assertEqual(len(pulled), 3)
+        self.assertEqual(Pipeline.range(100).take_while(lambda a: a < 5).to_list(),
+                         [0, 1, 2, 3, 4])
+        self.assertEqual(Pipeline.range(100, chunk_size=8).take(10).to_list(), list(range(10)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+
+import numpy as np
+
+from benchmarks._exercises import add_lesson_path
+
+add_lesson_path(6)
+from human.Human import Human  # noqa: E402
+from human.sinks import ListSink  # noqa: E402
+from human.superhero.Superhero import Superhero  # noqa: E402
+from population import HumanTable, InternPool, SuperheroTable  # noqa: E402
+
+
+class TestHumanTable(unittest.TestCase):
+    def setUp(self):
+        self.sink = Human.sink = ListSink()
+
+    def tearDown(self):
+        Human.sink = None
+
+    def test_row_views_read_and_write_the_columns(self):
+        people = HumanTable(capacity=1)
+        people.extend(["Ian", "Joel", "Ian"], ages=[42, 17, 8])
+        ian = people[0]
+        self.assertEqual((ian.name, ian.age), ("Ian", 42))
+        ian.age = 43
+        people[1].name = "Jo"
+        self.assertEqual(people.ages.tolist(), [43, 17, 8])
+        self.assertEqual([row.name for row in people], ["Ian", "Jo", "Ian"])
+        self.assertEqual(people[-1].age, 8)
+        with self.assertRaises(IndexError):
+            people[3]
+
+    def test_row_views_behave_like_humans(self):
+        people = HumanTable.from_humans([Human("Ian"), Human("Joel")])
+        human, row = Human("Ian"), people[0]
+        row.say("hi")
+        human.say("hi")
+        self.assertEqual(self.sink.lines, ["Ian: hi", "Ian: hi"])
+        self.assertEqual(row.sing(), human.sing())
+        self.assertEqual(row.get_species(), Human.get_species())
+        self.assertEqual(row.grunt(), Human.grunt())
+
+    def test_row_views_have_no_dict(self):
+        people = HumanTable()
+        people.append("Ian")
+        heroes = SuperheroTable()
+        heroes.append("Tick")
+        for row in (people[0], heroes[0]):
+            self.assertFalse(hasattr(row, "__dict__"))
+            with self.assertRaises(AttributeError):
+                row.nickname = "x"
+
+    def test_names_are_interned_once(self):
+        people = HumanTable()
+        people.extend(["Ian"] * 1000 + ["Joel"])
+        self.assertEqual(len(people.names), 2)
+        pool = InternPool()
+        self.assertEqual([pool.intern(v) for v in ["a", "b", "a"]], [0, 1, 0])
+        self.assertEqual(pool[1], "b")
+
+    def test_vectorized_updates_and_filter(self):
+        people = HumanTable()
+        people.extend(["A", "B", "C", "D"], ages=[10, 20, 30, 40])
+        people.grow_older(1, mask=people.age_between(15, 35))
+        self.assertEqual(people.ages.tolist(), [10, 21, 31, 40])
+        older = people.filter(people.ages > 25)
+        self.assertEqual([row.name for row in older], ["C", "D"])
+        self.assertIs(older.names, people.names)
+        self.assertEqual([row.name for row in people.rows(np.array([3, 0]))], ["D", "A"])
+
+    def test_superhero_rows_match_superheroes(self):
+        heroes = [Superhero("Tick"), Superhero("Batman", movie=True, superpowers=["Wealthy"])]
+        table = SuperheroTable.from_humans(heroes)
+        for hero, row in zip(heroes, table):
+            self.assertEqual((row.name, row.movie, row.fictional, row.superpowers),
+                             (hero.name, hero.movie, hero.fictional, hero.superpowers))
+            self.assertEqual(row.sing(), hero.sing())
+            self.assertEqual(row.species, Superhero.species)
+        table[0].boast()
+        self.assertEqual(self.sink.lines, ["I wield the power of super strength!",
+                                           "I wield the power of bulletproofing!"])
+        self.assertEqual([row.name for row in table.filter(table.movie)], ["Batman"])
+
+
+if __name__ == "__main__":
+    unittest.main()
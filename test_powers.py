@@ -0,0 +1,58 @@
+import random
+import unittest
+
+from benchmarks._exercises import add_lesson_path
+
+add_lesson_path(6)
+from powers import BitmaskSuperhero, HeroIndex, PowerRegistry  # noqa: E402
+
+POWERS = ["flight", "Wealthy", "super strength", "telepathy", "speed"]
+
+
+class TestPowers(unittest.TestCase):
+    def test_registry_bits_and_masks(self):
+        registry = PowerRegistry()
+        self.assertEqual(registry.mask(["a", "b"]), 0b11)
+        self.assertEqual(registry.bit("b"), 1)
+        self.assertIsNone(registry.bit("c", create=False))
+        self.assertEqual(len(registry), 2)
+        self.assertEqual(registry.names(0b10), ["b"])
+
+    def test_has_powers_does_not_register_unknown_names(self):
+        tick = BitmaskSuperhero(name="Tick")
+        registered = len(tick.registry)
+        self.assertTrue(tick.has_powers("super strength", "bulletproofing"))
+        self.assertFalse(tick.has_powers("super strenght"))
+        self.assertEqual(len(tick.registry), registered)
+        self.assertEqual(tick.superpowers, ["super strength", "bulletproofing"])
+
+    def test_queries_match_a_brute_force_filter(self):
+        rng = random.Random(0)
+        index, heroes = HeroIndex(PowerRegistry()), []
+
+        def brute(all_of=(), any_of=(), none_of=()):
+            return [i for i, powers in enumerate(heroes)
+                    if all(p in powers for p in all_of)
+                    and (not any_of or any(p in powers for p in any_of))
+                    and not any(p in powers for p in none_of)]
+
+        for step in range(400):
+            powers = set(rng.sample(POWERS, rng.randint(0, 3)))
+            heroes.append(powers)
+            self.assertEqual(index.add(powers), len(heroes) - 1)
+            if step % 13 == 0:
+                hero_id = rng.randrange(len(heroes))
+                heroes[hero_id] = set(rng.sample(POWERS, 2))
+                index.update(hero_id, heroes[hero_id])
+            if step % 3 == 0:
+                all_of, any_of, none_of = (rng.sample(POWERS, rng.randint(0, 2))
+                                           for _ in range(3))
+                found = index.query(all_of, any_of, none_of)
+                self.assertEqual(index.ids(found).tolist(), brute(all_of, any_of, none_of))
+                self.assertEqual(index.count(found), len(brute(all_of, any_of, none_of)))
+        self.assertEqual(index.with_power("unknown"), 0)
+        self.assertEqual(index.count(index.everyone()), len(heroes))
+
+
+if __name__ == "__main__":
+    unittest.main()
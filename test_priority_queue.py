@@ -0,0 +1,63 @@
+import random
+import unittest
+
+from excercise.priority_queue import IndexedPriorityQueue
+
+
+def drain(queue):
+    out = []
+    while not queue.is_empty():
+        out.append(queue.pop())
+    return out
+
+
+class TestIndexedPriorityQueue(unittest.TestCase):
+    def test_pop_in_priority_order(self):
+        q = IndexedPriorityQueue()
+        q.push("c", 3)
+        q.push("a", 1)
+        q.push("b", 2)
+        self.assertFalse(q.is_empty())
+        self.assertEqual(q.peek(), ("a", 1))
+        self.assertEqual(drain(q), [("a", 1), ("b", 2), ("c", 3)])
+        with self.assertRaises(IndexError):
+            q.pop()
+
+    def test_update_priority_and_remove(self):
+        q = IndexedPriorityQueue()
+        handles = {name: q.push(name, p) for name, p in [("a", 5), ("b", 6), ("c", 7), ("d", 8)]}
+        q.update_priority(handles["d"], 1)
+        q.update_priority(handles["a"], 10)
+        self.assertEqual(q.remove(handles["b"]), "b")
+        self.assertEqual(len(q), 3)
+        self.assertEqual(drain(q), [("d", 1), ("c", 7), ("a", 10)])
+        with self.assertRaises(ValueError):
+            q.remove(handles["a"])
+        with self.assertRaises(ValueError):
+            q.update_priority(handles["a"], 0)
+
+    def test_heapify(self):
+        pairs = [(i, p) for i, p in enumerate([9, 4, 7, 1, 8, 2])]
+        q, handles = IndexedPriorityQueue.heapify(pairs)
+        self.assertEqual(handles[3].item, 3)
+        q.update_priority(handles[0], 0)
+        self.assertEqual([item for item, _ in drain(q)], [0, 3, 5, 1, 2, 4])
+
+    def test_random_operations_against_sorting(self):
+        rng = random.Random(7)
+        q = IndexedPriorityQueue()
+        live = {}
+        for i in range(2000):
+            live[i] = q.push(i, rng.random())
+            if live and rng.random() < 0.3:
+                victim = rng.choice(list(live))
+                q.remove(live.pop(victim))
+            if live and rng.random() < 0.3:
+                key = rng.choice(list(live))
+                q.update_priority(live[key], rng.random())
+        expected = sorted((h.priority, h.item) for h in live.values())
+        self.assertEqual([(p, item) for item, p in drain(q)], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
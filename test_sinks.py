@@ -0,0 +1,110 @@
+import io
+import os
+import subprocess
+import sys
+import unittest
+
+from benchmarks._exercises import BASICS_DIR, add_lesson_path
+
+add_lesson_path(6)
+from human.Human import Human  # noqa: E402
+from human.sinks import BufferedSink, ListSink, NullSink, write_lines  # noqa: E402
+from human.superhero.Superhero import Superhero  # noqa: E402
+from slotted import SlottedSuperhero  # noqa: E402
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+class WriteOnlySink:
+    def __init__(self):
+        self.lines = []
+
+    def write(self, line):
+        self.lines.append(line)
+
+
+class TestBufferedSink(unittest.TestCase):
+    def test_lines_wait_for_flush(self):
+        stream = CountingStream()
+        sink = BufferedSink(stream)
+        sink.write("a")
+        sink.write_many(["b", "c"])
+        self.assertEqual(stream.getvalue(), "")
+        sink.flush()
+        self.assertEqual(stream.getvalue(), "a\nb\nc\n")
+        self.assertEqual(stream.writes, 1)
+        sink.flush()
+        self.assertEqual(stream.writes, 1)
+        sink.close()
+
+    def test_batch_is_written_once_max_chars_is_reached(self):
+        stream = CountingStream()
+        sink = BufferedSink(stream, max_chars=11)
+        for word in ["1234", "5678"]:
+            sink.write(word)
+        self.assertEqual(stream.getvalue(), "")
+        sink.write("9")
+        self.assertEqual(stream.getvalue(), "1234\n5678\n9\n")
+        sink.close()
+
+    def test_close_and_with_block_flush(self):
+        stream = io.StringIO()
+        with BufferedSink(stream) as sink:
+            sink.write("inside")
+        self.assertEqual(stream.getvalue(), "inside\n")
+
+    def test_dropped_sink_is_flushed_at_exit(self):
+        code = ("from human.Human import Human\n"
+                "from human.sinks import BufferedSink\n"
+                "Human.sink = BufferedSink()\n"
+                "Human('Ian').say('bye')\n"
+                "Human.sink = None\n"
+                "import gc; gc.collect()\n")
+        result = subprocess.run([sys.executable, "-c", code], cwd=os.path.join(BASICS_DIR, "6"),
+                                capture_output=True, text=True, timeout=30)
+        self.assertEqual(result.stdout, "Ian: bye\n")
+
+
+class TestSinkProtocol(unittest.TestCase):
+    def tearDown(self):
+        Human.sink = None
+        SlottedSuperhero.sink = None
+
+    def test_boast_falls_back_to_write(self):
+        tick = Superhero("Tick")
+        tick.sink = WriteOnlySink()
+        tick.boast()
+        self.assertEqual(tick.sink.lines, ["I wield the power of super strength!",
+                                           "I wield the power of bulletproofing!"])
+        SlottedSuperhero.sink = WriteOnlySink()
+        SlottedSuperhero("Tick", superpowers=["flight"]).boast()
+        self.assertEqual(SlottedSuperhero.sink.lines, ["I wield the power of flight!"])
+
+    def test_class_and_instance_sinks(self):
+        Human.sink = ListSink()
+        ian, joel = Human("Ian"), Human("Joel")
+        joel.sink = NullSink()
+        ian.say("hi")
+        joel.say("hi")
+        self.assertEqual(Human.sink.lines, ["Ian: hi"])
+
+    def test_write_lines_without_sink_prints(self):
+        stream = io.StringIO()
+        stdout, sys.stdout = sys.stdout, stream
+        try:
+            write_lines(None, ["a", "b"])
+        finally:
+            sys.stdout = stdout
+        self.assertEqual(stream.getvalue(), "a\nb\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from benchmarks._exercises import add_lesson_path
+
+add_lesson_path(6)
+from slotted import (  # noqa: E402
+    SlottedBat, SlottedBatman, SlottedHuman, SlottedSuperhero, cached_factory
+)
+
+
+def slot_values(obj):
+    return {name: getattr(obj, name) for name in ("name", "_age", "fictional", "movie",
+                                                  "superpowers", "fly") if hasattr(obj, name)}
+
+
+class TestSlotted(unittest.TestCase):
+    def test_instances_have_no_dict(self):
+        for obj in (SlottedHuman("Ian"), SlottedSuperhero("Tick"), SlottedBat(), SlottedBatman()):
+            self.assertFalse(hasattr(obj, "__dict__"))
+
+    def test_cooperative_init_walks_the_whole_mro(self):
+        batman = SlottedBatman()
+        self.assertEqual((batman.name, batman.movie, batman.fly, batman.superpowers),
+                         ("Sad Affleck", True, False, ["Wealthy"]))
+        self.assertEqual(batman.get_species(), "Superhuman")
+        self.assertEqual(batman.sonar(), "))) ... (((")
+
+    def test_cached_factory_matches_normal_construction(self):
+        cases = [(SlottedHuman, ("Ian",), {}), (SlottedSuperhero, ("Tick",), {"movie": True}),
+                 (SlottedBat, (), {"can_fly": False}), (SlottedBatman, (), {})]
+        for cls, args, kwargs in cases:
+            built = cached_factory(cls, *args, **kwargs)()
+            self.assertIs(type(built), cls)
+            self.assertEqual(slot_values(built), slot_values(cls(*args, **kwargs)))
+
+    def test_cached_factory_is_cached_and_copies_lists(self):
+        make = cached_factory(SlottedSuperhero, "Tick")
+        self.assertIs(cached_factory(SlottedSuperhero, "Tick"), make)
+        first, second = make(), make()
+        first.superpowers.append("Gadgets")
+        self.assertEqual(second.superpowers, ["super strength", "bulletproofing"])
+        self.assertEqual(make().superpowers, ["super strength", "bulletproofing"])
+
+
+if __name__ == "__main__":
+    unittest.main()
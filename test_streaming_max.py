@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from excercise.streaming_max import (
+    max_of_iterable, max_of_chunks, max_of_file, top_k, top_k_chunks, top_k_file
+)
+
+
+class TestStreamingMax(unittest.TestCase):
+    def test_max_of_iterable(self):
+        self.assertEqual(max_of_iterable(x for x in [1, 5, 3]), 5)
+        self.assertEqual(max_of_iterable([-1, -2, -3]), -1)
+        self.assertEqual(max_of_iterable(np.array([4, 9, 2])), 9)
+
+    def test_empty_input_raises_value_error(self):
+        for empty in ([], iter(()), np.array([])):
+            with self.assertRaises(ValueError):
+                max_of_iterable(empty)
+        with self.assertRaises(ValueError):
+            max_of_chunks([np.array([]), []])
+        with self.assertRaises(ValueError):
+            top_k([], 3)
+
+    def test_mixed_types_raise_type_error(self):
+        with self.assertRaises(TypeError):
+            max_of_iterable([1, 2, "3"])
+
+    def test_top_k(self):
+        values = [5, 1, 9, 3, 7, 9]
+        self.assertEqual(top_k(iter(values), 3), [9, 9, 7])
+        self.assertEqual(top_k(values, 10), [9, 9, 7, 5, 3, 1])
+        self.assertEqual(top_k(np.array(values), 2).tolist(), [9, 9])
+        with self.assertRaises(ValueError):
+            top_k(values, 0)
+
+    def test_top_k_chunks(self):
+        chunks = [np.array([3, 8]), np.array([]), np.array([10, 1, 7])]
+        self.assertEqual(top_k_chunks(chunks, 3).tolist(), [10, 8, 7])
+
+    def test_text_file_with_small_chunks(self):
+        values = np.random.default_rng(0).integers(-10 ** 9, 10 ** 9, size=1000)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "metrics.txt")
+            with open(path, "w") as f:
+                f.write("\n".join(str(v) for v in values))  # no trailing newline
+            # A 7-byte chunk splits most numbers across two reads.
+            self.assertEqual(max_of_file(path, chunk_size=7), values.max())
+            self.assertEqual(top_k_file(path, 5, chunk_size=7).tolist(),
+                             sorted(values.tolist(), reverse=True)[:5])
+
+    def test_binary_file(self):
+        values = np.random.default_rng(1).random(5000)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "metrics.bin")
+            values.tofile(path)
+            self.assertEqual(max_of_file(path, dtype=np.float64, chunk_size=800, binary=True),
+                             values.max())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from benchmarks._exercises import add_lesson_path, load_lesson
+
+add_lesson_path(8)
+from streaming_text import clean_chunks, clean_file  # noqa: E402
+
+clean_text = load_lesson(8, "8_String_Manipulation.py").clean_text
+
+
+def split_at(text, cuts):
+    bounds = [0] + sorted(cuts) + [len(text)]
+    return [text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+class TestCleanChunks(unittest.TestCase):
+    def test_boundaries_inside_words_and_gaps(self):
+        cases = [
+            ["quick bro", "wn   fox"],        # word split across chunks
+            ["quick ", "brown fox"],          # gap ends a chunk
+            ["quick", " brown"],              # gap starts a chunk
+            ["quick", "   ", "brown"],        # all-whitespace chunk
+            ["", "  a", "", "b  ", ""],       # empty chunks
+            ["  ", "\t\n"],                   # nothing but whitespace
+            ["a", "b", "c", " ", "d"],        # one character per chunk
+        ]
+        for chunks in cases:
+            self.assertEqual("".join(clean_chunks(chunks)), clean_text("".join(chunks)), chunks)
+
+    def test_every_split_point_matches_clean_text(self):
+        text = "  This   is  a\x1c messy\n\ttext   "
+        for i in range(len(text) + 1):
+            for j in range(i, len(text) + 1):
+                chunks = split_at(text, [i, j])
+                self.assertEqual("".join(clean_chunks(chunks)), clean_text(text), chunks)
+
+    def test_random_chunking(self):
+        rng = random.Random(0)
+        alphabet = "ab \t\n"
+        for _ in range(300):
+            text = "".join(rng.choice(alphabet) for _ in range(rng.randrange(40)))
+            cuts = [rng.randrange(len(text) + 1) for _ in range(rng.randrange(6))]
+            chunks = split_at(text, cuts)
+            self.assertEqual("".join(clean_chunks(chunks)), clean_text(text), chunks)
+            as_bytes = [chunk.encode() for chunk in chunks]
+            self.assertEqual(b"".join(clean_chunks(as_bytes)), clean_text(text).encode(), chunks)
+
+    def test_bytes_treat_ascii_separators_as_whitespace(self):
+        chunks = [b"  bytes\t\tare", b"  fine\x1ctoo \n", bytearray(b"\x1fend")]
+        self.assertEqual(b"".join(clean_chunks(chunks)), b"bytes are fine too end")
+        self.assertEqual(b"".join(clean_chunks(["a b".encode()])), "a b".encode())
+
+
+class TestCleanFile(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.src = os.path.join(self.directory, "messy.txt")
+        self.dst = os.path.join(self.directory, "clean.txt")
+        with open(self.src, "w") as f:
+            for i in range(2000):
+                f.write("word{}  \n\t ".format(i))
+
+    def test_text_and_bytes_paths_match_clean_text(self):
+        with open(self.src) as f:
+            expected = clean_text(f.read())
+        for encoding in ("utf-8", None):
+            written = clean_file(self.src, self.dst, chunk_size=7, encoding=encoding)
+            with open(self.dst) as f:
+                self.assertEqual(f.read(), expected, encoding)
+            self.assertEqual(written, len(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
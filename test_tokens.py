@@ -0,0 +1,76 @@
+import mmap
+import os
+import re
+import tempfile
+import unittest
+from array import array
+
+import numpy as np
+
+from excercise.tokens import TokenSpans, extract_words, tokenize, tokenize_file
+
+
+def reference_words(text):
+    return [word.lower() for word in re.findall(r"[^\W_]+", text)]
+
+
+class TestTokens(unittest.TestCase):
+    def test_docstring_example(self):
+        self.assertEqual(extract_words("Hello, World! How are you?"),
+                         ["hello", "world", "how", "are", "you"])
+
+    def test_spans_point_into_the_original(self):
+        text = "  Hello,World!! x_y 42"
+        spans = tokenize(text)
+        self.assertIsInstance(spans, TokenSpans)
+        self.assertEqual(spans.starts.dtype, np.uint32)
+        self.assertEqual(list(zip(spans.starts.tolist(), spans.ends.tolist())),
+                         [(2, 7), (8, 13), (16, 17), (18, 19), (20, 22)])
+        self.assertEqual(spans.raw(0), "Hello")
+        self.assertEqual(spans[1], "world")
+        self.assertEqual(spans[-1], "42")
+        self.assertEqual(spans[1:3].tolist(), ["world", "x"])
+        self.assertEqual(spans.lengths().tolist(), [5, 5, 1, 1, 2])
+
+    def test_unicode_text_matches_regex_definition(self):
+        text = "Ça va? Naïve café—ÉCOLE, 東京 ok_then ½ x"
+        self.assertEqual(extract_words(text), reference_words(text))
+
+    def test_small_blocks_join_words_across_blocks(self):
+        text = "alpha beta, gamma!delta epsilon "
+        for block_size in (1, 2, 3, 7):
+            self.assertEqual(tokenize(text, block_size).tolist(), reference_words(text))
+            self.assertEqual(tokenize(text.encode(), block_size).tolist(), reference_words(text))
+
+    def test_bytes_like_inputs(self):
+        data = "Hello, Wörld! 123".encode("utf-8")
+        expected = ["hello", "wörld", "123"]
+        for buffer in (data, bytearray(data), memoryview(data)):
+            spans = tokenize(buffer)
+            self.assertEqual(spans.tolist(), expected)
+            self.assertEqual(bytes(spans.raw(1)), "Wörld".encode("utf-8"))
+        self.assertEqual(tokenize(memoryview(array("I", [0x61616161]))).tolist(), ["aaaa"])
+
+    def test_empty_and_wordless_input(self):
+        for buffer in ("", b"", " ,.! ", b"\n\t"):
+            spans = tokenize(buffer)
+            self.assertEqual(len(spans), 0)
+            self.assertEqual(spans.tolist(), [])
+
+    def test_tokenize_file_uses_mmap(self):
+        fd, path = tempfile.mkstemp()
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"The quick, brown FOX\njumps!")
+            spans = tokenize_file(path)
+            self.assertIsInstance(spans.buffer, mmap.mmap)
+            self.assertEqual(spans.tolist(), ["the", "quick", "brown", "fox", "jumps"])
+            spans.buffer.close()
+            open(path, "w").close()
+            self.assertEqual(tokenize_file(path).tolist(), [])
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from benchmarks._exercises import add_lesson_path
+
+add_lesson_path(7)
+from tracing import Tracer  # noqa: E402
+
+
+def fails_on_odd(x):
+    if x % 2:
+        raise ValueError(x)
+    return x
+
+
+class TestTracer(unittest.TestCase):
+    def test_every_call_is_counted_and_one_in_n_sampled(self):
+        tracer = Tracer(sample_every=10)
+        add = tracer.trace(lambda x, y: x + y)
+        self.assertEqual(sum(add(i, 1) for i in range(100)), 5050)
+        (stats,) = tracer.stats().values()
+        self.assertEqual(stats, {"calls": 100, "errors": 0})
+        self.assertEqual(len(tracer.drain()), 10)
+
+    def test_sample_every_is_read_at_call_time(self):
+        tracer = Tracer(sample_every=1000)
+        double = tracer.trace(lambda x: 2 * x)
+        fixed = tracer.trace(sample_every=1)(lambda x: 3 * x)
+        double(1)
+        tracer.sample_every = 1
+        for i in range(5):
+            double(i)
+            fixed(i)
+        records = tracer.drain()
+        self.assertEqual(len(records), 1 + 5 + 5)
+
+    def test_errors_are_counted_on_unsampled_calls(self):
+        tracer = Tracer(sample_every=1000)
+        traced = tracer.trace(fails_on_odd)
+        for i in range(10):
+            try:
+                traced(i)
+            except ValueError:
+                pass
+        self.assertEqual(tracer.stats()[fails_on_odd.__module__ + ".fails_on_odd"],
+                         {"calls": 10, "errors": 5})
+
+    def test_async_functions(self):
+        tracer = Tracer()
+
+        @tracer.trace
+        async def maybe_fail(x):
+            await asyncio.sleep(0)
+            return fails_on_odd(x)
+
+        async def run():
+            results = await asyncio.gather(*(maybe_fail(i) for i in range(6)),
+                                           return_exceptions=True)
+            return [isinstance(r, ValueError) for r in results]
+        self.assertEqual(asyncio.run(run()), [False, True] * 3)
+        records = tracer.drain()
+        self.assertEqual(sorted(r[5] for r in records if r[5]), ["ValueError"] * 3)
+        self.assertEqual(list(tracer.stats().values()), [{"calls": 6, "errors": 3}])
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = Tracer(enabled=False)
+        traced = tracer.trace(fails_on_odd)
+        traced(0)
+        self.assertEqual(list(tracer.stats().values()), [{"calls": 0, "errors": 0}])
+        self.assertEqual(tracer.drain(), [])
+
+    def test_overwritten_records_are_counted_as_dropped(self):
+        tracer = Tracer(capacity=8)
+        traced = tracer.trace(fails_on_odd)
+        for i in range(0, 40, 2):
+            traced(i)
+        self.assertEqual(len(tracer.drain()), 8)
+        self.assertEqual(tracer.dropped, 12)
+        traced(0)
+        self.assertEqual(len(tracer.drain()), 1)
+
+    def test_flush_writes_each_record_once_as_jsonl(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        tracer = Tracer(path, flush_interval=0.001)
+        traced = tracer.trace(fails_on_odd)
+        with tracer:
+            def call_and_flush():
+                for i in range(0, 400, 2):
+                    traced(i)
+                    if i % 20 == 0:
+                        tracer.flush()
+            threads = [threading.Thread(target=call_and_flush) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines) + tracer.dropped, 800)
+        self.assertEqual({line["error"] for line in lines}, {None})
+
+
+if __name__ == "__main__":
+    unittest.main()
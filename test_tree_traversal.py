@@ -0,0 +1,99 @@
+import os
+import sys
+import tempfile
+import unittest
+
+from excercise.exercise_05 import TreeNode
+from excercise.tree_traversal import (
+    preorder, inorder, postorder, level_order, save_tree, load_tree
+)
+
+
+def sample_tree():
+    #       1
+    #      / \
+    #     2   3
+    #    / \   \
+    #   4   5   6
+    root = TreeNode(1)
+    root.left, root.right = TreeNode(2), TreeNode(3)
+    root.left.left, root.left.right = TreeNode(4), TreeNode(5)
+    root.right.right = TreeNode(6)
+    return root
+
+
+def values(nodes):
+    return [node.value for node in nodes]
+
+
+class TestTraversals(unittest.TestCase):
+    def test_orders(self):
+        root = sample_tree()
+        self.assertEqual(values(preorder(root)), [1, 2, 4, 5, 3, 6])
+        self.assertEqual(values(inorder(root)), [4, 2, 5, 1, 3, 6])
+        self.assertEqual(values(postorder(root)), [4, 5, 2, 6, 3, 1])
+        self.assertEqual(values(level_order(root)), [1, 2, 3, 4, 5, 6])
+
+    def test_empty_tree(self):
+        for walk in (preorder, inorder, postorder, level_order):
+            self.assertEqual(list(walk(None)), [])
+
+    def test_deeper_than_recursion_limit(self):
+        depth = sys.getrecursionlimit() * 3
+        root = node = TreeNode(0)
+        for i in range(1, depth):
+            node.left = TreeNode(i)
+            node = node.left
+        self.assertEqual(sum(1 for _ in postorder(root)), depth)
+        self.assertEqual(next(inorder(root)).value, depth - 1)
+
+
+class TestBinaryFormat(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "tree.bin")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        self.assertEqual(save_tree(sample_tree(), self.path), 6)
+        with load_tree(self.path) as mapped:
+            self.assertEqual(len(mapped), 6)
+            self.assertEqual(mapped.values.tolist(), [1, 2, 3, 4, 5, 6])
+            self.assertEqual(mapped.left.tolist(), [1, 3, -1, -1, -1, -1])
+            self.assertEqual(mapped.right.tolist(), [2, 4, 5, -1, -1, -1])
+            self.assertEqual([mapped.values[i] for i in mapped.preorder()], [1, 2, 4, 5, 3, 6])
+            root = mapped.to_tree()
+        self.assertEqual(values(inorder(root)), [4, 2, 5, 1, 3, 6])
+
+    def test_float_values_and_empty_tree(self):
+        root = TreeNode(0.5)
+        root.right = TreeNode(2.25)
+        save_tree(root, self.path, typecode="d")
+        with load_tree(self.path) as mapped:
+            self.assertEqual(mapped.values.tolist(), [0.5, 2.25])
+        save_tree(None, self.path)
+        with load_tree(self.path) as mapped:
+            self.assertEqual(len(mapped), 0)
+            self.assertIsNone(mapped.to_tree())
+
+    def test_rejects_other_files(self):
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 32)
+        with self.assertRaises(ValueError):
+            load_tree(self.path)
+
+    def test_rejects_short_and_truncated_files(self):
+        save_tree(sample_tree(), self.path)
+        with open(self.path, "rb") as f:
+            data = f.read()
+        for length in (0, 3, 15, len(data) - 1):
+            with open(self.path, "wb") as f:
+                f.write(data[:length])
+            with self.assertRaises(ValueError, msg=length):
+                load_tree(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
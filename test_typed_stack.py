@@ -0,0 +1,65 @@
+import unittest
+from array import array
+
+from excercise.typed_stack import TypedStack
+
+
+class TestTypedStack(unittest.TestCase):
+    def test_push_pop_like_stack(self):
+        s = TypedStack()
+        s.push(1)
+        s.push(2)
+        self.assertFalse(s.is_empty())
+        self.assertEqual(s.pop(), 2)
+        self.assertEqual(s.pop(), 1)
+        self.assertTrue(s.is_empty())
+        with self.assertRaises(IndexError):
+            s.pop()
+
+    def test_rejects_non_numbers(self):
+        with self.assertRaises(TypeError):
+            TypedStack().push("frame")
+
+    def test_push_many_and_pop_many(self):
+        s = TypedStack()
+        s.push_many([1, 2, 3])
+        s.push_many(array("q", [4, 5]))
+        self.assertEqual(len(s), 5)
+        self.assertEqual(s.pop_many(2).tolist(), [5, 4])
+        self.assertEqual(s.pop_many(0).tolist(), [])
+        self.assertEqual(s.pop(), 3)
+        with self.assertRaises(IndexError):
+            s.pop_many(3)
+        self.assertEqual(len(s), 2)
+
+    def test_push_many_converts_other_typecodes(self):
+        s = TypedStack("q", [1])
+        s.push_many(array("i", [2, 3]))
+        s.push_many(memoryview(array("h", [4])))
+        self.assertEqual(s.pop_many(4).tolist(), [4, 3, 2, 1])
+        small = TypedStack("b")
+        with self.assertRaises(OverflowError):
+            small.push_many(array("q", [1, 1000]))
+        with self.assertRaises(TypeError):
+            small.push_many(array("d", [1.5]))
+        self.assertTrue(small.is_empty())
+
+    def test_view_is_zero_copy(self):
+        s = TypedStack("i", [1, 2, 3])
+        with s.view() as view:
+            self.assertEqual(view.tolist(), [1, 2, 3])
+            with self.assertRaises(BufferError):
+                s.push(4)
+            other = TypedStack("i")
+            other.push_many(view)
+        self.assertEqual(other.pop_many(3).tolist(), [3, 2, 1])
+        s.push(4)
+        self.assertEqual(s.peek(), 4)
+
+    def test_has_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            TypedStack().extra = 1
+
+
+if __name__ == "__main__":
+    unittest.main()